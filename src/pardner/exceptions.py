@@ -1,3 +1,7 @@
+from typing import Any, Optional
+
+from requests import HTTPError
+
 from pardner.verticals import Vertical
 
 
@@ -26,3 +30,32 @@ class UnsupportedVerticalException(Exception):
 class UnsupportedRequestException(Exception):
     def __init__(self, service_name: str, message: str):
         super().__init__(f'Cannot fetch data from {service_name}: {message}')
+
+
+class RetriesExhaustedException(HTTPError):
+    """
+    Raised when a request kept failing with transient errors (e.g., a 502 or a 429)
+    and was retried as many times as allowed. Carries what a scheduler needs to requeue
+    the work: the number of ``attempts`` made, the ``status_code`` of the last response
+    (``None`` if no response was received) and ``retry_after``, the number of seconds
+    the service asked to wait before trying again, if it did.
+    """
+
+    def __init__(
+        self,
+        service_name: str,
+        attempts: int,
+        status_code: Optional[int] = None,
+        retry_after: Optional[float] = None,
+        response: Any = None,
+    ) -> None:
+        self.service_name = service_name
+        self.attempts = attempts
+        self.status_code = status_code
+        self.retry_after = retry_after
+        reason = f'status {status_code}' if status_code else 'no response'
+        super().__init__(
+            f'Cannot fetch data from {service_name}: gave up after {attempts} '
+            f'attempt(s), last attempt failed with {reason}.',
+            response=response,
+        )
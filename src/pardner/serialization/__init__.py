@@ -0,0 +1,7 @@
+from pardner.serialization.msgpack_codec import decode_vertical as decode_vertical
+from pardner.serialization.msgpack_codec import decode_verticals as decode_verticals
+from pardner.serialization.msgpack_codec import encode_vertical as encode_vertical
+from pardner.serialization.msgpack_codec import encode_verticals as encode_verticals
+from pardner.serialization.ndjson import NDJSONWriter as NDJSONWriter
+from pardner.serialization.ndjson import iter_ndjson as iter_ndjson
+from pardner.serialization.parquet import ParquetSink as ParquetSink
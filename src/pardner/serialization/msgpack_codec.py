@@ -0,0 +1,363 @@
+import gc
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Iterable, Iterator, Optional, cast
+
+from pydantic import AnyUrl, BaseModel
+
+from pardner.serialization.utils import (
+    Converter,
+    ModelMapping,
+    can_set_model_fields,
+    construct_model,
+    convert_items,
+    map_annotation,
+    set_model_fields,
+)
+from pardner.verticals import (
+    BaseVertical,
+    BlockedUserVertical,
+    ChatBotVertical,
+    ConversationDirectVertical,
+    ConversationGroupVertical,
+    ConversationVertical,
+    LazyVertical,
+    MessageVertical,
+    PhysicalActivityVertical,
+    SocialPostingVertical,
+    get_vertical_class,
+)
+from pardner.verticals.sub_verticals import AssociatedMediaSubVertical
+
+try:
+    import msgpack  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover
+    msgpack = None  # type: ignore[assignment]
+
+# the fields of all verticals, except ``vertical_name``, which is encoded once per
+# object
+_VERTICAL_FIELDS = (
+    'pardner_object_id',
+    'service_object_id',
+    'creator_user_id',
+    'data_owner_id',
+    'service',
+    'created_at',
+    'url',
+)
+_CONVERSATION_FIELDS = (
+    *_VERTICAL_FIELDS,
+    'is_group_conversation',
+    'abstract',
+    'associated_media',
+    'is_private',
+    'member_user_ids',
+    'members_count',
+    'messages_count',
+    'title',
+)
+_SOCIAL_POSTING_FIELDS = (
+    *_VERTICAL_FIELDS,
+    'abstract',
+    'associated_media',
+    'interaction_count',
+    'keywords',
+    'shared_content',
+    'status',
+    'text',
+    'title',
+)
+
+# The order in which the fields of each model are encoded. Layouts are append-only:
+# a field added to a model is appended to the layout of that model (and of its
+# subclasses), never inserted, and the shared tuples above are never changed, so
+# that objects encoded before stay decodable. Fields removed from a model keep
+# their place in the layouts.
+LAYOUTS: dict[type[BaseModel], tuple[str, ...]] = {
+    AssociatedMediaSubVertical: ('media_type', 'url'),
+    BlockedUserVertical: (*_VERTICAL_FIELDS, 'blocked_user_id'),
+    ChatBotVertical: (*_VERTICAL_FIELDS, 'name'),
+    ConversationVertical: _CONVERSATION_FIELDS,
+    ConversationDirectVertical: _CONVERSATION_FIELDS,
+    ConversationGroupVertical: _CONVERSATION_FIELDS,
+    MessageVertical: (
+        *_VERTICAL_FIELDS,
+        'parent_conversation',
+        'associated_media',
+        'text',
+    ),
+    PhysicalActivityVertical: (
+        *_SOCIAL_POSTING_FIELDS,
+        'activity_type',
+        'distance',
+        'elevation_high',
+        'elevation_low',
+        'kilocalories',
+        'max_speed',
+        'start_datetime',
+        'start_latitude',
+        'start_longitude',
+        'end_datetime',
+        'end_latitude',
+        'end_longitude',
+    ),
+    SocialPostingVertical: _SOCIAL_POSTING_FIELDS,
+}
+
+
+# the MessagePack extension type of timestamps without a timezone, which msgpack's
+# timestamps (in UTC) can't hold
+NAIVE_DATETIME_EXT_TYPE = 1
+
+
+def _encode_datetime(value: datetime) -> Any:
+    if value.tzinfo:
+        return value
+    return msgpack.ExtType(NAIVE_DATETIME_EXT_TYPE, value.isoformat().encode())
+
+
+def _decode_ext(code: int, data: bytes) -> Any:
+    if code == NAIVE_DATETIME_EXT_TYPE:
+        return datetime.fromisoformat(data.decode())
+    return msgpack.ExtType(code, data)
+
+
+def _field_converters(
+    annotation: Any,
+) -> Optional[tuple[Converter, Optional[Converter]]]:
+    """
+    :returns: the function converting values of a field with the type annotation
+    ``annotation`` to values msgpack can encode, and the function converting them
+    back (or ``None`` if msgpack decodes them as is); or ``None`` if the values are
+    encoded as is. URLs are decoded as strings, as with ``trusted_parsing``.
+    """
+    return map_annotation(annotation, _type_converters, _list_converters)
+
+
+def _list_converters(
+    item_converters: Optional[tuple[Converter, Optional[Converter]]],
+) -> Optional[tuple[Converter, Optional[Converter]]]:
+    if item_converters is None:
+        return None
+    encode_item, decode_item = item_converters
+    return (
+        lambda value: [encode_item(item) for item in value],
+        convert_items(decode_item),
+    )
+
+
+def _type_converters(
+    annotation: Any,
+) -> Optional[tuple[Converter, Optional[Converter]]]:
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            layout = _Layout.get(annotation)
+            return layout.encode, layout.decode
+        if issubclass(annotation, datetime):
+            return _encode_datetime, None
+        if issubclass(annotation, AnyUrl):
+            return str, None
+    return None
+
+
+class _Layout(ModelMapping):
+    """Encodes the objects of a model as lists of the values of its fields."""
+
+    def __init__(self, model: type[BaseModel]) -> None:
+        if model not in LAYOUTS:
+            raise TypeError(f'{model.__name__} has no layout')
+        super().__init__(model)
+        self.field_names = LAYOUTS[model]
+        self.version = len(self.field_names)
+        # verticals' ``vertical_name`` isn't encoded, but is put back where the model
+        # has it, so that the fields are in the same order as in other objects
+        self.vertical_name: Optional[str] = None
+        self.vertical_name_index = 0
+        self.dict_field_names = self.field_names
+        if issubclass(model, BaseVertical):
+            self.vertical_name = model.model_fields['vertical_name'].default
+            self.vertical_name_index = list(model.model_fields).index('vertical_name')
+            self.dict_field_names = (
+                *self.field_names[: self.vertical_name_index],
+                'vertical_name',
+                *self.field_names[self.vertical_name_index :],
+            )
+        missing_field_names = (
+            model.model_fields.keys() - {'vertical_name'} - set(self.field_names)
+        )
+        if missing_field_names:
+            raise TypeError(
+                f'The layout of {model.__name__} is missing: '
+                f'{", ".join(sorted(missing_field_names))}'
+            )
+        self.removed_field_names = [
+            field_name
+            for field_name in self.field_names
+            if field_name not in model.model_fields
+        ]
+        # whether rows of this version can be built without model_construct
+        self.is_complete = can_set_model_fields(model) and not self.removed_field_names
+        # by index in the rows, which start with the version
+        self.encoders: list[tuple[int, Converter]] = []
+        self.decoders: list[tuple[str, Converter]] = []
+
+    def map_fields(self) -> None:
+        for index, field_name in enumerate(self.field_names, 1):
+            field_info = self.model.model_fields.get(field_name)
+            converters = field_info and _field_converters(field_info.annotation)
+            if converters:
+                encode, decode = converters
+                self.encoders.append((index, encode))
+                if decode is not None:
+                    self.decoders.append((field_name, decode))
+
+    def encode(self, model_obj: BaseModel) -> list[Any]:
+        """:returns: the version of the layout, followed by the values."""
+        fields = model_obj.__dict__
+        row = [self.version, *map(fields.get, self.field_names)]
+        for index, encode in self.encoders:
+            value = row[index]
+            if value is not None:
+                row[index] = encode(value)
+        return row
+
+    def decode(self, row: list[Any], start: int = 0) -> Any:
+        """
+        Builds an object from a row encoded by this or another version of the
+        layout. Fields added since are set to their default, and values of fields
+        added by newer versions are dropped.
+
+        :param start: the index of the version in ``row``.
+        """
+        version = row[start]
+        values = row[start + 1 :]
+        if len(values) != version:
+            raise ValueError(
+                f'Expected {version} values for {self.model.__name__}, '
+                f'got {len(values)}'
+            )
+        if self.vertical_name is not None:
+            values.insert(self.vertical_name_index, self.vertical_name)
+        fields = dict(zip(self.dict_field_names, values))
+        for field_name, decode in self.decoders:
+            value = fields.get(field_name)
+            if value is not None:
+                fields[field_name] = decode(value)
+        if version == self.version and self.is_complete:
+            return set_model_fields(self.model, fields)
+        for field_name in self.removed_field_names:
+            fields.pop(field_name, None)
+        return construct_model(self.model, fields)
+
+
+def _require_msgpack() -> None:
+    if msgpack is None:
+        raise ImportError(
+            'The msgpack codec requires msgpack. Install it with '
+            '`pip install pardner[msgpack]`.'
+        )
+
+
+def _to_row(vertical_obj: BaseVertical | LazyVertical[Any]) -> list[Any]:
+    model_obj: BaseVertical = (
+        vertical_obj.materialize()
+        if isinstance(vertical_obj, LazyVertical)
+        else vertical_obj
+    )
+    row = _Layout.get(type(model_obj)).encode(model_obj)
+    row.insert(0, model_obj.vertical_name)
+    return row
+
+
+_vertical_layouts: dict[str, _Layout] = {}
+
+
+def _from_row(row: list[Any]) -> BaseVertical:
+    vertical_name = row[0]
+    layout = _vertical_layouts.get(vertical_name)
+    if layout is None:
+        layout = _vertical_layouts[vertical_name] = _Layout.get(
+            get_vertical_class(vertical_name)
+        )
+    return cast(BaseVertical, layout.decode(row, 1))
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """
+    Pauses the cyclic garbage collector while many objects are built at once, which
+    would otherwise trigger collections that have nothing to collect.
+    """
+    if not gc.isenabled():
+        yield
+        return
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+
+
+def encode_vertical(vertical_obj: BaseVertical | LazyVertical[Any]) -> bytes:
+    """
+    Encodes a vertical object with MessagePack, as a list of its ``vertical_name``,
+    the version of the vertical's layout and the values of its fields in the order
+    of the layout (see ``LAYOUTS``), rather than as a map of field names to values.
+    Payloads are about a fifth of the size of the object's JSON. Requires msgpack
+    (``pip install pardner[msgpack]``).
+
+    :param vertical_obj: the object, or a :class:`LazyVertical` (which is
+    materialized).
+
+    :returns: the payload, which :func:`decode_vertical` decodes.
+
+    :raises: :class:`TypeError` if the vertical has no layout.
+    :raises: :class:`ImportError` if msgpack isn't installed.
+    """
+    _require_msgpack()
+    return cast(bytes, msgpack.packb(_to_row(vertical_obj), datetime=True))
+
+
+def decode_vertical(payload: bytes) -> BaseVertical:
+    """
+    Decodes a payload encoded by :func:`encode_vertical`, by this or another version
+    of pardner, as an object of the vertical named in the payload. Payloads are
+    trusted, so the object is built without validation, like with
+    ``trusted_parsing``: URLs remain strings. Timestamps with a timezone are decoded
+    in UTC.
+
+    :raises: :class:`KeyError` if the vertical named in the payload doesn't exist.
+    :raises: :class:`ValueError` if the payload is malformed.
+    :raises: :class:`ImportError` if msgpack isn't installed.
+    """
+    _require_msgpack()
+    return _from_row(msgpack.unpackb(payload, timestamp=3, ext_hook=_decode_ext))
+
+
+def encode_verticals(
+    vertical_objs: Iterable[BaseVertical | LazyVertical[Any] | None],
+) -> bytes:
+    """
+    Encodes many vertical objects (of any verticals) as one payload, see
+    :func:`encode_vertical`. ``None`` (for objects that couldn't be parsed) is
+    skipped. Decoding many objects at once with :func:`decode_verticals` is about
+    twice as fast as validating their JSON one by one.
+    """
+    _require_msgpack()
+    with _gc_paused():
+        rows = [
+            _to_row(vertical_obj)
+            for vertical_obj in vertical_objs
+            if vertical_obj is not None
+        ]
+    return cast(bytes, msgpack.packb(rows, datetime=True))
+
+
+def decode_verticals(payload: bytes) -> list[BaseVertical]:
+    """Decodes a payload encoded by :func:`encode_verticals`."""
+    _require_msgpack()
+    with _gc_paused():
+        return [
+            _from_row(row)
+            for row in msgpack.unpackb(payload, timestamp=3, ext_hook=_decode_ext)
+        ]
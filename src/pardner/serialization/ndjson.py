@@ -0,0 +1,231 @@
+import gzip
+import io
+from datetime import datetime
+from types import TracebackType
+from typing import IO, Any, Iterable, Iterator, Literal, Optional, Self, cast
+
+from pydantic import BaseModel
+
+from pardner.serialization.utils import (
+    Converter,
+    ModelMapping,
+    construct_model,
+    convert_items,
+    map_annotation,
+)
+from pardner.services.decoding import JSONDecoder, default_json_decoder
+from pardner.verticals import BaseVertical, LazyVertical, get_vertical_class
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None  # type: ignore[assignment]
+
+Compression = Literal['gzip', 'zstd']
+BinaryFile = IO[bytes] | gzip.GzipFile
+
+
+def _infer_compression(path: str) -> Optional[Compression]:
+    if path.endswith('.gz'):
+        return 'gzip'
+    if path.endswith('.zst'):
+        return 'zstd'
+    return None
+
+
+def _require_zstandard() -> None:
+    if zstandard is None:
+        raise ImportError(
+            'zstd compression requires zstandard. Install it with '
+            '`pip install pardner[archive]`.'
+        )
+
+
+def _trusted_converter(annotation: Any) -> Optional[Converter]:
+    """
+    :returns: a function converting decoded JSON values of a field with the type
+    annotation ``annotation`` back to the values the field holds (timestamps as
+    :class:`datetime`s, nested models as models), or ``None`` if the decoded values
+    are kept as is. URLs remain strings, as with ``trusted_parsing``.
+    """
+    return map_annotation(annotation, _trusted_type_converter, convert_items)
+
+
+def _trusted_type_converter(annotation: Any) -> Optional[Converter]:
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            return _TrustedModelConverter.get(annotation)
+        if issubclass(annotation, datetime):
+            return datetime.fromisoformat
+    return None
+
+
+class _TrustedModelConverter(ModelMapping):
+    """
+    Builds a model from its decoded JSON without validating it, converting the
+    fields that need it.
+    """
+
+    def __init__(self, model: type[BaseModel]) -> None:
+        super().__init__(model)
+        self.field_converters: dict[str, Converter] = {}
+
+    def map_fields(self) -> None:
+        for field_name, field_info in self.model.model_fields.items():
+            field_converter = _trusted_converter(field_info.annotation)
+            if field_converter is not None:
+                self.field_converters[field_name] = field_converter
+
+    def __call__(self, fields: dict[str, Any]) -> Any:
+        for field_name, convert in self.field_converters.items():
+            value = fields.get(field_name)
+            if value is not None:
+                fields[field_name] = convert(value)
+        return construct_model(self.model, fields)
+
+
+class NDJSONWriter:
+    """
+    Writes a stream of vertical objects (of any verticals) to a JSON Lines file, one
+    object per line, optionally compressed with gzip or zstd (``pip install
+    pardner[archive]``). Objects are written as they come, so exports of any size
+    are written in constant memory. Read them back with :func:`iter_ndjson`.
+
+    .. code-block:: python
+
+        with NDJSONWriter('export.jsonl.zst') as writer:
+            writer.write_all(strava.iter_vertical(PhysicalActivityVertical))
+    """
+
+    compression: Optional[Compression]
+    path: str
+
+    def __init__(
+        self,
+        path: str,
+        compression: Optional[Compression] = None,
+        compression_level: Optional[int] = None,
+    ) -> None:
+        """
+        :param path: the path of the file, which is overwritten.
+        :param compression: ``'gzip'``, ``'zstd'`` or ``None``. Inferred from the
+        suffix of ``path`` (``.gz`` or ``.zst``) if not passed.
+        :param compression_level: the level of compression, or the default level of
+        ``compression`` if not passed.
+
+        :raises: :class:`ImportError` if ``compression`` is ``'zstd'`` and zstandard
+        isn't installed.
+        """
+        self.path = path
+        self.compression = compression or _infer_compression(path)
+        self._file: BinaryFile
+        if self.compression == 'gzip':
+            self._file = gzip.open(
+                path, 'wb', 6 if compression_level is None else compression_level
+            )
+        elif self.compression == 'zstd':
+            _require_zstandard()
+            self._file = zstandard.open(
+                path,
+                'wb',
+                cctx=zstandard.ZstdCompressor(
+                    level=3 if compression_level is None else compression_level
+                ),
+            )
+        else:
+            self._file = open(path, 'wb')
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def write(self, vertical_obj: BaseVertical | LazyVertical[Any] | None) -> None:
+        """
+        :param vertical_obj: the object to write, or a :class:`LazyVertical` (which
+        is materialized). ``None`` (for objects that couldn't be parsed) is skipped.
+        """
+        if vertical_obj is None:
+            return
+        model_obj: BaseVertical = (
+            vertical_obj.materialize()
+            if isinstance(vertical_obj, LazyVertical)
+            else vertical_obj
+        )
+        # objects built without validation may hold URLs as strings
+        self._file.write(model_obj.model_dump_json(warnings=False).encode())
+        self._file.write(b'\n')
+
+    def write_all(
+        self, vertical_objs: Iterable[BaseVertical | LazyVertical[Any] | None]
+    ) -> None:
+        for vertical_obj in vertical_objs:
+            self.write(vertical_obj)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def iter_ndjson(
+    path: str,
+    trusted: bool = False,
+    compression: Optional[Compression] = None,
+    json_decoder: JSONDecoder = default_json_decoder,
+) -> Iterator[BaseVertical]:
+    """
+    Reads back the vertical objects written by :class:`NDJSONWriter`, one line at a
+    time, as objects of the vertical named by their ``vertical_name``.
+
+    Lines are validated unless the file is ``trusted`` (e.g., written by this
+    process), in which case they are decoded with ``json_decoder`` and the objects
+    are built without validation, like with ``trusted_parsing``: timestamps and
+    nested objects are converted back, but URLs remain strings. That's about a third
+    faster than validating each line.
+
+    :param path: the path of the file.
+    :param trusted: whether to skip validation.
+    :param compression: ``'gzip'``, ``'zstd'`` or ``None``. Inferred from the suffix
+    of ``path`` (``.gz`` or ``.zst``) if not passed.
+    :param json_decoder: decodes trusted lines. Defaults to ``orjson`` if it's
+    installed.
+
+    :returns: an iterator over the objects. Blank lines are skipped.
+
+    :raises: :class:`KeyError` if a line's ``vertical_name`` isn't a vertical.
+    :raises: :class:`pydantic.ValidationError` if a line isn't valid, unless
+    ``trusted``.
+    """
+    compression = compression or _infer_compression(path)
+    file: BinaryFile
+    if compression == 'gzip':
+        file = gzip.open(path, 'rb')
+    elif compression == 'zstd':
+        _require_zstandard()
+        file = io.BufferedReader(
+            zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'))
+        )
+    else:
+        file = open(path, 'rb')
+
+    converters: dict[str, _TrustedModelConverter] = {}
+    with file:
+        for line in file:
+            if line.isspace():
+                continue
+            fields = json_decoder(line)
+            vertical_name = fields['vertical_name']
+            converter = converters.get(vertical_name)
+            if converter is None:
+                converter = converters[vertical_name] = _TrustedModelConverter.get(
+                    get_vertical_class(vertical_name)
+                )
+            vertical_obj = (
+                converter(fields) if trusted else converter.model.model_validate(fields)
+            )
+            yield cast(BaseVertical, vertical_obj)
@@ -0,0 +1,309 @@
+import functools
+import os
+import typing
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timezone
+from types import TracebackType
+from typing import Any, Iterable, Literal, Optional, Self
+from urllib.parse import quote
+
+from pydantic import AnyUrl, BaseModel
+from pydantic_core import to_json
+
+from pardner.serialization.utils import Converter, map_annotation
+from pardner.verticals import BaseVertical, LazyVertical
+
+try:
+    import pyarrow as pa  # type: ignore[import-untyped]
+    import pyarrow.parquet as pq  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover
+    pa = None
+    pq = None
+
+# stored in the paths of the partitions rather than in the files
+PARTITION_FIELDS = ('service', 'vertical_name')
+# the name Hive (and pyarrow) give to partitions of null values
+NULL_PARTITION = '__HIVE_DEFAULT_PARTITION__'
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _to_json(value: Any) -> Any:
+    return None if value is None else to_json(value).decode()
+
+
+def _to_str(value: Any) -> Any:
+    return None if value is None else str(value)
+
+
+def _arrow_field_type(
+    annotation: Any, models: tuple[type[BaseModel], ...] = ()
+) -> tuple[Any, Converter]:
+    """
+    Maps the type annotation of a field of a vertical to an Arrow type.
+
+    :param annotation: the type annotation.
+    :param models: the models being mapped, which contain this field. Models that
+    contain themselves (e.g., postings sharing postings) are mapped to JSON strings
+    when they're nested in themselves.
+
+    :returns: the Arrow type and a function converting the values of the field to
+    values of that type.
+    """
+    return map_annotation(
+        annotation, functools.partial(_arrow_type, models=models), _arrow_list_type
+    )
+
+
+def _arrow_list_type(item_type: tuple[Any, Converter]) -> tuple[Any, Converter]:
+    arrow_item_type, convert_item = item_type
+    if convert_item is _identity:
+        return pa.list_(arrow_item_type), _identity
+    return (
+        pa.list_(arrow_item_type),
+        lambda value: None if value is None else [convert_item(item) for item in value],
+    )
+
+
+def _arrow_type(
+    annotation: Any, models: tuple[type[BaseModel], ...]
+) -> tuple[Any, Converter]:
+    if typing.get_origin(annotation) is Literal:
+        return pa.string(), _identity
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            if annotation in models:
+                return pa.string(), _to_json
+            return _arrow_struct_type(annotation, (*models, annotation))
+        if issubclass(annotation, bool):
+            return pa.bool_(), _identity
+        if issubclass(annotation, int):
+            return pa.int64(), _identity
+        if issubclass(annotation, float):
+            return pa.float64(), _identity
+        if issubclass(annotation, str):
+            return pa.string(), _identity
+        if issubclass(annotation, datetime):
+            return pa.timestamp('us', tz='UTC'), _identity
+        if issubclass(annotation, AnyUrl):
+            return pa.string(), _to_str
+    return pa.string(), _to_json
+
+
+def _arrow_struct_type(
+    model: type[BaseModel], models: tuple[type[BaseModel], ...]
+) -> tuple[Any, Converter]:
+    field_types = {}
+    converters = {}
+    for field_name, field_info in model.model_fields.items():
+        field_types[field_name], converters[field_name] = _arrow_field_type(
+            field_info.annotation, models
+        )
+
+    def convert(value: Any) -> Any:
+        if value is None:
+            return None
+        get = value.get if isinstance(value, dict) else value.__dict__.get
+        return {
+            field_name: convert_field(get(field_name))
+            for field_name, convert_field in converters.items()
+        }
+
+    return pa.struct(list(field_types.items())), convert
+
+
+class _VerticalSchema:
+    """The Arrow schema of a vertical, and how to convert its objects to batches."""
+
+    def __init__(self, vertical: type[BaseVertical]) -> None:
+        self.field_names = [
+            field_name
+            for field_name in vertical.model_fields
+            if field_name not in PARTITION_FIELDS
+        ]
+        arrow_fields = []
+        self.converters = []
+        for field_name in self.field_names:
+            arrow_type, converter = _arrow_field_type(
+                vertical.model_fields[field_name].annotation, (vertical,)
+            )
+            arrow_fields.append(pa.field(field_name, arrow_type))
+            self.converters.append(converter)
+        self.schema = pa.schema(arrow_fields)
+
+    def to_record_batch(self, vertical_objs: list[BaseVertical]) -> Any:
+        """Builds the batch column by column."""
+        return pa.RecordBatch.from_arrays(
+            [
+                pa.array(
+                    [
+                        converter(getattr(vertical_obj, field_name))
+                        for vertical_obj in vertical_objs
+                    ],
+                    type=arrow_field.type,
+                )
+                for field_name, converter, arrow_field in zip(
+                    self.field_names, self.converters, self.schema
+                )
+            ],
+            schema=self.schema,
+        )
+
+
+class _PartitionWriter:
+    def __init__(
+        self, path: str, vertical_schema: _VerticalSchema, compression: str
+    ) -> None:
+        self.vertical_schema = vertical_schema
+        self.pending: list[BaseVertical] = []
+        self._writer = pq.ParquetWriter(
+            path, vertical_schema.schema, compression=compression
+        )
+
+    def flush(self) -> None:
+        if self.pending:
+            self._writer.write_batch(
+                self.vertical_schema.to_record_batch(self.pending),
+                row_group_size=len(self.pending),
+            )
+            self.pending = []
+
+    def close(self) -> None:
+        self.flush()
+        self._writer.close()
+
+
+class ParquetSink:
+    """
+    Writes a stream of vertical objects (of any verticals) to a Parquet dataset,
+    partitioned Hive-style by service, vertical and the date the objects were created
+    (in UTC), e.g., ``service=Strava/vertical_name=physical_activity/date=2025-01-06``.
+    Nested fields are stored as list and struct columns. Requires pyarrow (``pip
+    install pardner[parquet]``).
+
+    Objects are buffered per partition and written as a row group once
+    ``row_group_size`` of them are buffered, so memory use is bounded by the row
+    groups being filled rather than the size of the export. At most
+    ``max_open_files`` partitions are written to at once; writing to another one
+    closes the least recently written to, whose next objects go to a new file.
+
+    Each vertical has its own schema, so datasets should be read one vertical at a
+    time, e.g., with ``pyarrow.dataset.dataset(path / 'service=Strava' /
+    'vertical_name=physical_activity', partitioning='hive')``.
+
+    .. code-block:: python
+
+        with ParquetSink('export') as sink:
+            sink.write_all(strava.iter_vertical(PhysicalActivityVertical))
+    """
+
+    compression: str
+    max_open_files: int
+    path: str
+    row_group_size: int
+
+    def __init__(
+        self,
+        path: str,
+        row_group_size: int = 10_000,
+        max_open_files: int = 64,
+        compression: str = 'zstd',
+    ) -> None:
+        """
+        :param path: the directory of the dataset. Created if it doesn't exist.
+        :param row_group_size: the number of objects per row group.
+        :param max_open_files: the maximum number of files written to at once.
+        :param compression: the Parquet compression codec.
+
+        :raises: :class:`ImportError` if pyarrow isn't installed.
+        """
+        if pa is None:
+            raise ImportError(
+                'Writing Parquet requires pyarrow. Install it with '
+                '`pip install pardner[parquet]`.'
+            )
+        self.path = path
+        self.row_group_size = row_group_size
+        self.max_open_files = max_open_files
+        self.compression = compression
+        self._schemas: dict[type[BaseVertical], _VerticalSchema] = {}
+        self._writers: OrderedDict[tuple[str, ...], _PartitionWriter] = OrderedDict()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def _partition(self, vertical_obj: BaseVertical) -> tuple[str, ...]:
+        created_at = vertical_obj.created_at
+        if created_at is None:
+            created_date = NULL_PARTITION
+        else:
+            if created_at.tzinfo:
+                created_at = created_at.astimezone(timezone.utc)
+            created_date = created_at.date().isoformat()
+        return (
+            f'service={quote(vertical_obj.service, safe="")}',
+            f'vertical_name={quote(vertical_obj.vertical_name, safe="")}',
+            f'date={created_date}',
+        )
+
+    def _get_writer(self, vertical_obj: BaseVertical) -> _PartitionWriter:
+        partition = self._partition(vertical_obj)
+        writer = self._writers.get(partition)
+        if writer is not None:
+            self._writers.move_to_end(partition)
+            return writer
+
+        if len(self._writers) >= self.max_open_files:
+            _, least_recent_writer = self._writers.popitem(last=False)
+            least_recent_writer.close()
+        vertical = type(vertical_obj)
+        if vertical not in self._schemas:
+            self._schemas[vertical] = _VerticalSchema(vertical)
+        directory = os.path.join(self.path, *partition)
+        os.makedirs(directory, exist_ok=True)
+        writer = self._writers[partition] = _PartitionWriter(
+            os.path.join(directory, f'part-{uuid.uuid4().hex}.parquet'),
+            self._schemas[vertical],
+            self.compression,
+        )
+        return writer
+
+    def write(self, vertical_obj: BaseVertical | LazyVertical[Any] | None) -> None:
+        """
+        :param vertical_obj: the object to write, or a :class:`LazyVertical` (which
+        is materialized). ``None`` (for objects that couldn't be parsed) is skipped.
+        """
+        if vertical_obj is None:
+            return
+        model_obj: BaseVertical = (
+            vertical_obj.materialize()
+            if isinstance(vertical_obj, LazyVertical)
+            else vertical_obj
+        )
+        writer = self._get_writer(model_obj)
+        writer.pending.append(model_obj)
+        if len(writer.pending) >= self.row_group_size:
+            writer.flush()
+
+    def write_all(
+        self, vertical_objs: Iterable[BaseVertical | LazyVertical[Any] | None]
+    ) -> None:
+        for vertical_obj in vertical_objs:
+            self.write(vertical_obj)
+
+    def close(self) -> None:
+        """Writes the objects still buffered and closes the files."""
+        while self._writers:
+            _, writer = self._writers.popitem(last=False)
+            writer.close()
@@ -0,0 +1,86 @@
+import functools
+from abc import ABC, abstractmethod
+from typing import Any, ClassVar, Optional, Self, TypeVar, cast
+
+from pydantic import BaseModel
+
+from pardner.verticals.utils import Converter as Converter
+from pardner.verticals.utils import convert_items as convert_items
+from pardner.verticals.utils import map_annotation as map_annotation
+
+Model = TypeVar('Model', bound=BaseModel)
+
+_object_setattr = object.__setattr__
+
+
+@functools.cache
+def _settable_field_names(model: type[BaseModel]) -> Optional[frozenset[str]]:
+    """
+    :returns: the names of the fields of ``model``, or ``None`` if its objects can't
+    be built by setting their fields directly (e.g., it has private attributes).
+    """
+    if model.__private_attributes__ or model.__pydantic_post_init__:
+        return None
+    return frozenset(model.model_fields)
+
+
+def construct_model(model: type[Model], fields: dict[str, Any]) -> Model:
+    """
+    Builds ``model`` from ``fields`` without validating them, like
+    :meth:`BaseModel.model_construct`, but without its per-field overhead when
+    ``fields`` has every field of the model and nothing else, as the objects read
+    back from serialized verticals do. ``fields`` is used as the ``__dict__`` of the
+    object, so mustn't be reused.
+    """
+    if fields.keys() != _settable_field_names(model):
+        return model.model_construct(**fields)
+    return set_model_fields(model, fields)
+
+
+def can_set_model_fields(model: type[BaseModel]) -> bool:
+    """:returns: whether :func:`set_model_fields` can build objects of ``model``."""
+    return _settable_field_names(model) is not None
+
+
+def set_model_fields(model: type[Model], fields: dict[str, Any]) -> Model:
+    """
+    Builds ``model`` with ``fields`` as its ``__dict__``, which must have every field
+    of the model and nothing else. See :func:`construct_model`.
+    """
+    model_obj = model.__new__(model)
+    _object_setattr(model_obj, '__dict__', fields)
+    _object_setattr(model_obj, '__pydantic_fields_set__', set(fields))
+    _object_setattr(model_obj, '__pydantic_extra__', None)
+    _object_setattr(model_obj, '__pydantic_private__', None)
+    return model_obj
+
+
+class ModelMapping(ABC):
+    """
+    A mapping of the fields of a model (e.g., how to convert them), built once per
+    model and subclass, with :meth:`get`.
+    """
+
+    _mappings: ClassVar[dict[type[BaseModel], Any]]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._mappings = {}
+
+    def __init__(self, model: type[BaseModel]) -> None:
+        self.model = model
+
+    @classmethod
+    def get(cls, model: type[BaseModel]) -> Self:
+        """:returns: the mapping of ``model``, building it the first time."""
+        mapping = cls._mappings.get(model)
+        if mapping is None:
+            # registered before its fields are mapped, for models that contain
+            # themselves (e.g., postings sharing postings)
+            mapping = cls._mappings[model] = cls(model)
+            mapping.map_fields()
+        return cast(Self, mapping)
+
+    @abstractmethod
+    def map_fields(self) -> None:
+        """Maps the fields of ``model``, which may map other models with :meth:`get`."""
@@ -1,3 +1,7 @@
+from pardner.services.archive import RawResponseArchive as RawResponseArchive
+from pardner.services.async_base import (
+    AsyncBaseTransferService as AsyncBaseTransferService,
+)
 from pardner.services.base import BaseTransferService as BaseTransferService
 from pardner.services.base import (
     InsufficientScopeException as InsufficientScopeException,
@@ -5,6 +9,29 @@ from pardner.services.base import (
 from pardner.services.base import (
     UnsupportedVerticalException as UnsupportedVerticalException,
 )
+from pardner.services.bloom import ScalableBloomFilter as ScalableBloomFilter
+from pardner.services.cache import HTTPCache as HTTPCache
+from pardner.services.cache import InMemoryCacheBackend as InMemoryCacheBackend
+from pardner.services.cache import SQLiteCacheBackend as SQLiteCacheBackend
+from pardner.services.dedup import BloomDedupIndex as BloomDedupIndex
+from pardner.services.dedup import InMemoryDedupIndex as InMemoryDedupIndex
+from pardner.services.dedup import SQLiteDedupIndex as SQLiteDedupIndex
+from pardner.services.groupme import (
+    AsyncGroupMeTransferService as AsyncGroupMeTransferService,
+)
 from pardner.services.groupme import GroupMeTransferService as GroupMeTransferService
+from pardner.services.parallel import ParseExecutor as ParseExecutor
+from pardner.services.pool import TransferServicePool as TransferServicePool
+from pardner.services.retention import RawSpill as RawSpill
+from pardner.services.retention import SpilledRaw as SpilledRaw
+from pardner.services.strava import (
+    AsyncStravaTransferService as AsyncStravaTransferService,
+)
 from pardner.services.strava import StravaTransferService as StravaTransferService
+from pardner.services.sync import InMemoryCheckpointStore as InMemoryCheckpointStore
+from pardner.services.sync import SQLiteCheckpointStore as SQLiteCheckpointStore
+from pardner.services.transport import SharedTransport as SharedTransport
+from pardner.services.tumblr import (
+    AsyncTumblrTransferService as AsyncTumblrTransferService,
+)
 from pardner.services.tumblr import TumblrTransferService as TumblrTransferService
@@ -0,0 +1,290 @@
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Iterator, NamedTuple, Optional
+
+from pardner.verticals import Vertical
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from pardner.services.base import BaseTransferService
+
+
+class ArchivedResponse(NamedTuple):
+    """A raw response stored in a :class:`RawResponseArchive`."""
+
+    service: str
+    endpoint: str
+    cursor: str
+    fetched_at: float
+    content: bytes
+
+
+class RawResponseArchive:
+    """
+    Thread-safe, on-disk storage for the raw responses of services, backed by a
+    SQLite database, so that they can be audited and parsed again without making any
+    requests. Responses are keyed by service, endpoint, cursor (the parameters of the
+    request for the page) and the time they were fetched.
+
+    Raw responses of one endpoint are small, similar JSON documents, so they're
+    compressed with zstd using a dictionary trained on that endpoint's responses.
+    Until ``training_sample_count`` responses of an endpoint have been stored, they're
+    compressed without a dictionary; the dictionary is then trained on them, and they
+    are compressed again with it. Requires ``zstandard`` (``pip install
+    pardner[archive]``).
+    """
+
+    _BATCH_SIZE = 100
+    compression_level: int
+    dictionary_size: int
+    training_sample_count: int
+
+    def __init__(
+        self,
+        path: str,
+        compression_level: int = 3,
+        dictionary_size: int = 110 * 1024,
+        training_sample_count: int = 256,
+    ) -> None:
+        """
+        :param path: the path of the database file. Created if it doesn't exist.
+        :param compression_level: the zstd compression level.
+        :param dictionary_size: the maximum size of the dictionaries, in bytes.
+        :param training_sample_count: the number of responses of an endpoint that are
+        stored before training its dictionary.
+
+        :raises: :class:`ImportError` if ``zstandard`` isn't installed.
+        """
+        if zstandard is None:
+            raise ImportError(
+                'Archiving raw responses requires zstandard. Install it with '
+                '`pip install pardner[archive]`.'
+            )
+        self.compression_level = compression_level
+        self.dictionary_size = dictionary_size
+        self.training_sample_count = training_sample_count
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        # keyed by dictionary ID, or None for responses compressed without one
+        self._compressors: dict[Optional[int], zstandard.ZstdCompressor] = {}
+        self._decompressors: dict[Optional[int], zstandard.ZstdDecompressor] = {}
+        with self._lock, self._connection:
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS dictionaries ('
+                'id INTEGER PRIMARY KEY, service TEXT, endpoint TEXT, data BLOB)'
+            )
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS responses ('
+                'service TEXT, endpoint TEXT, cursor TEXT, fetched_at REAL, '
+                'dictionary_id INTEGER, content BLOB, '
+                'PRIMARY KEY (service, endpoint, cursor, fetched_at))'
+            )
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def _get_dictionary(
+        self, dictionary_id: Optional[int]
+    ) -> Optional['zstandard.ZstdCompressionDict']:
+        if dictionary_id is None:
+            return None
+        (data,) = self._connection.execute(
+            'SELECT data FROM dictionaries WHERE id = ?', (dictionary_id,)
+        ).fetchone()
+        return zstandard.ZstdCompressionDict(data)
+
+    def _latest_dictionary_id(self, service: str, endpoint: str) -> Optional[int]:
+        row = self._connection.execute(
+            'SELECT MAX(id) FROM dictionaries WHERE service = ? AND endpoint = ?',
+            (service, endpoint),
+        ).fetchone()
+        return row[0] if row else None
+
+    def _compress(self, content: bytes, dictionary_id: Optional[int]) -> bytes:
+        if dictionary_id not in self._compressors:
+            self._compressors[dictionary_id] = zstandard.ZstdCompressor(
+                self.compression_level, dict_data=self._get_dictionary(dictionary_id)
+            )
+        return self._compressors[dictionary_id].compress(content)
+
+    def _decompress(self, content: bytes, dictionary_id: Optional[int]) -> bytes:
+        if dictionary_id not in self._decompressors:
+            self._decompressors[dictionary_id] = zstandard.ZstdDecompressor(
+                dict_data=self._get_dictionary(dictionary_id)
+            )
+        return self._decompressors[dictionary_id].decompress(content)
+
+    def _train_dictionary(self, service: str, endpoint: str) -> Optional[int]:
+        rows = self._connection.execute(
+            'SELECT cursor, fetched_at, content FROM responses '
+            'WHERE service = ? AND endpoint = ? AND dictionary_id IS NULL',
+            (service, endpoint),
+        ).fetchall()
+        samples = [self._decompress(content, None) for _, _, content in rows]
+        try:
+            dictionary = zstandard.train_dictionary(self.dictionary_size, [*samples])
+        except zstandard.ZstdError:
+            # too few or too small samples; training is attempted again later
+            return None
+        dictionary_id = self._connection.execute(
+            'INSERT INTO dictionaries (service, endpoint, data) VALUES (?, ?, ?)',
+            (service, endpoint, dictionary.as_bytes()),
+        ).lastrowid
+        self._connection.executemany(
+            'UPDATE responses SET dictionary_id = ?, content = ? WHERE service = ? '
+            'AND endpoint = ? AND cursor = ? AND fetched_at = ?',
+            [
+                (
+                    dictionary_id,
+                    self._compress(sample, dictionary_id),
+                    service,
+                    endpoint,
+                    cursor,
+                    fetched_at,
+                )
+                for (cursor, fetched_at, _), sample in zip(rows, samples)
+            ],
+        )
+        return dictionary_id
+
+    def put(
+        self,
+        service: str,
+        endpoint: str,
+        cursor: str,
+        content: bytes,
+        fetched_at: Optional[float] = None,
+    ) -> None:
+        """
+        Stores a raw response, training the dictionary of ``endpoint`` once enough of
+        its responses have been stored.
+
+        :param service: the name of the service the response is from.
+        :param endpoint: the path of the endpoint the response is from.
+        :param cursor: identifies the page of the response, e.g., the serialized
+        parameters of the request.
+        :param content: the body of the response.
+        :param fetched_at: the time the response was fetched. Defaults to now.
+        """
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        with self._lock, self._connection:
+            dictionary_id = self._latest_dictionary_id(service, endpoint)
+            self._connection.execute(
+                'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)',
+                (
+                    service,
+                    endpoint,
+                    cursor,
+                    fetched_at,
+                    dictionary_id,
+                    self._compress(content, dictionary_id),
+                ),
+            )
+            if dictionary_id is not None:
+                return
+            (sample_count,) = self._connection.execute(
+                'SELECT COUNT(*) FROM responses WHERE service = ? AND endpoint = ?',
+                (service, endpoint),
+            ).fetchone()
+            if sample_count % self.training_sample_count == 0:
+                self._train_dictionary(service, endpoint)
+
+    def get(
+        self,
+        service: str,
+        endpoint: str,
+        cursor: str,
+        fetched_at: Optional[float] = None,
+    ) -> bytes | None:
+        """
+        :param fetched_at: the time the response was fetched. If not given, the most
+        recently fetched response is returned.
+
+        :returns: the body of the response, or ``None`` if it isn't archived.
+        """
+        query = (
+            'SELECT dictionary_id, content FROM responses '
+            'WHERE service = ? AND endpoint = ? AND cursor = ?'
+        )
+        params: tuple[Any, ...] = (service, endpoint, cursor)
+        if fetched_at is not None:
+            query += ' AND fetched_at = ?'
+            params += (fetched_at,)
+        with self._lock:
+            row = self._connection.execute(
+                query + ' ORDER BY fetched_at DESC LIMIT 1', params
+            ).fetchone()
+            if not row:
+                return None
+            return self._decompress(row[1], row[0])
+
+    def iter_responses(
+        self, service: str, endpoint: Optional[str] = None
+    ) -> Iterator[ArchivedResponse]:
+        """
+        :param service: the name of the service.
+        :param endpoint: the path of the endpoint. If not given, the responses of every
+        endpoint of ``service`` are returned.
+
+        :returns: an iterator over the archived responses, in the order they were
+        fetched. Responses are read from the database as the iterator is consumed.
+        """
+        # pages through the responses in batches, so they aren't all read at once
+        query = (
+            'SELECT rowid, endpoint, cursor, fetched_at, dictionary_id, content '
+            'FROM responses WHERE service = ? AND (fetched_at, rowid) > (?, ?) '
+            'AND endpoint = COALESCE(?, endpoint) '
+            f'ORDER BY fetched_at, rowid LIMIT {self._BATCH_SIZE}'
+        )
+        last_fetched_at, last_rowid = float('-inf'), 0
+        while True:
+            with self._lock:
+                rows = self._connection.execute(
+                    query, (service, last_fetched_at, last_rowid, endpoint)
+                ).fetchall()
+                archived_responses = [
+                    ArchivedResponse(
+                        service,
+                        endpoint_,
+                        cursor,
+                        fetched_at,
+                        self._decompress(content, dictionary_id),
+                    )
+                    for _, endpoint_, cursor, fetched_at, dictionary_id, content in rows
+                ]
+            if not rows:
+                return
+            yield from archived_responses
+            last_rowid, last_fetched_at = rows[-1][0], rows[-1][3]
+
+    def reparse(
+        self, service: 'BaseTransferService', vertical: Vertical
+    ) -> Iterator[Any]:
+        """
+        Parses the archived responses of the endpoint ``service`` pages ``vertical``
+        from again, using the service's ``parse_*_vertical`` method, e.g., after the
+        parser was fixed.
+
+        :param service: the service the responses were fetched by.
+        :param vertical: the :class:`Vertical` to parse the responses into.
+
+        :returns: an iterator over the parsed verticals, or ``None`` for raw items
+        that couldn't be parsed.
+
+        :raises: :class:`UnsupportedRequestException` if the service can't page
+        through ``vertical``.
+        """
+        resource = service._get_paginated_resource(vertical)
+        for archived_response in self.iter_responses(
+            service._service_name, resource.path_suffix
+        ):
+            raw_items = service._extract_items(
+                service.json_decoder(archived_response.content), resource.items_path
+            )
+            for raw_item in raw_items:
+                yield service._parse_raw_item(vertical, raw_item)
@@ -0,0 +1,220 @@
+import asyncio
+from types import TracebackType
+from typing import Any, AsyncIterator, Optional, Self
+
+from pardner.services.base import BaseTransferService
+from pardner.services.pagination import PaginatedResource
+from pardner.verticals import Vertical
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None  # type: ignore[assignment]
+
+
+class AsyncBaseTransferService(BaseTransferService):
+    """
+    A base class for transfer services that fetch data using ``asyncio``, so that many
+    requests can be in flight at once from a single thread. Meant to be combined with a
+    service-specific class, whose authorization flow and ``parse_*_vertical`` methods
+    are reused as is, e.g.:
+
+    .. code-block:: python
+
+        class AsyncStravaTransferService(
+            AsyncBaseTransferService, StravaTransferService
+        ): ...
+
+    Requests go through the :class:`httpx.AsyncClient` that ``transport`` holds for
+    the service's host, shared with the other services, unless ``async_client`` is
+    set. Requires the optional ``httpx`` dependency (``pip install pardner[async]``).
+    """
+
+    async_client: Optional['httpx.AsyncClient'] = None
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Closes the connections held by ``async_client``, if set. The shared clients are
+        closed by :meth:`SharedTransport.aclose`.
+        """
+        if self.async_client:
+            await self.async_client.aclose()
+            self.async_client = None
+
+    def _get_async_client(self) -> 'httpx.AsyncClient':
+        """
+        :returns: the client used to make requests: ``async_client`` if set, or the
+        client ``transport`` shares for the service's host.
+
+        :raises: :class:`ImportError` if ``httpx`` is not installed.
+        """
+        if self.async_client:
+            return self.async_client
+        if httpx is None:
+            raise ImportError(
+                f'Fetching data from {self._service_name} asynchronously requires '
+                'httpx. Install it with `pip install pardner[async]`.'
+            )
+        return self.transport.get_async_client(self._base_url)
+
+    async def _aget_resource(
+        self, uri: str, params: dict[str, Any] = {}
+    ) -> 'httpx.Response':
+        """
+        Sends a GET request to ``uri``, authorized with the token obtained by
+        :class:`OAuth2Session`, retrying it if it fails with a transient error.
+
+        :param uri: the destination of the request (a URI).
+        :param params: the extra parameters to be send with the request, optionally.
+
+        :returns: The :class:`httpx.Response` object obtained from making the request.
+
+        :raises: :class:`ImportError` if ``httpx`` is not installed.
+        """
+        headers = {}
+        if self._oAuth2Session.access_token:
+            headers['Authorization'] = f'Bearer {self._oAuth2Session.access_token}'
+        # raises the ImportError before httpx is needed to handle errors
+        async_client = self._get_async_client()
+        retries = 0
+        while True:
+            while wait_time := self.rate_limiter.try_acquire():
+                await asyncio.sleep(wait_time)
+            try:
+                response = await async_client.get(uri, params=params, headers=headers)
+            except httpx.TransportError as error:
+                await asyncio.sleep(self._retry_delay(retries, error=error))
+                retries += 1
+                continue
+
+            self._update_rate_limits(response.status_code, response.headers)
+            if not response.is_success and self.retry_policy.is_retryable(
+                'GET', response.status_code
+            ):
+                await asyncio.sleep(
+                    self._retry_delay(
+                        retries, response.status_code, response.headers, response
+                    )
+                )
+                retries += 1
+                continue
+            if not response.is_success:
+                response.raise_for_status()
+            return response
+
+    async def _aget_resource_from_path(
+        self, path_suffix: str, params: dict[str, Any] = {}
+    ) -> 'httpx.Response':
+        """
+        Sends a GET request to the endpoint URL built using ``endpoint_path``.
+
+        :param path_suffix: the path of the endpoint being accessed.
+        :param params: the extra parameters to be send with the request, optionally.
+
+        :returns: The :class:`httpx.Response` object obtained from making the request.
+        """
+        resource_url = self._build_resource_url(path_suffix)
+        return await self._aget_resource(resource_url, params)
+
+    async def _aiter_raw_items(
+        self,
+        resource: PaginatedResource,
+        request_params: dict[str, Any] = {},
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Asynchronous counterpart of :meth:`_iter_raw_items`.
+        """
+        params: dict[str, Any] | None = self._initial_page_params(
+            resource, request_params, limit
+        )
+        item_count = 0
+        while params is not None:
+            response = await self._aget_resource_from_path(resource.path_suffix, params)
+            self._archive_response(resource.path_suffix, params, response)
+            raw_items = self._extract_items(
+                self._decode_json(response), resource.items_path
+            )
+            if limit is not None:
+                raw_items = raw_items[: limit - item_count]
+            for raw_item in raw_items:
+                yield raw_item
+            item_count += len(raw_items)
+            params = self._next_page_params(
+                resource,
+                params,
+                len(raw_items),
+                raw_items[-1] if raw_items else None,
+                item_count,
+                limit,
+            )
+
+    async def aiter_vertical(
+        self,
+        vertical: Vertical,
+        request_params: dict[str, Any] = {},
+        limit: Optional[int] = None,
+        lazy: bool = False,
+    ) -> AsyncIterator[Any]:
+        """
+        Asynchronous counterpart of :meth:`iter_vertical`. Pages are only requested as
+        the iterator is consumed.
+
+        :param vertical: the :class:`Vertical` to fetch from the service.
+        :param request_params: additional request parameters to be sent with every HTTP
+        request. Requires familiarity with the API of the service being used.
+        :param limit: the maximum number of objects to fetch. If ``None``, every object
+        available is fetched.
+        :param lazy: whether to yield :class:`LazyVertical`s, whose fields are only
+        converted when read, rather than fully parsed objects.
+
+        :returns: an asynchronous iterator over the ``vertical`` objects, or ``None``
+        for objects that couldn't be parsed.
+
+        :raises: :class:`UnsupportedVerticalException` if the vertical is not supported.
+        """
+        resource = self._get_paginated_resource(vertical)
+        parse_raw_item = self._parse_raw_item_lazily if lazy else self._parse_raw_item
+        async for raw_item in self._aiter_raw_items(resource, request_params, limit):
+            vertical_obj = parse_raw_item(vertical, raw_item)
+            if self.dedup_index is None or self.dedup_index.is_new(vertical_obj):
+                yield vertical_obj
+
+    async def afetch(
+        self,
+        vertical: Vertical,
+        request_params: dict[str, Any] = {},
+        limit: Optional[int] = None,
+    ) -> list[Any]:
+        """
+        Asynchronous counterpart of :meth:`fetch`, paging through the service's API as
+        many times as needed.
+
+        :param vertical: the :class:`Vertical` to fetch from the service.
+        :param request_params: additional request parameters to be sent with every HTTP
+        request. Requires familiarity with the API of the service being used.
+        :param limit: the maximum number of objects to fetch. If ``None``, every object
+        available is fetched.
+
+        :returns: the list of ``vertical`` objects, or ``None`` for objects that
+        couldn't be parsed.
+
+        :raises: :class:`UnsupportedVerticalException` if the vertical is not supported.
+        """
+        return [
+            vertical_obj
+            async for vertical_obj in self.aiter_vertical(
+                vertical, request_params, limit
+            )
+        ]
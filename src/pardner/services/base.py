@@ -1,29 +1,140 @@
+import inspect
+import json
+import random
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Iterable, Optional
+from typing import (
+    Any,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    TypeVar,
+)
 from urllib.parse import urljoin
 
-from requests import Response
+from pydantic import BaseModel
+from requests import ConnectionError, Response, Timeout
 from requests_oauthlib import OAuth2Session
 
-from pardner.exceptions import InsufficientScopeException, UnsupportedVerticalException
-from pardner.services.utils import scope_as_set, scope_as_string
-from pardner.verticals import Vertical
+from pardner.exceptions import (
+    InsufficientScopeException,
+    RetriesExhaustedException,
+    UnsupportedRequestException,
+    UnsupportedVerticalException,
+)
+from pardner.services.archive import RawResponseArchive
+from pardner.services.cache import HTTPCache
+from pardner.services.decoding import JSONDecoder, default_json_decoder
+from pardner.services.dedup import BaseDedupIndex
+from pardner.services.mapping import (
+    FieldGetter,
+    FieldMapper,
+    FieldMapping,
+    compile_field_getters,
+    compile_field_mappings,
+)
+from pardner.services.pagination import PaginatedResource
+from pardner.services.parallel import ParseExecutor
+from pardner.services.rate_limit import RateLimiter, get_rate_limiter, parse_retry_after
+from pardner.services.retention import RawRetention, RawSpill
+from pardner.services.retry import RetryPolicy
+from pardner.services.streaming import iter_json_array_items
+from pardner.services.sync import BaseCheckpointStore, SyncCursor, get_checkpoint
+from pardner.services.transport import SharedTransport, default_transport
+from pardner.services.utils import get_vertical_name, scope_as_set, scope_as_string
+from pardner.verticals import (
+    BaseVertical,
+    LazyVertical,
+    Vertical,
+    deterministic_object_id,
+)
+
+Model = TypeVar('Model', bound=BaseModel)
 
 
 class BaseTransferService(ABC):
     """
     A base class to be extended by service-specific classes that implement logic for
     OAuth 2.0 and data transfers.
+
+    Requests to the service's API go through ``transport``, which keeps a pool of
+    connections per host shared by all services, and are held back by
+    ``rate_limiter`` so that the quotas of the service aren't exceeded. Requests
+    failing with transient errors are retried according to ``retry_policy``. Setting
+    ``cache`` to an :class:`HTTPCache` avoids downloading unchanged responses again.
+
+    Verticals are validated by pydantic as they are parsed. Once a service's parsers
+    are trusted to produce well-formed data, setting ``trusted_parsing`` skips that
+    validation, except for 1 in ``validation_sample_rate`` verticals (on average), which
+    are still validated so that changes to the service's API are noticed. Setting
+    ``parse_executor`` to a :class:`ParseExecutor` moves parsing to other processes.
+    Responses are decoded by ``json_decoder``, which takes the body as bytes. Setting
+    ``stream_responses`` reads paginated responses in chunks of ``stream_chunk_size``
+    bytes and decodes their items one at a time, so that memory use is bounded by the
+    largest item rather than the largest page.
+
+    The ``fetch_*_vertical`` methods return the raw items alongside the parsed
+    verticals. ``raw_retention`` can instead be set to ``'drop'``, which returns
+    ``None`` in their place, or to ``'spill'``, which compresses them to ``raw_spill``
+    (a temporary :class:`RawSpill` by default) and returns a :class:`SpilledRaw`
+    handle to read them back. Setting ``raw_archive`` to a :class:`RawResponseArchive`
+    keeps every page fetched, compressed, so it can be parsed again later.
+
+    Verticals get random ids (``pardner_object_id``) by default. Setting
+    ``deterministic_ids`` derives them from the ids generated by the service instead,
+    so the same object keeps its id across fetches. Setting ``dedup_index`` to a
+    :class:`BaseDedupIndex` drops the objects it has already seen.
     """
 
     _authorization_url: str
     _base_url: str
     _client_secret: str | None
+    _field_getters: dict[str, dict[str, FieldGetter]] = {}
+    _field_mappers: dict[str, FieldMapper] = {}
+    _field_mappings: dict[str, tuple[FieldMapping, ...]] = {}
     _oAuth2Session: OAuth2Session
+    _paginated_resources: dict[str, PaginatedResource] = {}
+    _rate_limits: dict[str, tuple[float, float]] = {}
     _service_name: str
     _supported_verticals: set[Vertical] = set()
+    _sync_cursors: dict[str, SyncCursor] = {}
     _token_url: str
     _verticals: set[Vertical] = set()
+    cache: HTTPCache | None = None
+    dedup_index: BaseDedupIndex | None = None
+    deterministic_ids: bool = False
+    json_decoder: JSONDecoder = staticmethod(default_json_decoder)
+    parse_executor: ParseExecutor | None = None
+    raw_archive: RawResponseArchive | None = None
+    raw_retention: RawRetention = 'keep'
+    raw_spill: RawSpill | None = None
+    retry_policy: RetryPolicy = RetryPolicy()
+    stream_chunk_size: int = 64 * 1024
+    stream_responses: bool = False
+    transport: SharedTransport = default_transport
+    trusted_parsing: bool = False
+    validation_sample_rate: int = 0
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # parsers are specialized once per class rather than interpreting the
+        # mappings for every item
+        if '_field_mappings' in cls.__dict__:
+            cls._field_mappers = {
+                vertical_name: compile_field_mappings(
+                    field_mappings, f'map_{vertical_name}_fields'
+                )
+                for vertical_name, field_mappings in cls._field_mappings.items()
+            }
+            cls._field_getters = {
+                vertical_name: compile_field_getters(
+                    field_mappings, f'get_{vertical_name}'
+                )
+                for vertical_name, field_mappings in cls._field_mappings.items()
+            }
 
     def __init__(
         self,
@@ -55,6 +166,7 @@ class BaseTransferService(ABC):
         self._oAuth2Session = OAuth2Session(
             client_id=client_id, redirect_uri=redirect_uri, state=state
         )
+        self.transport.mount(self._oAuth2Session, self._base_url)
         self.scope = self.scope_for_verticals(verticals)
 
     @property
@@ -81,6 +193,29 @@ class BaseTransferService(ABC):
         """
         self._oAuth2Session.scope = scope_as_string(new_scope)
 
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        """
+        The rate limiter shared by every instance of the service in the process that
+        uses the same client ID, since quotas are enforced per application.
+        """
+        return get_rate_limiter(
+            f'{self._service_name}:{self._oAuth2Session.client_id}', self._rate_limits
+        )
+
+    @property
+    def token(self) -> dict[str, Any]:
+        token: dict[str, Any] = self._oAuth2Session.token
+        return token
+
+    @token.setter
+    def token(self, token: dict[str, Any]) -> None:
+        """
+        Sets the token of an already authorized user, e.g., one obtained from
+        ``fetch_token`` in a previous session.
+        """
+        self._oAuth2Session.token = token
+
     @property
     def verticals(self) -> set[Vertical]:
         return self._verticals
@@ -102,19 +237,140 @@ class BaseTransferService(ABC):
             )
         self._verticals = set(verticals)
 
-    def _get_resource(self, uri: str, params: dict[str, Any] = {}) -> Response:
+    def _get_resource(
+        self, uri: str, params: dict[str, Any] = {}, stream: bool = False
+    ) -> Response:
         """
-        Sends a GET request to ``uri`` using :class:`OAuth2Session`.
+        Sends a GET request to ``uri`` using :class:`OAuth2Session`, retrying it if
+        it fails with a transient error. If the service has a ``cache``, fresh cached
+        responses are returned without sending a request, and stale ones are
+        revalidated with a conditional request.
 
         :param uri: the destination of the request (a URI).
         :param params: the extra parameters to be send with the request, optionally.
+        :param stream: whether to defer downloading the body until it's read (e.g.,
+        with :meth:`requests.Response.iter_content`). Responses stored in the
+        ``cache`` are downloaded in full regardless.
 
         :returns: The :class:`requests.Response` object obtained from making the request.
+
+        :raises: :class:`RetriesExhaustedException` if the request kept failing with
+        transient errors.
+        :raises: :class:`requests.HTTPError` if the request failed otherwise.
+        """
+        headers: dict[str, str] = {}
+        if self.cache:
+            cache_key = self.cache.key(
+                uri, params, self._oAuth2Session.access_token or ''
+            )
+            cache_entry = self.cache.get(cache_key)
+            if cache_entry and self.cache.is_fresh(cache_entry):
+                return cache_entry.to_response()
+            headers = self.cache.conditional_headers(cache_entry)
+
+        retries = 0
+        while True:
+            self.rate_limiter.acquire()
+            try:
+                response = self._oAuth2Session.get(
+                    uri, params=params, headers=headers, stream=stream
+                )
+            except (ConnectionError, Timeout) as error:
+                time.sleep(self._retry_delay(retries, error=error))
+                retries += 1
+                continue
+
+            self._update_rate_limits(response.status_code, response.headers)
+            if not response.ok and self.retry_policy.is_retryable(
+                'GET', response.status_code
+            ):
+                retry_delay = self._retry_delay(
+                    retries, response.status_code, response.headers, response
+                )
+                # returns the connection to the pool, as streamed responses hold it
+                # until they're read or closed
+                response.close()
+                time.sleep(retry_delay)
+                retries += 1
+                continue
+            if not response.ok:
+                response.raise_for_status()
+            if self.cache:
+                return self.cache.update(cache_key, response, cache_entry)
+            return response
+
+    def _retry_delay(
+        self,
+        retries: int,
+        status_code: Optional[int] = None,
+        headers: Mapping[str, Any] = {},
+        response: Any = None,
+        error: Optional[Exception] = None,
+    ) -> float:
+        """
+        Given a failed GET request, determines how long to wait before retrying it.
+
+        :param retries: the number of times the request has been retried so far.
+        :param status_code: the status code of the response, if any.
+        :param headers: the headers of the response, if any.
+        :param response: the response, if any.
+        :param error: the exception raised when making the request, if any.
+
+        :returns: the number of seconds to wait before retrying.
+
+        :raises: :class:`RetriesExhaustedException` if the request shouldn't be retried.
+        """
+        retry_after = parse_retry_after(headers.get('Retry-After'))
+        if not self.retry_policy.should_retry('GET', retries, status_code, retry_after):
+            raise RetriesExhaustedException(
+                self._service_name,
+                attempts=retries + 1,
+                status_code=status_code,
+                retry_after=retry_after,
+                response=response,
+            ) from error
+        return self.retry_policy.backoff(retries, retry_after)
+
+    def _update_rate_limits(self, status_code: int, headers: Mapping[str, Any]) -> None:
+        """
+        Updates ``rate_limiter`` with the quota usage reported in a response. Services
+        that report their quotas in headers should extend this method.
+
+        :param status_code: the status code of the response.
+        :param headers: the headers of the response.
+        """
+        if status_code == 429:
+            self.rate_limiter.pause(parse_retry_after(headers.get('Retry-After')))
+
+    def _decode_json(self, response: Any) -> Any:
+        """
+        Decodes the JSON body of ``response`` with ``json_decoder``, straight from the
+        bytes received. ``json_decoder`` defaults to ``orjson`` if it's installed.
+
+        :param response: a :class:`requests.Response` or :class:`httpx.Response`.
+
+        :returns: the decoded body.
+        """
+        return self.json_decoder(response.content)
+
+    def _archive_response(
+        self, path_suffix: str, params: dict[str, Any], response: Any
+    ) -> None:
+        """
+        Stores the body of a response in ``raw_archive``, if set. Every response
+        whose items are parsed into verticals goes through this method.
+
+        :param path_suffix: the path of the endpoint the response came from.
+        :param params: the parameters of the request, which identify the page.
+        :param response: a :class:`requests.Response` or :class:`httpx.Response`.
         """
-        response = self._oAuth2Session.get(uri, params=params)
-        if not response.ok:
-            response.raise_for_status()
-        return response
+        if self.raw_archive is not None:
+            self.raw_archive.put(
+                self._service_name,
+                path_suffix,
+                json.dumps(params, sort_keys=True, default=str),
+                response.content,
+            )
 
     def _build_resource_url(self, path_suffix: str, base: Optional[str] = None) -> str:
         """
@@ -137,18 +393,314 @@ class BaseTransferService(ABC):
         return urljoin(base, path_suffix)
 
     def _get_resource_from_path(
-        self, path_suffix: str, params: dict[str, Any] = {}
+        self, path_suffix: str, params: dict[str, Any] = {}, stream: bool = False
     ) -> Response:
         """
         Sends a GET request to the endpoint URL built using ``endpoint_path``.
 
         :param path_suffix: the path of the endpoint being accessed.
         :param params: the extra parameters to be send with the request, optionally.
+        :param stream: whether to defer downloading the body, see
+        :meth:`_get_resource`.
 
         :returns: The :class:`requests.Response` object obtained from making the request.
         """
         resource_url = self._build_resource_url(path_suffix)
-        return self._get_resource(resource_url, params)
+        return self._get_resource(resource_url, params, stream)
+
+    def _get_paginated_resource(self, vertical: Vertical) -> PaginatedResource:
+        """
+        :param vertical: the :class:`Vertical` being fetched.
+
+        :returns: the :class:`PaginatedResource` the service declared for ``vertical``.
+
+        :raises: :class:`UnsupportedVerticalException` if the vertical is not supported.
+        :raises: :class:`UnsupportedRequestException` if the service can't page through
+        ``vertical``.
+        """
+        if not self.is_vertical_supported(vertical):
+            raise UnsupportedVerticalException(
+                vertical, service_name=self._service_name
+            )
+        resource = self._paginated_resources.get(get_vertical_name(vertical))
+        if not resource:
+            raise UnsupportedRequestException(
+                self._service_name,
+                f'cannot page through {get_vertical_name(vertical)}.',
+            )
+        return resource
+
+    def _extract_items(
+        self, raw_response: Any, items_path: tuple[str, ...]
+    ) -> list[Any]:
+        """
+        :param raw_response: the JSON response of a request.
+        :param items_path: the keys leading to the list of items in ``raw_response``.
+
+        :returns: the list of raw items in ``raw_response``.
+
+        :raises: :class:`ValueError` if there's no list at ``items_path``.
+        """
+        raw_items = raw_response
+        for key in items_path:
+            raw_items = raw_items.get(key) if isinstance(raw_items, dict) else None
+        if not isinstance(raw_items, list):
+            raise ValueError(
+                'Unexpected response format. Expected list, '
+                f'got: {json.dumps(raw_response, indent=2)}'
+            )
+        return raw_items
+
+    def _initial_page_params(
+        self,
+        resource: PaginatedResource,
+        request_params: dict[str, Any],
+        limit: Optional[int],
+    ) -> dict[str, Any]:
+        """
+        :returns: the parameters of the request for the first page of ``resource``.
+        Pages are requested at the largest size allowed, unless ``limit`` is smaller.
+        """
+        if not resource.paginator:
+            return {**resource.default_params, **request_params}
+        page_size = resource.paginator.max_page_size
+        if limit is not None:
+            page_size = min(limit, page_size)
+        return {
+            **resource.paginator.initial_params(page_size),
+            **resource.default_params,
+            **request_params,
+        }
+
+    def _next_page_params(
+        self,
+        resource: PaginatedResource,
+        params: dict[str, Any],
+        page_item_count: int,
+        last_item: Any,
+        item_count: int,
+        limit: Optional[int],
+    ) -> dict[str, Any] | None:
+        """
+        :param params: the parameters of the request for the current page.
+        :param page_item_count: the number of raw items in the current page.
+        :param last_item: the last raw item of the current page, if any.
+        :param item_count: the number of raw items fetched so far.
+
+        :returns: the parameters of the request for the next page of ``resource``, or
+        ``None`` if there's no need to request another page.
+        """
+        if not resource.paginator or (limit is not None and item_count >= limit):
+            return None
+        return resource.paginator.next_params(params, page_item_count, last_item)
+
+    def _iter_page_items(
+        self, resource: PaginatedResource, params: dict[str, Any]
+    ) -> Generator[Any, None, None]:
+        """
+        Requests one page of ``resource`` and yields its raw items. If
+        ``stream_responses`` is set, the items are decoded as the body is received,
+        unless the page is stored in ``raw_archive``, which requires the whole body.
+
+        :param resource: the endpoint being paged through.
+        :param params: the parameters of the request for the page.
+
+        :returns: an iterator over the raw items of the page.
+
+        :raises: :class:`ValueError` if there's no list at ``resource.items_path``.
+        """
+        if not self.stream_responses or self.raw_archive:
+            response = self._get_resource_from_path(resource.path_suffix, params)
+            self._archive_response(resource.path_suffix, params, response)
+            raw_response = self._decode_json(response)
+            yield from self._extract_items(raw_response, resource.items_path)
+            return
+
+        response = self._get_resource_from_path(
+            resource.path_suffix, params, stream=True
+        )
+        try:
+            yield from iter_json_array_items(
+                response.iter_content(self.stream_chunk_size),
+                resource.items_path,
+                self.json_decoder,
+            )
+        finally:
+            # releases the connection if the page isn't read to the end
+            response.close()
+
+    def _iter_raw_items(
+        self,
+        resource: PaginatedResource,
+        request_params: dict[str, Any] = {},
+        limit: Optional[int] = None,
+    ) -> Iterator[Any]:
+        """
+        Lazily walks the pages of ``resource`` and yields each raw item.
+
+        :param resource: the endpoint being paged through.
+        :param request_params: any other endpoint-specific parameters to be sent
+        with every request. Depending on the parameters passed, this could override
+        the parameters set by the paginator.
+        :param limit: the maximum number of items to yield. If ``None``, every item is
+        yielded.
+
+        :returns: an iterator over the raw items, as returned by the API.
+        """
+        params: dict[str, Any] | None = self._initial_page_params(
+            resource, request_params, limit
+        )
+        item_count = 0
+        while params is not None:
+            page_item_count = 0
+            last_item = None
+            if limit is None or item_count < limit:
+                page_items = self._iter_page_items(resource, params)
+                for raw_item in page_items:
+                    yield raw_item
+                    item_count += 1
+                    page_item_count += 1
+                    last_item = raw_item
+                    if limit is not None and item_count >= limit:
+                        page_items.close()
+                        break
+            params = self._next_page_params(
+                resource, params, page_item_count, last_item, item_count, limit
+            )
+
+    def _get_raw_spill(self) -> RawSpill:
+        """
+        :returns: ``raw_spill``, set to a new temporary :class:`RawSpill` if needed.
+        """
+        if self.raw_spill is None:
+            self.raw_spill = RawSpill()
+        return self.raw_spill
+
+    def _retain_raw(self, raw_response: Any) -> Any:
+        """
+        :param raw_response: a raw response that's been parsed.
+
+        :returns: what ``raw_retention`` says to keep of ``raw_response``: the response
+        itself, ``None``, or a :class:`SpilledRaw` handle.
+
+        :raises: :class:`ValueError` if ``raw_retention`` isn't valid.
+        """
+        if self.raw_retention == 'keep':
+            return raw_response
+        if self.raw_retention == 'drop':
+            return None
+        if self.raw_retention == 'spill':
+            return self._get_raw_spill().write(raw_response)
+        raise ValueError(f'Invalid raw_retention: {self.raw_retention!r}')
+
+    def _parse_and_retain(
+        self, raw_items: Iterable[Any], parse_method: Callable[[Any], Any]
+    ) -> tuple[list[Any], Any]:
+        """
+        Parses each of ``raw_items`` with ``parse_method``. Unless ``raw_retention`` is
+        ``'keep'``, the raw items are never all held in memory: each is dropped or
+        spilled once it's parsed.
+
+        :returns: two elements: the first, the list of parsed items; the second, the
+        raw items, as retained by :meth:`_retain_raw`.
+
+        :raises: :class:`ValueError` if ``raw_retention`` isn't valid.
+        """
+        if self.raw_retention == 'keep':
+            raw_items = list(raw_items)
+            return [parse_method(raw_item) for raw_item in raw_items], raw_items
+        if self.raw_retention == 'drop':
+            return [parse_method(raw_item) for raw_item in raw_items], None
+        if self.raw_retention != 'spill':
+            raise ValueError(f'Invalid raw_retention: {self.raw_retention!r}')
+
+        parsed_items = []
+
+        def parse_each() -> Iterator[Any]:
+            for raw_item in raw_items:
+                parsed_items.append(parse_method(raw_item))
+                yield raw_item
+
+        is_new_spill = self.raw_spill is None
+        raw_spill = self._get_raw_spill()
+        try:
+            return parsed_items, raw_spill.write_items(parse_each())
+        except BaseException:
+            if is_new_spill:
+                # the temporary spill holds nothing yet, so isn't kept
+                raw_spill.close()
+                self.raw_spill = None
+            raise
+
+    def _parse_raw_item(self, vertical: Vertical, raw_item: Any) -> Any:
+        """
+        Parses ``raw_item`` using the ``parse_<vertical name>_vertical`` method of the
+        service. If the service doesn't define one, ``raw_item`` is returned as is.
+        """
+        parse_method = getattr(
+            self, f'parse_{get_vertical_name(vertical)}_vertical', None
+        )
+        return parse_method(raw_item) if parse_method else raw_item
+
+    def _parse_state(self) -> dict[str, Any]:
+        """
+        :returns: the attributes the ``parse_*_vertical`` methods of the service
+        depend on, which are sent to the processes of ``parse_executor``. Services
+        whose parsers depend on other attributes should extend this method.
+        """
+        return {
+            '_service_name': self._service_name,
+            'deterministic_ids': self.deterministic_ids,
+            'trusted_parsing': self.trusted_parsing,
+            'validation_sample_rate': self.validation_sample_rate,
+        }
+
+    def _parse_raw_item_lazily(self, vertical: Vertical, raw_item: Any) -> Any:
+        """
+        Like :meth:`_parse_raw_item`, but wraps ``raw_item`` in a
+        :class:`LazyVertical` whose fields are only converted when read.
+        """
+        vertical_name = get_vertical_name(vertical)
+        parse_method = getattr(self, f'parse_{vertical_name}_vertical', None)
+        if not parse_method or not isinstance(raw_item, dict):
+            return self._parse_raw_item(vertical, raw_item)
+        return LazyVertical(
+            vertical,
+            raw_item,
+            self._field_getters.get(vertical_name, {}),
+            lambda: parse_method(raw_item),
+            {'service': self._service_name, 'vertical_name': vertical_name},
+        )
+
+    def _build_model(self, model: type[Model], **fields: Any) -> Model:
+        """
+        Builds a vertical or sub-vertical from the fields extracted by a parser, which
+        must already be normalized (e.g., identifiers as strings, timestamps as
+        timezone-aware :class:`datetime`s). Fields are only validated if
+        ``trusted_parsing`` is off or the vertical is sampled for validation; otherwise,
+        they are set as is (e.g., URLs remain strings). If ``deterministic_ids`` is
+        on, the ``pardner_object_id`` of verticals is derived from their
+        ``service_object_id``.
+
+        :raises: :class:`pydantic.ValidationError` if validated ``fields`` are invalid.
+        """
+        if (
+            self.deterministic_ids
+            and fields.get('service_object_id') is not None
+            and 'pardner_object_id' not in fields
+            and issubclass(model, BaseVertical)
+        ):
+            fields['pardner_object_id'] = deterministic_object_id(
+                fields.get('service', self._service_name),
+                get_vertical_name(model),
+                fields['service_object_id'],
+            )
+        if self.trusted_parsing and not (
+            self.validation_sample_rate
+            and random.random() * self.validation_sample_rate < 1
+        ):
+            return model.model_construct(**fields)
+        return model(**fields)
 
     def add_verticals(
         self, verticals: Iterable[Vertical], should_reauth: bool = False
@@ -241,8 +793,138 @@ class BaseTransferService(ABC):
         """
         pass
 
+    def iter_vertical(
+        self,
+        vertical: Vertical,
+        request_params: dict[str, Any] = {},
+        limit: Optional[int] = None,
+        lazy: bool = False,
+        until_seen: bool = False,
+    ) -> Iterator[Any]:
+        """
+        Generic method for lazily fetching data of a specific vertical, transparently
+        paging through the service's API. Pages are only requested as the iterator is
+        consumed.
+
+        :param vertical: the :class:`Vertical` to fetch from the service.
+        :param request_params: additional request parameters to be sent with every HTTP
+        request. Requires familiarity with the API of the service being used.
+        :param limit: the maximum number of objects to fetch. If ``None``, every object
+        available is fetched.
+        :param lazy: whether to yield :class:`LazyVertical`s, whose fields are only
+        converted when read, rather than fully parsed objects.
+        :param until_seen: whether to stop paging at the first object already in
+        ``dedup_index``, rather than skipping it. For endpoints that list the most
+        recent objects first, this fetches only the objects added since the last
+        fetch.
+
+        :returns: an iterator over the ``vertical`` objects, or ``None`` for objects
+        that couldn't be parsed. Services that can't parse ``vertical`` yet yield the
+        raw objects instead.
+
+        :raises: :class:`UnsupportedVerticalException` if the vertical is not supported.
+        :raises: :class:`ValueError` if ``until_seen`` is set without a
+        ``dedup_index``.
+        """
+        if until_seen and self.dedup_index is None:
+            raise ValueError('until_seen requires a dedup_index.')
+        resource = self._get_paginated_resource(vertical)
+        raw_items = self._iter_raw_items(resource, request_params, limit)
+        vertical_objs: Iterable[Any]
+        if self.parse_executor and not lazy:
+            vertical_objs = self.parse_executor.map(self, vertical, raw_items)
+        else:
+            parse_raw_item = (
+                self._parse_raw_item_lazily if lazy else self._parse_raw_item
+            )
+            vertical_objs = (
+                parse_raw_item(vertical, raw_item) for raw_item in raw_items
+            )
+        if self.dedup_index is None:
+            yield from vertical_objs
+            return
+        for vertical_obj in vertical_objs:
+            if self.dedup_index.is_new(vertical_obj):
+                yield vertical_obj
+            elif until_seen:
+                return
+
+    def _sync_data_owner_id(self) -> str:
+        """
+        :returns: the id of the user whose data is being synced, which checkpoints are
+        stored under. Services supporting :meth:`sync` should override this method.
+
+        :raises: :class:`UnsupportedRequestException` if the service doesn't support
+        incremental syncs.
+        """
+        raise UnsupportedRequestException(
+            self._service_name, 'incremental syncs are not supported.'
+        )
+
+    def sync(
+        self,
+        vertical: Vertical,
+        checkpoints: BaseCheckpointStore,
+        request_params: dict[str, Any] = {},
+    ) -> Iterator[Any]:
+        """
+        Lazily fetches the data of a specific vertical created or updated since the
+        last sync, filtering on the service's side whenever its API allows it. Once the
+        iterator is exhausted, the high-water mark of this sync is saved to
+        ``checkpoints``; if it isn't (e.g., because of an error), the next sync starts
+        from the previous checkpoint again. Objects whose position in the history can't
+        be determined are always yielded.
+
+        :param vertical: the :class:`Vertical` to fetch from the service.
+        :param checkpoints: where the high-water marks of previous syncs are stored.
+        :param request_params: additional request parameters to be sent with every HTTP
+        request. Requires familiarity with the API of the service being used.
+
+        :returns: an iterator over the new ``vertical`` objects, or ``None`` for objects
+        that couldn't be parsed.
+
+        :raises: :class:`UnsupportedVerticalException` if the vertical is not supported.
+        :raises: :class:`UnsupportedRequestException` if the service can't sync
+        ``vertical`` incrementally.
+        """
+        resource = self._get_paginated_resource(vertical)
+        vertical_name = get_vertical_name(vertical)
+        cursor = self._sync_cursors.get(vertical_name)
+        if not cursor:
+            raise UnsupportedRequestException(
+                self._service_name, f'cannot sync {vertical_name} incrementally.'
+            )
+
+        data_owner_id = self._sync_data_owner_id()
+        checkpoint = checkpoints.get(self._service_name, data_owner_id, vertical_name)
+        params = dict(request_params)
+        if checkpoint is not None and cursor.request_param:
+            params[cursor.request_param] = checkpoint
+
+        new_checkpoint = checkpoint
+        for raw_item in self._iter_raw_items(resource, params):
+            item_checkpoint = get_checkpoint(raw_item, cursor)
+            if item_checkpoint is not None:
+                # the service may not filter on its side, or not precisely enough
+                if checkpoint is not None and item_checkpoint <= checkpoint:
+                    continue
+                if new_checkpoint is None or item_checkpoint > new_checkpoint:
+                    new_checkpoint = item_checkpoint
+            vertical_obj = self._parse_raw_item(vertical, raw_item)
+            if self.dedup_index is None or self.dedup_index.is_new(vertical_obj):
+                yield vertical_obj
+
+        if new_checkpoint is not None and new_checkpoint != checkpoint:
+            checkpoints.set(
+                self._service_name, data_owner_id, vertical_name, new_checkpoint
+            )
+
     def fetch(
-        self, vertical: Vertical, request_params: dict[str, Any] = {}, **params: Any
+        self,
+        vertical: Vertical,
+        request_params: dict[str, Any] = {},
+        limit: Optional[int] = None,
+        **params: Any,
     ) -> Any:
         """
         Generic method for fetching data of a specific vertical.
@@ -251,17 +933,34 @@ class BaseTransferService(ABC):
         service.
         :param request_params: additional request parameters to be sent with the HTTP
         request. Requires familiarity with the API of the service being used.
+        :param limit: if given, at most ``limit`` objects are fetched, paging through
+        the service's API as many times as needed. Passed as the ``count`` of the
+        method fetching ``vertical``.
         :param params: optional keyword arguments to be passed to the methods for
         fetching ``vertical``.
 
-        :returns: the JSON response resulting from making the request.
+        :returns: the result of the service's ``fetch_<vertical name>_vertical``
+        method.
 
         :raises: :class:`UnsupportedVerticalException` if the vertical is not supported.
+        :raises: :class:`UnsupportedRequestException` if ``limit`` is given but the
+        number of ``vertical`` objects fetched can't be limited.
+        :raises: :class:`ValueError` if both ``limit`` and ``count`` are given.
         """
         if not self.is_vertical_supported(vertical):
             raise UnsupportedVerticalException(
                 vertical, service_name=self._service_name
             )
 
-        method_name = f'fetch_{vertical.vertical_name}_vertical'
-        getattr(self, method_name)(request_params=request_params, **params)
+        vertical_name = get_vertical_name(vertical)
+        fetch_method = getattr(self, f'fetch_{vertical_name}_vertical')
+        if limit is not None:
+            if 'count' in params:
+                raise ValueError('Pass either limit or count, not both.')
+            if 'count' not in inspect.signature(fetch_method).parameters:
+                raise UnsupportedRequestException(
+                    self._service_name,
+                    f'cannot limit the number of {vertical_name} objects fetched.',
+                )
+            params['count'] = limit
+        return fetch_method(request_params=request_params, **params)
@@ -0,0 +1,190 @@
+import hashlib
+import math
+import mmap
+import os
+import struct
+import threading
+from typing import Optional
+
+# magic, number of bits, number of hashes, capacity, number of keys added
+_HEADER = struct.Struct('<8sQQQQ')
+_MAGIC = b'PRDBLOOM'
+
+
+def _hash_key(key: str) -> tuple[int, int]:
+    """
+    :returns: the two hashes of ``key`` that the positions of its bits are derived
+    from (double hashing), computed once for all the slices of a filter.
+    """
+    digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+    # the second hash must be odd so that the positions don't repeat
+    return int.from_bytes(digest[:8], 'little'), int.from_bytes(
+        digest[8:], 'little'
+    ) | 1
+
+
+class _BloomSlice:
+    """
+    A fixed-size Bloom filter, stored in a ``bytearray`` or memory-mapped from a file
+    (header followed by the bits).
+    """
+
+    capacity: int
+    num_bits: int
+    num_hashes: int
+
+    def __init__(
+        self, capacity: int, error_rate: float, path: Optional[str] = None
+    ) -> None:
+        if path and os.path.exists(path):
+            with open(path, 'r+b') as slice_file:
+                self._buffer: mmap.mmap | bytearray = mmap.mmap(slice_file.fileno(), 0)
+            magic, self.num_bits, self.num_hashes, self.capacity, _ = (
+                _HEADER.unpack_from(self._buffer)
+            )
+            if magic != _MAGIC:
+                raise ValueError(f'{path} is not a Bloom filter.')
+            return
+
+        self.capacity = capacity
+        num_bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.num_bits = num_bits + -num_bits % 8
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        size = _HEADER.size + self.num_bits // 8
+        if path:
+            with open(path, 'w+b') as slice_file:
+                slice_file.truncate(size)
+                self._buffer = mmap.mmap(slice_file.fileno(), 0)
+        else:
+            self._buffer = bytearray(size)
+        _HEADER.pack_into(
+            self._buffer, 0, _MAGIC, self.num_bits, self.num_hashes, capacity, 0
+        )
+
+    @property
+    def count(self) -> int:
+        count: int = _HEADER.unpack_from(self._buffer)[4]
+        return count
+
+    def _positions(self, hashes: tuple[int, int]) -> list[int]:
+        first_hash, second_hash = hashes
+        return [
+            (first_hash + index * second_hash) % self.num_bits
+            for index in range(self.num_hashes)
+        ]
+
+    def contains(self, hashes: tuple[int, int]) -> bool:
+        buffer = self._buffer
+        return all(
+            buffer[_HEADER.size + (position >> 3)] & (1 << (position & 7))
+            for position in self._positions(hashes)
+        )
+
+    def add(self, hashes: tuple[int, int]) -> None:
+        buffer = self._buffer
+        for position in self._positions(hashes):
+            buffer[_HEADER.size + (position >> 3)] |= 1 << (position & 7)
+        struct.pack_into('<Q', buffer, _HEADER.size - 8, self.count + 1)
+
+    def flush(self) -> None:
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.flush()
+
+    def close(self) -> None:
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+
+class ScalableBloomFilter:
+    """
+    A set of strings that uses a few bits per string, at the cost of false positives:
+    strings that weren't added may be reported as members, with a probability of at
+    most ``error_rate``. Strings that were added are always reported as members.
+
+    The filter grows as strings are added by adding slices, each twice as large and
+    with a tighter error rate than the previous one. Given a ``path``, the slices are
+    files in that directory, memory-mapped so that they're only paged in as needed and
+    persist between runs.
+    """
+
+    error_rate: float
+    initial_capacity: int
+    path: Optional[str]
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        initial_capacity: int = 100_000,
+        error_rate: float = 0.001,
+    ) -> None:
+        """
+        :param path: the directory the slices are stored in. Created if it doesn't
+        exist. If not given, the filter is kept in memory.
+        :param initial_capacity: the number of strings the first slice holds.
+        :param error_rate: the maximum probability of false positives.
+        """
+        self.path = path
+        self.initial_capacity = initial_capacity
+        self.error_rate = error_rate
+        self._lock = threading.Lock()
+        self._slices: list[_BloomSlice] = []
+        if path:
+            os.makedirs(path, exist_ok=True)
+            for file_name in sorted(os.listdir(path)):
+                if file_name.endswith('.bloom'):
+                    self._slices.append(
+                        _BloomSlice(0, error_rate, os.path.join(path, file_name))
+                    )
+
+    def _add_slice(self) -> _BloomSlice:
+        index = len(self._slices)
+        # the error rates of the slices add up to at most ``error_rate``
+        bloom_slice = _BloomSlice(
+            self.initial_capacity * 2**index,
+            self.error_rate / 2 ** (index + 1),
+            os.path.join(self.path, f'{index:04d}.bloom') if self.path else None,
+        )
+        self._slices.append(bloom_slice)
+        return bloom_slice
+
+    def __contains__(self, key: str) -> bool:
+        hashes = _hash_key(key)
+        return any(bloom_slice.contains(hashes) for bloom_slice in self._slices)
+
+    def __len__(self) -> int:
+        return sum(bloom_slice.count for bloom_slice in self._slices)
+
+    def add(self, key: str) -> bool:
+        """
+        :returns: ``True`` if ``key`` definitely wasn't added before, ``False`` if it
+        probably was.
+        """
+        hashes = _hash_key(key)
+        with self._lock:
+            if any(bloom_slice.contains(hashes) for bloom_slice in self._slices):
+                return False
+            last_slice = self._slices[-1] if self._slices else None
+            if not last_slice or last_slice.count >= last_slice.capacity:
+                last_slice = self._add_slice()
+            last_slice.add(hashes)
+            return True
+
+    def clear(self) -> None:
+        with self._lock:
+            for bloom_slice in self._slices:
+                bloom_slice.close()
+            if self.path:
+                for index in range(len(self._slices)):
+                    os.remove(os.path.join(self.path, f'{index:04d}.bloom'))
+            self._slices = []
+
+    def flush(self) -> None:
+        """Writes the changes to the slices to disk."""
+        with self._lock:
+            for bloom_slice in self._slices:
+                bloom_slice.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            for bloom_slice in self._slices:
+                bloom_slice.close()
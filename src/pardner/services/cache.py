@@ -0,0 +1,335 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Mapping, NamedTuple, Optional
+from urllib.parse import urlsplit
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+
+class CacheEntry(NamedTuple):
+    """A response stored in the cache, along with its validators."""
+
+    url: str
+    status_code: int
+    headers: dict[str, str]
+    content: bytes
+    stored_at: float
+
+    @property
+    def etag(self) -> str | None:
+        return CaseInsensitiveDict(self.headers).get('ETag')
+
+    @property
+    def last_modified(self) -> str | None:
+        return CaseInsensitiveDict(self.headers).get('Last-Modified')
+
+    @property
+    def size(self) -> int:
+        return len(self.content)
+
+    def to_response(self) -> Response:
+        """
+        :returns: a :class:`requests.Response` equivalent to the one that was stored.
+        """
+        response = Response()
+        response.url = self.url
+        response.status_code = self.status_code
+        response.headers = CaseInsensitiveDict(self.headers)
+        response._content = self.content
+        response.encoding = response.apparent_encoding if self.content else None
+        return response
+
+
+class BaseCacheBackend(ABC):
+    """A base class for the storage behind :class:`HTTPCache`."""
+
+    @abstractmethod
+    def get(self, key: str) -> CacheEntry | None:
+        pass
+
+    @abstractmethod
+    def set(self, key: str, entry: CacheEntry) -> None:
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+
+class InMemoryCacheBackend(BaseCacheBackend):
+    """
+    Thread-safe, in-memory cache storage. Once either ``max_entries`` or ``max_bytes``
+    would be exceeded, the least recently used entries are evicted.
+    """
+
+    max_entries: int
+    max_bytes: int
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024):
+        """
+        :param max_entries: the maximum number of responses stored.
+        :param max_bytes: the maximum total size of the bodies of the responses stored.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._pop(key)
+            if entry.size > self.max_bytes:
+                return
+            self._entries[key] = entry
+            self._size += entry.size
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                self._pop(next(iter(self._entries)))
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _pop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry:
+            self._size -= entry.size
+
+
+class SQLiteCacheBackend(BaseCacheBackend):
+    """
+    Thread-safe, on-disk cache storage backed by a SQLite database, so cached
+    responses persist between runs. Once ``max_bytes`` would be exceeded, the least
+    recently used entries are evicted.
+    """
+
+    max_bytes: int
+
+    def __init__(self, path: str, max_bytes: int = 512 * 1024 * 1024) -> None:
+        """
+        :param path: the path of the database file. Created if it doesn't exist.
+        :param max_bytes: the maximum total size of the bodies of the responses stored.
+        """
+        self.max_bytes = max_bytes
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS responses ('
+                'key TEXT PRIMARY KEY, url TEXT, status_code INTEGER, headers TEXT, '
+                'content BLOB, size INTEGER, stored_at REAL, accessed_at REAL)'
+            )
+            self._connection.execute(
+                'CREATE INDEX IF NOT EXISTS responses_accessed_at '
+                'ON responses (accessed_at)'
+            )
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                'SELECT url, status_code, headers, content, stored_at '
+                'FROM responses WHERE key = ?',
+                (key,),
+            ).fetchone()
+            if not row:
+                return None
+            self._connection.execute(
+                'UPDATE responses SET accessed_at = ? WHERE key = ?', (time.time(), key)
+            )
+        url, status_code, headers, content, stored_at = row
+        return CacheEntry(url, status_code, json.loads(headers), content, stored_at)
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        if entry.size > self.max_bytes:
+            self.delete(key)
+            return
+        with self._lock, self._connection:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (
+                    key,
+                    entry.url,
+                    entry.status_code,
+                    json.dumps(entry.headers),
+                    entry.content,
+                    entry.size,
+                    entry.stored_at,
+                    time.time(),
+                ),
+            )
+            self._evict()
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute('DELETE FROM responses WHERE key = ?', (key,))
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute('DELETE FROM responses')
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def _evict(self) -> None:
+        (total_size,) = self._connection.execute(
+            'SELECT COALESCE(SUM(size), 0) FROM responses'
+        ).fetchone()
+        if total_size <= self.max_bytes:
+            return
+        keys_to_evict = []
+        for key, size in self._connection.execute(
+            'SELECT key, size FROM responses ORDER BY accessed_at'
+        ):
+            keys_to_evict.append((key,))
+            total_size -= size
+            if total_size <= self.max_bytes:
+                break
+        self._connection.executemany(
+            'DELETE FROM responses WHERE key = ?', keys_to_evict
+        )
+
+
+class HTTPCache:
+    """
+    A cache for the responses of GET requests. Responses younger than the TTL of their
+    endpoint are served without making a request. Older responses are revalidated with
+    a conditional request (using ``If-None-Match`` and ``If-Modified-Since``), and
+    served from the cache if the service replies that they haven't changed (i.e., with
+    a ``304 Not Modified``), which doesn't count towards most quotas and saves
+    downloading the body again.
+    """
+
+    backend: BaseCacheBackend
+    default_ttl: float
+    ttls: Mapping[str, float]
+
+    def __init__(
+        self,
+        backend: Optional[BaseCacheBackend] = None,
+        default_ttl: float = 0,
+        ttls: Mapping[str, float] = {},
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        :param backend: where responses are stored. Defaults to an
+        :class:`InMemoryCacheBackend`.
+        :param default_ttl: the number of seconds during which a response is served
+        without being revalidated. ``0`` means responses are always revalidated.
+        :param ttls: maps endpoint paths (e.g., ``'athlete/activities'``) to the TTL of
+        their responses, overriding ``default_ttl``.
+        :param clock: returns the current time, in seconds.
+        """
+        self.backend = backend if backend is not None else InMemoryCacheBackend()
+        self.default_ttl = default_ttl
+        self.ttls = ttls
+        self._clock = clock
+
+    def key(self, url: str, params: Mapping[str, Any], user_key: str = '') -> str:
+        """
+        :param url: the URL of the request.
+        :param params: the parameters of the request.
+        :param user_key: identifies the user on whose behalf the request is made (e.g.,
+        the access token), since the same request returns different data for different
+        users.
+
+        :returns: the key of the request in the cache.
+        """
+        serialized_request = json.dumps(
+            [url, sorted((str(k), str(v)) for k, v in params.items()), user_key]
+        )
+        return hashlib.sha256(serialized_request.encode()).hexdigest()
+
+    def ttl(self, url: str) -> float:
+        """
+        :returns: the TTL of the responses of the endpoint at ``url``.
+        """
+        path = urlsplit(url).path.rstrip('/')
+        matching_paths = [
+            ttl_path for ttl_path in self.ttls if path.endswith(ttl_path.strip('/'))
+        ]
+        if not matching_paths:
+            return self.default_ttl
+        return self.ttls[max(matching_paths, key=len)]
+
+    def get(self, key: str) -> CacheEntry | None:
+        return self.backend.get(key)
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        """
+        :returns: whether ``entry`` can be served without being revalidated.
+        """
+        return self._clock() - entry.stored_at < self.ttl(entry.url)
+
+    def conditional_headers(self, entry: CacheEntry | None) -> dict[str, str]:
+        """
+        :returns: the headers asking the service to only send the response if it
+        differs from ``entry``.
+        """
+        headers = {}
+        if entry and entry.etag:
+            headers['If-None-Match'] = entry.etag
+        if entry and entry.last_modified:
+            headers['If-Modified-Since'] = entry.last_modified
+        return headers
+
+    def update(
+        self, key: str, response: Response, entry: CacheEntry | None = None
+    ) -> Response:
+        """
+        Stores ``response`` or, if it says ``entry`` hasn't been modified, refreshes
+        ``entry``.
+
+        :param key: the key of the request, see :meth:`key`.
+        :param response: the response obtained from making the request.
+        :param entry: the entry used to build the conditional request, if any.
+
+        :returns: the response to use as the result of the request.
+        """
+        if response.status_code == 304 and entry:
+            entry = entry._replace(
+                headers={**entry.headers, **response.headers}, stored_at=self._clock()
+            )
+            self.backend.set(key, entry)
+            return entry.to_response()
+
+        if response.status_code == 200 and (
+            self.ttl(response.url) > 0
+            or 'ETag' in response.headers
+            or 'Last-Modified' in response.headers
+        ):
+            self.backend.set(
+                key,
+                CacheEntry(
+                    url=response.url,
+                    status_code=response.status_code,
+                    headers=dict(response.headers),
+                    content=response.content,
+                    stored_at=self._clock(),
+                ),
+            )
+        return response
@@ -0,0 +1,27 @@
+import json
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+JSONDecoder = Callable[[bytes], Any]
+
+
+def stdlib_json_decoder(content: bytes) -> Any:
+    """Decodes JSON using the standard library, which accepts bytes directly."""
+    return json.loads(content)
+
+
+def get_default_json_decoder() -> JSONDecoder:
+    """
+    :returns: ``orjson``'s decoder if it's installed (``pip install
+    pardner[fast-json]``), otherwise the standard library's.
+    """
+    if orjson is not None:
+        return orjson.loads
+    return stdlib_json_decoder
+
+
+default_json_decoder = get_default_json_decoder()
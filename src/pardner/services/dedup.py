@@ -0,0 +1,190 @@
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Iterable, Iterator, Optional
+
+from pardner.services.bloom import ScalableBloomFilter
+from pardner.verticals import deterministic_object_id
+
+
+def get_dedup_key(vertical_obj: Any) -> str | None:
+    """
+    :param vertical_obj: a vertical object (or :class:`LazyVertical`), or anything
+    else yielded by a service.
+
+    :returns: the key identifying ``vertical_obj`` across fetches (see
+    :func:`deterministic_object_id`), or ``None`` if it doesn't have a
+    ``service_object_id``.
+    """
+    service_object_id = getattr(vertical_obj, 'service_object_id', None)
+    if service_object_id is None:
+        return None
+    return deterministic_object_id(
+        vertical_obj.service, vertical_obj.vertical_name, service_object_id
+    )
+
+
+class BaseDedupIndex(ABC):
+    """
+    Remembers the vertical objects that have already been yielded by services, so that
+    objects fetched again (e.g., by overlapping pages or re-syncs) are dropped instead
+    of being stored twice downstream. Set it as the ``dedup_index`` of one or more
+    services.
+    """
+
+    @abstractmethod
+    def add(self, key: str) -> bool:
+        """
+        Marks ``key`` as seen.
+
+        :returns: ``True`` if ``key`` wasn't seen before, ``False`` otherwise.
+        """
+
+    @abstractmethod
+    def __contains__(self, key: str) -> bool:
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+    def is_new(self, vertical_obj: Any) -> bool:
+        """
+        Marks ``vertical_obj`` as seen.
+
+        :returns: ``False`` if ``vertical_obj`` was seen before, ``True`` otherwise.
+        Objects without a ``service_object_id`` (e.g., ``None`` for objects that
+        couldn't be parsed) are always new.
+        """
+        key = get_dedup_key(vertical_obj)
+        return key is None or self.add(key)
+
+    def filter(self, vertical_objs: Iterable[Any]) -> Iterator[Any]:
+        """
+        :param vertical_objs: the objects yielded by a service.
+
+        :returns: an iterator over the objects in ``vertical_objs`` that are new (see
+        :meth:`is_new`).
+        """
+        for vertical_obj in vertical_objs:
+            if self.is_new(vertical_obj):
+                yield vertical_obj
+
+
+class InMemoryDedupIndex(BaseDedupIndex):
+    """Thread-safe, in-memory dedup index, lost when the process exits."""
+
+    def __init__(self) -> None:
+        self._keys: set[str] = set()
+        self._lock = threading.Lock()
+
+    def add(self, key: str) -> bool:
+        with self._lock:
+            if key in self._keys:
+                return False
+            self._keys.add(key)
+            return True
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._keys.clear()
+
+
+class SQLiteDedupIndex(BaseDedupIndex):
+    """
+    Thread-safe, on-disk dedup index backed by a SQLite database, so that objects seen
+    in previous runs (e.g., the previous sync) are dropped too.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        :param path: the path of the database file. Created if it doesn't exist.
+        """
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS seen (key TEXT PRIMARY KEY) WITHOUT ROWID'
+            )
+
+    def add(self, key: str) -> bool:
+        with self._lock, self._connection:
+            cursor = self._connection.execute(
+                'INSERT OR IGNORE INTO seen VALUES (?)', (key,)
+            )
+            return cursor.rowcount == 1
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return bool(
+                self._connection.execute(
+                    'SELECT 1 FROM seen WHERE key = ?', (key,)
+                ).fetchone()
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute('DELETE FROM seen')
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+class BloomDedupIndex(BaseDedupIndex):
+    """
+    Dedup index that fits in a few bits per object by keeping the keys in a
+    :class:`ScalableBloomFilter`, memory-mapped from ``path`` if given. Keeping one
+    per service and vertical keeps each filter small.
+
+    Objects not in the filter are new, which is known without looking them up. Objects
+    in the filter are most likely not new, but may be false positives, so they're
+    checked against the ``exact`` index if one is given. Without one, about 1 in
+    ``1 / error_rate`` new objects is mistaken for an object already seen.
+    """
+
+    bloom_filter: ScalableBloomFilter
+    exact: Optional[BaseDedupIndex]
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        exact: Optional[BaseDedupIndex] = None,
+        initial_capacity: int = 100_000,
+        error_rate: float = 0.001,
+    ) -> None:
+        """
+        :param path: the directory the filter is stored in, see
+        :class:`ScalableBloomFilter`.
+        :param exact: the index positives are checked against, e.g., a
+        :class:`SQLiteDedupIndex`.
+        :param initial_capacity: the number of keys the filter holds before it grows.
+        :param error_rate: the maximum probability of false positives.
+        """
+        self.bloom_filter = ScalableBloomFilter(path, initial_capacity, error_rate)
+        self.exact = exact
+
+    def add(self, key: str) -> bool:
+        if self.bloom_filter.add(key):
+            if self.exact is not None:
+                self.exact.add(key)
+            return True
+        return self.exact is not None and self.exact.add(key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.bloom_filter and (self.exact is None or key in self.exact)
+
+    def clear(self) -> None:
+        self.bloom_filter.clear()
+        if self.exact is not None:
+            self.exact.clear()
+
+    def close(self) -> None:
+        """Writes the filter to disk and closes it. ``exact`` isn't closed."""
+        self.bloom_filter.flush()
+        self.bloom_filter.close()
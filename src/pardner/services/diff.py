@@ -0,0 +1,72 @@
+from typing import Any, Iterable, Iterator, Literal, MutableMapping, NamedTuple
+
+from pardner.services.dedup import get_dedup_key
+
+ChangeKind = Literal['inserted', 'updated', 'deleted']
+
+
+class Change(NamedTuple):
+    """
+    A change to a vertical object since it was last synced, see
+    :func:`diff_verticals`.
+    """
+
+    kind: ChangeKind
+    # identifies the object across fetches, see :func:`get_dedup_key`
+    key: str
+    # ``None`` for deleted objects
+    vertical_obj: Any = None
+
+
+def diff_verticals(
+    vertical_objs: Iterable[Any],
+    content_hashes: MutableMapping[str, str],
+    detect_deletions: bool = True,
+) -> Iterator[Change]:
+    """
+    Compares the vertical objects fetched from a service with the content hashes (see
+    :meth:`BaseVertical.content_hash`) stored when they were last synced, and yields
+    only the objects that changed. ``content_hashes`` is updated as the changes are
+    yielded, so that it can be stored for the next sync (e.g., if it's a
+    :mod:`shelve`).
+
+    .. code-block:: python
+
+        with shelve.open('activities') as content_hashes:
+            activities = strava.iter_vertical(PhysicalActivityVertical)
+            for change in diff_verticals(activities, content_hashes):
+                ...
+
+    :param vertical_objs: the objects fetched from the service. Objects without a
+    ``service_object_id`` (e.g., ``None`` for objects that couldn't be parsed) can't
+    be told apart, so they're ignored.
+    :param content_hashes: maps the keys of the objects synced before to their
+    content hashes. Should only hold objects of the services and verticals that
+    ``vertical_objs`` are fetched from.
+    :param detect_deletions: whether objects in ``content_hashes`` that aren't in
+    ``vertical_objs`` were deleted, which is only the case if every object was
+    fetched (rather than, e.g., the objects created since the last sync).
+
+    :returns: an iterator over the changes. Deletions are yielded once
+    ``vertical_objs`` is exhausted.
+    """
+    seen_keys = set()
+    for vertical_obj in vertical_objs:
+        key = get_dedup_key(vertical_obj)
+        if key is None:
+            continue
+        seen_keys.add(key)
+        content_hash = vertical_obj.content_hash()
+        stored_hash = content_hashes.get(key)
+        if stored_hash == content_hash:
+            continue
+        content_hashes[key] = content_hash
+        yield Change(
+            'inserted' if stored_hash is None else 'updated', key, vertical_obj
+        )
+
+    if not detect_deletions:
+        return
+    for key in [key for key in content_hashes if key not in seen_keys]:
+        del content_hashes[key]
+        yield Change('deleted', key)
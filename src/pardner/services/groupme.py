@@ -1,6 +1,13 @@
 import json
-from collections import defaultdict
-from typing import Any, Iterable, Optional, override
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    Optional,
+    override,
+)
 from urllib.parse import parse_qs, urlparse
 
 from oauthlib.oauth2 import MobileApplicationClient
@@ -9,6 +16,11 @@ from requests_oauthlib import OAuth2Session
 
 from pardner.exceptions import UnsupportedRequestException
 from pardner.services import BaseTransferService
+from pardner.services.async_base import AsyncBaseTransferService
+from pardner.services.mapping import FieldMapping
+from pardner.services.pagination import PageNumberPaginator, PaginatedResource
+from pardner.services.sync import SyncCursor
+from pardner.services.utils import as_str, epoch_to_datetime
 from pardner.verticals import (
     BlockedUserVertical,
     ChatBotVertical,
@@ -18,6 +30,31 @@ from pardner.verticals import (
 )
 from pardner.verticals.sub_verticals import AssociatedMediaSubVertical
 
+if TYPE_CHECKING:
+    import httpx
+
+
+def _as_list(value: Any) -> list[Any]:
+    return [value] if value else []
+
+
+def _as_str_list(value: Any) -> list[str | None]:
+    return [as_str(value)]
+
+
+def _member_user_ids(members: Any) -> list[str | None]:
+    return [
+        as_str(member['user_id'])
+        for member in members or []
+        if isinstance(member, dict) and 'user_id' in member
+    ]
+
+
+def _is_private(conversation_type: Any) -> bool | None:
+    if isinstance(conversation_type, str):
+        return conversation_type == 'private'
+    return None
+
 
 class GroupMeTransferService(BaseTransferService):
     """
@@ -32,7 +69,56 @@ class GroupMeTransferService(BaseTransferService):
 
     _authorization_url = 'https://oauth.groupme.com/oauth/authorize'
     _base_url = 'https://api.groupme.com/v3/'
+    _paginated_resources = {
+        'blocked_user': PaginatedResource('blocks', items_path=('response', 'blocks')),
+        'chat_bot': PaginatedResource('bots', items_path=('response',)),
+        'conversation_direct': PaginatedResource(
+            'chats', PageNumberPaginator(max_page_size=10), items_path=('response',)
+        ),
+        'conversation_group': PaginatedResource(
+            'groups', PageNumberPaginator(max_page_size=10), items_path=('response',)
+        ),
+    }
+    # neither endpoint can filter by date, so older conversations are discarded
+    # after being fetched
+    _sync_cursors = {
+        'conversation_direct': SyncCursor('updated_at'),
+        'conversation_group': SyncCursor('updated_at'),
+    }
     _token_url = 'https://oauth.groupme.com/oauth/authorize'
+    _field_mappings = {
+        'blocked_user': (
+            FieldMapping('creator_user_id', 'user_id', as_str),
+            FieldMapping('data_owner_id', 'user_id', as_str, lazy=False),
+            FieldMapping('blocked_user_id', 'blocked_user_id', as_str),
+            FieldMapping('created_at', 'created_at', epoch_to_datetime),
+        ),
+        'chat_bot': (
+            FieldMapping('service_object_id', 'bot_id', as_str),
+            FieldMapping('creator_user_id', 'user_id', as_str, lazy=False),
+            FieldMapping('data_owner_id', 'user_id', as_str, lazy=False),
+            FieldMapping('name', 'name'),
+        ),
+        'conversation_direct': (
+            FieldMapping('service_object_id', 'id', as_str),
+            FieldMapping(
+                'member_user_ids', ('other_user', 'id'), _as_str_list, lazy=False
+            ),
+            FieldMapping('messages_count', 'messages_count'),
+            FieldMapping('created_at', 'created_at', epoch_to_datetime),
+        ),
+        'conversation_group': (
+            FieldMapping('service_object_id', 'id', as_str),
+            FieldMapping('creator_user_id', 'creator_user_id', as_str),
+            FieldMapping('title', 'name'),
+            FieldMapping('member_user_ids', 'members', _member_user_ids),
+            FieldMapping('members_count', 'members', len, default=()),
+            FieldMapping('messages_count', ('messages', 'count')),
+            FieldMapping('associated_media', 'image_url', _as_list, lazy=False),
+            FieldMapping('created_at', 'created_at', epoch_to_datetime),
+            FieldMapping('is_private', 'type', _is_private),
+        ),
+    }
     _user_id: str | None = None
 
     def __init__(
@@ -54,11 +140,14 @@ class GroupMeTransferService(BaseTransferService):
         self._oAuth2Session = OAuth2Session(
             client=implicit_grant_application_client, redirect_uri=redirect_uri
         )
+        self.transport.mount(self._oAuth2Session, self._base_url)
 
-    @override
-    def _get_resource_from_path(
-        self, path_suffix: str, params: dict[str, Any] = {}
-    ) -> Response:
+    def _token_params(self) -> dict[str, Any]:
+        """
+        :returns: the parameters GroupMe requires to authorize GET requests.
+
+        :raises: :class:`UnsupportedRequestException` if the token hasn't been fetched.
+        """
         access_token = self._oAuth2Session.token.get('access_token')
         if not access_token:
             raise UnsupportedRequestException(
@@ -66,8 +155,27 @@ class GroupMeTransferService(BaseTransferService):
                 'Must send token as a parameter for GET requests. Use fetch_token(...) '
                 'to automatically fetch and send the token.',
             )
+        return {'token': access_token}
+
+    @override
+    def _get_resource_from_path(
+        self, path_suffix: str, params: dict[str, Any] = {}, stream: bool = False
+    ) -> Response:
         return super()._get_resource_from_path(
-            path_suffix, params={'token': access_token, **params}
+            path_suffix, params={**self._token_params(), **params}, stream=stream
+        )
+
+    @override
+    def _iter_raw_items(
+        self,
+        resource: PaginatedResource,
+        request_params: dict[str, Any] = {},
+        limit: Optional[int] = None,
+    ) -> Iterator[Any]:
+        if not self._user_id:
+            self.fetch_user_data()
+        yield from super()._iter_raw_items(
+            resource, {'user': self._user_id, **request_params}, limit
         )
 
     def _fetch_resource_common(
@@ -86,13 +194,10 @@ class GroupMeTransferService(BaseTransferService):
         if not self._user_id:
             self.fetch_user_data()
 
-        return (
-            self._get_resource_from_path(
-                path_suffix, params={'user': self._user_id, **params}
-            )
-            .json()
-            .get('response')
-        )
+        params = {'user': self._user_id, **params}
+        response = self._get_resource_from_path(path_suffix, params)
+        self._archive_response(path_suffix, params, response)
+        return self._decode_json(response).get('response')
 
     @override
     def fetch_token(
@@ -129,14 +234,22 @@ class GroupMeTransferService(BaseTransferService):
 
         :returns: user identifiers and profile data in dictionary format.
         """
-        user_data = (
+        user_data = self._decode_json(
             self._get_resource_from_path('users/me', request_params)
-            .json()
-            .get('response')
-        )
+        ).get('response')
         self._user_id = user_data['id']
         return user_data
 
+    @override
+    def _sync_data_owner_id(self) -> str:
+        if not self._user_id:
+            self.fetch_user_data()
+        return str(self._user_id)
+
+    @override
+    def _parse_state(self) -> dict[str, Any]:
+        return {**super()._parse_state(), '_user_id': self._user_id}
+
     def parse_blocked_user_vertical(self, raw_data: Any) -> BlockedUserVertical | None:
         """
         Given the response from the API request, creates a
@@ -149,13 +262,10 @@ class GroupMeTransferService(BaseTransferService):
         """
         if not isinstance(raw_data, dict):
             return None
-        raw_data_dict = defaultdict(dict, raw_data)
-        return BlockedUserVertical(
-            service=self._service_name,
-            creator_user_id=raw_data_dict.get('user_id'),
-            data_owner_id=raw_data_dict.get('user_id', self._user_id),
-            blocked_user_id=raw_data_dict.get('blocked_user_id'),
-            created_at=raw_data_dict.get('created_at'),
+        fields = self._field_mappers['blocked_user'](raw_data)
+        fields['data_owner_id'] = fields['data_owner_id'] or self._user_id
+        return self._build_model(
+            BlockedUserVertical, service=self._service_name, **fields
         )
 
     def fetch_blocked_user_vertical(
@@ -166,7 +276,7 @@ class GroupMeTransferService(BaseTransferService):
 
         :returns: two elements: the first, a list of :class:`BlockedUserVertical`s
         or ``None``, if unable to parse; the second, the raw response from making the
-        request.
+        request, as retained according to ``raw_retention``.
         """
         blocked_users = self._fetch_resource_common('blocks', request_params)
         if 'blocks' not in blocked_users:
@@ -176,7 +286,7 @@ class GroupMeTransferService(BaseTransferService):
         return [
             self.parse_blocked_user_vertical(blocked_dict)
             for blocked_dict in blocked_users['blocks']
-        ], blocked_users
+        ], self._retain_raw(blocked_users)
 
     def parse_chat_bot_vertical(self, raw_data: Any) -> ChatBotVertical | None:
         """
@@ -190,15 +300,10 @@ class GroupMeTransferService(BaseTransferService):
         """
         if not isinstance(raw_data, dict):
             return None
-        raw_data_dict = defaultdict(dict, raw_data)
-        user_id = raw_data_dict.get('user_id', self._user_id)
-        return ChatBotVertical(
-            service=self._service_name,
-            service_object_id=raw_data_dict.get('bot_id'),
-            creator_user_id=user_id,
-            data_owner_id=user_id,
-            name=raw_data_dict.get('name'),
-        )
+        fields = self._field_mappers['chat_bot'](raw_data)
+        fields['creator_user_id'] = fields['creator_user_id'] or self._user_id
+        fields['data_owner_id'] = fields['data_owner_id'] or self._user_id
+        return self._build_model(ChatBotVertical, service=self._service_name, **fields)
 
     def fetch_chat_bot_vertical(
         self, request_params: dict[str, Any] = {}
@@ -208,17 +313,14 @@ class GroupMeTransferService(BaseTransferService):
 
         :returns: two elements: the first, a list of :class:`ChatBotVertical`s
         or ``None``, if unable to parse; the second, the raw response from making the
-        request.
+        request, as retained according to ``raw_retention``.
         """
         bots_response = self._fetch_resource_common('bots', request_params)
         if not isinstance(bots_response, list):
             raise ValueError(
                 f'Unexpected response format: {json.dumps(bots_response, indent=2)}'
             )
-        return [
-            self.parse_chat_bot_vertical(chat_bot_data)
-            for chat_bot_data in bots_response
-        ], bots_response
+        return self._parse_and_retain(bots_response, self.parse_chat_bot_vertical)
 
     def parse_conversation_direct_vertical(
         self, raw_data: Any
@@ -234,14 +336,13 @@ class GroupMeTransferService(BaseTransferService):
         """
         if not isinstance(raw_data, dict):
             return None
-        raw_data_dict = defaultdict(dict, raw_data)
-        return ConversationDirectVertical(
+        fields = self._field_mappers['conversation_direct'](raw_data)
+        fields['member_user_ids'] = [self._user_id, *fields['member_user_ids']]
+        return self._build_model(
+            ConversationDirectVertical,
             service=self._service_name,
-            service_object_id=raw_data_dict.get('id'),
             data_owner_id=self._user_id,
-            member_user_ids=[self._user_id, raw_data_dict['other_user'].get('id')],
-            messages_count=raw_data_dict.get('messages_count'),
-            created_at=raw_data_dict.get('created_at'),
+            **fields,
         )
 
     def fetch_conversation_direct_vertical(
@@ -253,29 +354,20 @@ class GroupMeTransferService(BaseTransferService):
         include metadata associated with the conversation, but no more than one message
         from the conversation.
 
-        :param count: the number of conversations to fetch. Defaults to 10.
+        :param count: the number of conversations to fetch. Defaults to 10. Counts
+        larger than GroupMe's page size are fetched over several requests.
 
         :returns: two elements: the first, a list of
         :class:`ConversationDirectVertical`s or ``None``, if unable to parse; the
-        second, the raw response from making the request.
+        second, the raw response from making the request, as retained according to
+        ``raw_retention``.
         """
-        if count > 10:
-            raise UnsupportedRequestException(
-                self._service_name,
-                'can only make a request for at most 10 direct conversations at a time.',
-            )
-        conversation_direct_raw_response = self._fetch_resource_common(
-            'chats', params={**request_params, 'per_page': count}
+        return self._parse_and_retain(
+            self._iter_raw_items(
+                self._paginated_resources['conversation_direct'], request_params, count
+            ),
+            self.parse_conversation_direct_vertical,
         )
-        if not isinstance(conversation_direct_raw_response, list):
-            raise ValueError(
-                'Unexpected response format. Expected list, '
-                f'got: {json.dumps(conversation_direct_raw_response, indent=2)}'
-            )
-        return [
-            self.parse_conversation_direct_vertical(conversation_direct_data)
-            for conversation_direct_data in conversation_direct_raw_response
-        ], conversation_direct_raw_response
 
     def parse_conversation_group_vertical(
         self, raw_data: Any
@@ -291,38 +383,16 @@ class GroupMeTransferService(BaseTransferService):
         """
         if not isinstance(raw_data, dict):
             return None
-        raw_data_dict = defaultdict(dict, raw_data)
-
-        members_list = raw_data_dict.get('members', [])
-        member_user_ids = []
-        for member in members_list:
-            if isinstance(member, dict) and 'user_id' in member:
-                member_user_ids.append(member['user_id'])
-
-        associated_media = []
-        image_url = raw_data_dict.get('image_url', None)
-        if image_url:
-            associated_media = [
-                AssociatedMediaSubVertical(media_type='image', url=image_url)
-            ]
-
-        is_private = None
-        conversation_type = raw_data_dict.get('type')
-        if isinstance(conversation_type, str):
-            is_private = conversation_type == 'private'
-
-        return ConversationGroupVertical(
+        fields = self._field_mappers['conversation_group'](raw_data)
+        fields['associated_media'] = [
+            self._build_model(AssociatedMediaSubVertical, media_type='image', url=url)
+            for url in fields['associated_media']
+        ]
+        return self._build_model(
+            ConversationGroupVertical,
             service=self._service_name,
-            service_object_id=raw_data_dict.get('id'),
             data_owner_id=self._user_id,
-            creator_user_id=raw_data_dict.get('creator_user_id'),
-            title=raw_data_dict.get('name'),
-            member_user_ids=member_user_ids,
-            members_count=len(members_list),
-            messages_count=raw_data_dict['messages'].get('count'),
-            associated_media=associated_media,
-            created_at=raw_data_dict.get('created_at'),
-            is_private=is_private,
+            **fields,
         )
 
     def fetch_conversation_group_vertical(
@@ -333,26 +403,56 @@ class GroupMeTransferService(BaseTransferService):
         a part of. The response will include metadata associated with the conversation,
         but no more than one message from the conversation.
 
-        :param count: the number of conversations to fetch. Defaults to 10.
+        :param count: the number of conversations to fetch. Defaults to 10. Counts
+        larger than GroupMe's page size are fetched over several requests.
 
         :returns: two elements: the first, a list of
         :class:`ConversationGroupVertical`s or ``None``, if unable to parse; the
-        second, the raw response from making the request.
+        second, the raw response from making the request, as retained according to
+        ``raw_retention``.
         """
-        if count > 10:
-            raise UnsupportedRequestException(
-                self._service_name,
-                'can only make a request for at most 10 group conversations at a time.',
-            )
-        conversation_group_raw_response = self._fetch_resource_common(
-            'groups', params={**request_params, 'per_page': count}
+        return self._parse_and_retain(
+            self._iter_raw_items(
+                self._paginated_resources['conversation_group'], request_params, count
+            ),
+            self.parse_conversation_group_vertical,
         )
-        if not isinstance(conversation_group_raw_response, list):
-            raise ValueError(
-                'Unexpected response format. Expected list, '
-                f'got: {json.dumps(conversation_group_raw_response, indent=2)}'
-            )
-        return [
-            self.parse_conversation_group_vertical(conversation_group_data)
-            for conversation_group_data in conversation_group_raw_response
-        ], conversation_group_raw_response
+
+
+class AsyncGroupMeTransferService(AsyncBaseTransferService, GroupMeTransferService):
+    """
+    Asynchronous counterpart of :class:`GroupMeTransferService`. Data is fetched using
+    :meth:`aiter_vertical` and :meth:`afetch`.
+    """
+
+    @override
+    async def _aget_resource_from_path(
+        self, path_suffix: str, params: dict[str, Any] = {}
+    ) -> 'httpx.Response':
+        return await super()._aget_resource_from_path(
+            path_suffix, params={**self._token_params(), **params}
+        )
+
+    @override
+    async def _aiter_raw_items(
+        self,
+        resource: PaginatedResource,
+        request_params: dict[str, Any] = {},
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[Any]:
+        if not self._user_id:
+            await self.afetch_user_data()
+        async for raw_item in super()._aiter_raw_items(
+            resource, {'user': self._user_id, **request_params}, limit
+        ):
+            yield raw_item
+
+    async def afetch_user_data(self, request_params: dict[str, Any] = {}) -> Any:
+        """
+        Asynchronous counterpart of :meth:`fetch_user_data`.
+        """
+        user_data = self._decode_json(
+            await self._aget_resource_from_path('users/me', request_params)
+        ).get('response')
+        self._user_id = user_data['id']
+        return user_data
@@ -0,0 +1,127 @@
+from typing import Any, Callable, Iterable, NamedTuple
+
+FieldGetter = Callable[[dict[str, Any]], Any]
+FieldMapper = Callable[[dict[str, Any]], dict[str, Any]]
+
+
+class FieldMapping(NamedTuple):
+    """
+    Declares how one field of a vertical is extracted from a raw item returned by a
+    service's API, see :func:`compile_field_mappings`.
+
+    ``source`` is the path to the value in the raw item: a key, or a tuple of keys
+    (for dictionaries) and indices (for lists), e.g., ``('athlete', 'id')`` or
+    ``('start_latlng', 0)``. An empty tuple passes the whole raw item to ``convert``,
+    for fields computed from several values. If the path can't be followed,
+    ``default`` is used. ``convert``, if given, is then applied to the value.
+
+    ``lazy`` is ``False`` for fields the parser still transforms after mapping (e.g.,
+    media URLs it turns into sub-verticals), which can't be read from the mapped value
+    alone.
+    """
+
+    target: str
+    source: str | tuple[str | int, ...]
+    convert: Callable[[Any], Any] | None = None
+    default: Any = None
+    lazy: bool = True
+
+
+def _compile_lookup(
+    field_mapping: FieldMapping, index: int, namespace: dict[str, Any]
+) -> list[str]:
+    """
+    :returns: the lines of code setting ``_v<index>`` to the value of the field
+    described by ``field_mapping``, adding the objects they refer to to ``namespace``.
+
+    :raises: :class:`ValueError` if the path doesn't start with a key.
+    """
+    value, default = f'_v{index}', f'_d{index}'
+    namespace[default] = field_mapping.default
+    path = (
+        field_mapping.source
+        if isinstance(field_mapping.source, tuple)
+        else (field_mapping.source,)
+    )
+    lines = []
+    if not path:
+        lines.append(f'    {value} = raw')
+    elif not isinstance(path[0], str):
+        raise ValueError(
+            f'The source of {field_mapping.target} must start with a key, got: {path!r}'
+        )
+    else:
+        lines.append(f'    {value} = raw.get({path[0]!r}, {default})')
+    for step in path[1:]:
+        if isinstance(step, int):
+            lines.append(
+                f'    {value} = {value}[{step}] if isinstance({value}, list) '
+                f'and len({value}) > {step} else {default}'
+            )
+        else:
+            lines.append(
+                f'    {value} = {value}.get({step!r}, {default}) '
+                f'if isinstance({value}, dict) else {default}'
+            )
+    if field_mapping.convert:
+        namespace[f'_c{index}'] = field_mapping.convert
+        lines.append(f'    {value} = _c{index}({value})')
+    return lines
+
+
+def _compile_function(name: str, lines: list[str], namespace: dict[str, Any]) -> Any:
+    exec('\n'.join([f'def {name}(raw):', *lines]), namespace)
+    return namespace[name]
+
+
+def compile_field_mappings(
+    field_mappings: Iterable[FieldMapping], name: str = 'map_fields'
+) -> FieldMapper:
+    """
+    Compiles ``field_mappings`` into a function specialized for them, which takes a
+    raw item (a dictionary) and returns the fields of the vertical as a dictionary.
+    The paths are unrolled into plain lookups, so no per-item work is spent
+    interpreting the mappings.
+
+    :param field_mappings: the mappings of the fields of one vertical.
+    :param name: the name of the compiled function, which shows up in tracebacks.
+
+    :returns: the compiled function.
+
+    :raises: :class:`ValueError` if a path doesn't start with a key.
+    """
+    namespace: dict[str, Any] = {}
+    lines = []
+    targets = []
+    for index, field_mapping in enumerate(field_mappings):
+        lines.extend(_compile_lookup(field_mapping, index, namespace))
+        targets.append(f'{field_mapping.target!r}: _v{index}')
+    lines.append(f'    return {{{", ".join(targets)}}}')
+    field_mapper: FieldMapper = _compile_function(name, lines, namespace)
+    return field_mapper
+
+
+def compile_field_getters(
+    field_mappings: Iterable[FieldMapping], name_prefix: str = 'get'
+) -> dict[str, FieldGetter]:
+    """
+    Compiles each of ``field_mappings`` whose value is final (see
+    :attr:`FieldMapping.lazy`) into its own function, which takes a raw item and
+    returns the value of that field only. Used to read fields lazily, see
+    :class:`LazyVertical`.
+
+    :returns: maps the name of each field to its compiled function.
+
+    :raises: :class:`ValueError` if a path doesn't start with a key.
+    """
+    field_getters = {}
+    for field_mapping in field_mappings:
+        if not field_mapping.lazy:
+            continue
+        namespace: dict[str, Any] = {}
+        lines = _compile_lookup(field_mapping, 0, namespace)
+        lines.append('    return _v0')
+        field_getters[field_mapping.target] = _compile_function(
+            f'{name_prefix}_{field_mapping.target}', lines, namespace
+        )
+    return field_getters
@@ -0,0 +1,185 @@
+from abc import ABC, abstractmethod
+from typing import Any, Callable, NamedTuple, Optional
+
+
+class BasePaginator(ABC):
+    """
+    A base class for the cursor styles used by services to split a collection of
+    resources across several responses. Given the parameters of the request that was
+    just made and what it returned, a paginator computes the parameters of the request
+    for the next page.
+    """
+
+    max_page_size: int
+    page_size_param: str
+
+    def __init__(self, max_page_size: int, page_size_param: str = 'per_page') -> None:
+        """
+        :param max_page_size: the largest number of items the service returns in a
+        single page.
+        :param page_size_param: the name of the request parameter that sets the number
+        of items per page.
+        """
+        self.max_page_size = max_page_size
+        self.page_size_param = page_size_param
+
+    def initial_params(self, page_size: int) -> dict[str, Any]:
+        """
+        :param page_size: the number of items to request in each page.
+
+        :returns: the parameters to send with the request for the first page.
+        """
+        return {self.page_size_param: page_size}
+
+    def is_last_page(self, params: dict[str, Any], item_count: int) -> bool:
+        """
+        :param params: the parameters sent with the request for the current page.
+        :param item_count: the number of items returned in the current page.
+
+        :returns: ``True`` if there are no more pages to request, ``False`` otherwise.
+        """
+        page_size = params.get(self.page_size_param, self.max_page_size)
+        return item_count == 0 or item_count < int(page_size)
+
+    def next_params(
+        self, params: dict[str, Any], item_count: int, last_item: Any
+    ) -> dict[str, Any] | None:
+        """
+        :param params: the parameters sent with the request for the current page.
+        :param item_count: the number of items returned in the current page.
+        :param last_item: the last raw item of the current page.
+
+        :returns: the parameters for requesting the next page, or ``None`` if the
+        current page was the last one.
+        """
+        if self.is_last_page(params, item_count):
+            return None
+        return self._advance(params, item_count, last_item)
+
+    @abstractmethod
+    def _advance(
+        self, params: dict[str, Any], item_count: int, last_item: Any
+    ) -> dict[str, Any] | None:
+        pass
+
+
+class PageNumberPaginator(BasePaginator):
+    """Pages are requested by number (e.g., ``page=1``, ``page=2``, ...)."""
+
+    def __init__(
+        self,
+        max_page_size: int,
+        page_size_param: str = 'per_page',
+        page_param: str = 'page',
+        first_page: int = 1,
+    ) -> None:
+        super().__init__(max_page_size, page_size_param)
+        self.page_param = page_param
+        self.first_page = first_page
+
+    def initial_params(self, page_size: int) -> dict[str, Any]:
+        return {**super().initial_params(page_size), self.page_param: self.first_page}
+
+    def _advance(
+        self, params: dict[str, Any], item_count: int, last_item: Any
+    ) -> dict[str, Any] | None:
+        return {**params, self.page_param: int(params[self.page_param]) + 1}
+
+
+class OffsetPaginator(BasePaginator):
+    """Pages are requested by the number of items to skip (e.g., ``offset=20``)."""
+
+    def __init__(
+        self,
+        max_page_size: int,
+        page_size_param: str = 'limit',
+        offset_param: str = 'offset',
+    ) -> None:
+        super().__init__(max_page_size, page_size_param)
+        self.offset_param = offset_param
+
+    def _advance(
+        self, params: dict[str, Any], item_count: int, last_item: Any
+    ) -> dict[str, Any] | None:
+        return {
+            **params,
+            self.offset_param: int(params.get(self.offset_param, 0)) + item_count,
+        }
+
+
+class BeforeIdPaginator(BasePaginator):
+    """
+    Pages are requested relative to the id of the last item seen (e.g.,
+    ``before_id=1234``), which is stable even if new items are created while paging.
+    """
+
+    def __init__(
+        self,
+        max_page_size: int,
+        page_size_param: str = 'limit',
+        id_param: str = 'before_id',
+        id_key: str = 'id',
+    ) -> None:
+        super().__init__(max_page_size, page_size_param)
+        self.id_param = id_param
+        self.id_key = id_key
+
+    def _advance(
+        self, params: dict[str, Any], item_count: int, last_item: Any
+    ) -> dict[str, Any] | None:
+        if not isinstance(last_item, dict) or last_item.get(self.id_key) is None:
+            return None
+        return {**params, self.id_param: last_item[self.id_key]}
+
+
+class TimestampPaginator(BasePaginator):
+    """
+    Pages are requested relative to the timestamp of the last item seen (e.g.,
+    ``before=1525263309``).
+    """
+
+    def __init__(
+        self,
+        max_page_size: int,
+        timestamp_key: str,
+        page_size_param: str = 'per_page',
+        timestamp_param: str = 'before',
+        convert_timestamp: Optional[Callable[[Any], Any]] = None,
+    ) -> None:
+        """
+        :param timestamp_key: the key of the timestamp in each raw item.
+        :param timestamp_param: the name of the request parameter the timestamp of
+        the last item is sent as.
+        :param convert_timestamp: optionally, a function converting the timestamp found
+        in the raw item to the format expected by the request parameter.
+        """
+        super().__init__(max_page_size, page_size_param)
+        self.timestamp_key = timestamp_key
+        self.timestamp_param = timestamp_param
+        self.convert_timestamp = convert_timestamp
+
+    def _advance(
+        self, params: dict[str, Any], item_count: int, last_item: Any
+    ) -> dict[str, Any] | None:
+        if not isinstance(last_item, dict) or last_item.get(self.timestamp_key) is None:
+            return None
+        timestamp = last_item[self.timestamp_key]
+        if self.convert_timestamp:
+            timestamp = self.convert_timestamp(timestamp)
+        return {**params, self.timestamp_param: timestamp}
+
+
+class PaginatedResource(NamedTuple):
+    """
+    Describes the endpoint from which a vertical is fetched: its ``path_suffix``
+    relative to the base URL of the service, the ``paginator`` used to request
+    subsequent pages (``None`` if the endpoint isn't paginated) and the
+    ``items_path``, i.e., the keys leading to the list of raw items in the JSON
+    response. ``default_params`` are sent with every request to the endpoint, unless
+    overridden by the caller's request parameters.
+    """
+
+    path_suffix: str
+    paginator: BasePaginator | None = None
+    items_path: tuple[str, ...] = ()
+    default_params: dict[str, Any] = {}
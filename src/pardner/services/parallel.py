@@ -0,0 +1,135 @@
+import os
+import random
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from itertools import islice
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional, Self
+
+from pardner.verticals import Vertical
+
+if TYPE_CHECKING:
+    from pardner.services.base import BaseTransferService
+
+
+def _parse_chunk(
+    service_class: type['BaseTransferService'],
+    parse_state: dict[str, Any],
+    vertical: Vertical,
+    raw_items: list[Any],
+) -> list[Any]:
+    """
+    Parses ``raw_items`` in a worker process. Services hold sessions and locks that
+    can't be pickled, so a bare instance of ``service_class`` is rebuilt from the
+    attributes its parsers need (see :meth:`BaseTransferService._parse_state`).
+    """
+    service = object.__new__(service_class)
+    service.__dict__.update(parse_state)
+    return [service._parse_raw_item(vertical, raw_item) for raw_item in raw_items]
+
+
+def _seed_worker() -> None:
+    """
+    Reseeds ``random`` in a new worker process, so that workers don't share the
+    state of the parent and sample different items for validation (see
+    ``validation_sample_rate``), however their processes are started.
+    """
+    random.seed()
+
+
+class ParseExecutor:
+    """
+    Parses raw items into verticals in a pool of processes, so that parsing large
+    backfills isn't limited to the one core running the requests. Raw items are sent
+    to the workers in chunks of ``chunk_size`` and the parsed verticals are yielded in
+    the order of the raw items, as soon as their chunk is parsed.
+
+    .. code-block:: python
+
+        with ParseExecutor() as parse_executor:
+            strava.parse_executor = parse_executor
+            for activity in strava.iter_vertical(PhysicalActivityVertical):
+                ...
+    """
+
+    chunk_size: int
+    max_pending_chunks: int
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        chunk_size: int = 500,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        """
+        :param max_workers: the number of worker processes. Defaults to the number of
+        CPUs.
+        :param chunk_size: the number of raw items sent to a worker at once.
+        :param executor: the executor to use instead of a new
+        :class:`ProcessPoolExecutor`, e.g., one shared with other work.
+        """
+        max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        # bounds the memory used by raw items waiting to be parsed
+        self.max_pending_chunks = 2 * max_workers
+        self._executor = executor or ProcessPoolExecutor(
+            max_workers, initializer=_seed_worker
+        )
+        self._owns_executor = executor is None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shuts the worker processes down, unless the executor was given."""
+        if self._owns_executor:
+            self._executor.shutdown()
+
+    def map(
+        self,
+        service: 'BaseTransferService',
+        vertical: Vertical,
+        raw_items: Iterable[Any],
+    ) -> Iterator[Any]:
+        """
+        :param service: the service the raw items were fetched from.
+        :param vertical: the :class:`Vertical` the raw items are parsed into.
+        :param raw_items: the raw items, consumed as chunks are sent to the workers.
+        Only the first chunk is read before the first vertical is yielded; each
+        further chunk is read after a vertical is yielded, with up to
+        ``max_pending_chunks`` chunks being parsed at once.
+
+        :returns: an iterator over the parsed verticals, in the order of
+        ``raw_items``.
+        """
+        parse_state = service._parse_state()
+        raw_items_iter = iter(raw_items)
+        pending: deque[Future[list[Any]]] = deque()
+        is_exhausted = False
+
+        def submit_chunk() -> None:
+            nonlocal is_exhausted
+            chunk = list(islice(raw_items_iter, self.chunk_size))
+            if not chunk:
+                is_exhausted = True
+                return
+            pending.append(
+                self._executor.submit(
+                    _parse_chunk, type(service), parse_state, vertical, chunk
+                )
+            )
+
+        submit_chunk()
+        while pending:
+            for vertical_obj in pending.popleft().result():
+                yield vertical_obj
+                if not is_exhausted and len(pending) < self.max_pending_chunks:
+                    submit_chunk()
@@ -0,0 +1,81 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Generic, TypeVar
+
+from pardner.services.base import BaseTransferService
+
+TransferService = TypeVar('TransferService', bound=BaseTransferService)
+
+
+class TransferServicePool(Generic[TransferService]):
+    """
+    A thread-safe, least-recently-used pool of transfer services, one per user, keyed
+    by the user's access token. Useful for serving many users from a single process:
+    services are reused while their user is active and dropped once ``maxsize`` other
+    users have been served more recently. Since services share their connection pools
+    (see :class:`SharedTransport`), the number of open connections doesn't grow with
+    the number of users.
+
+    .. code-block:: python
+
+        pool = TransferServicePool(
+            lambda: StravaTransferService(client_id, client_secret, redirect_uri)
+        )
+        activities = pool.get(token).fetch_physical_activity_vertical()
+    """
+
+    maxsize: int
+
+    def __init__(
+        self, factory: Callable[[], TransferService], maxsize: int = 1024
+    ) -> None:
+        """
+        :param factory: called without arguments to create a service when a new token
+        is seen.
+        :param maxsize: the maximum number of services kept in the pool.
+        """
+        self.maxsize = maxsize
+        self._factory = factory
+        self._services: OrderedDict[str, TransferService] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, access_token: str) -> bool:
+        return access_token in self._services
+
+    def __len__(self) -> int:
+        return len(self._services)
+
+    def get(self, token: dict[str, Any]) -> TransferService:
+        """
+        :param token: the token of the user, as returned by ``fetch_token``. Must
+        contain an ``access_token``.
+
+        :returns: the service for the user ``token`` belongs to, creating it if
+        necessary.
+
+        :raises: :class:`ValueError` if ``token`` has no ``access_token``.
+        """
+        access_token = token.get('access_token')
+        if not access_token:
+            raise ValueError('Cannot pool a transfer service without an access token.')
+
+        with self._lock:
+            service = self._services.get(access_token)
+            if service is not None:
+                self._services.move_to_end(access_token)
+                return service
+
+            service = self._factory()
+            service.token = token
+            self._services[access_token] = service
+            if len(self._services) > self.maxsize:
+                self._services.popitem(last=False)
+            return service
+
+    def evict(self, access_token: str) -> None:
+        """
+        Removes the service for ``access_token`` from the pool, e.g., after the token
+        has been revoked.
+        """
+        with self._lock:
+            self._services.pop(access_token, None)
@@ -0,0 +1,251 @@
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Mapping, Optional
+
+
+class TokenBucket:
+    """
+    A token bucket holding up to ``capacity`` tokens, refilled continuously at a rate
+    of ``capacity`` tokens per ``period`` seconds. Each request consumes one token.
+    Once the service reports its quota is used up, the bucket stays empty until the
+    quota window resets (see :meth:`update`). Not thread-safe on its own, see
+    :class:`RateLimiter`.
+    """
+
+    capacity: float
+    period: float
+    tokens: float
+
+    def __init__(
+        self,
+        capacity: float,
+        period: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        :param capacity: the number of requests allowed per ``period``.
+        :param period: the length of the quota window, in seconds.
+        :param clock: returns the current time, in seconds.
+        """
+        self.capacity = capacity
+        self.period = period
+        self.tokens = capacity
+        self._clock = clock
+        self._last_refill = clock()
+        self._empty_until: Optional[float] = None
+
+    def _refill(self) -> None:
+        now = self._clock()
+        if self._empty_until is not None:
+            if now < self._empty_until:
+                self._last_refill = now
+                return
+            # the window was reset, so the whole quota is available again
+            self._empty_until = None
+            self._last_refill = now
+            self.tokens = self.capacity
+            return
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self.tokens = min(
+            self.capacity, self.tokens + elapsed * self.capacity / self.period
+        )
+
+    def wait_time(self) -> float:
+        """
+        :returns: the number of seconds until a token is available. ``0`` if one
+        already is.
+        """
+        self._refill()
+        if self._empty_until is not None:
+            return self._empty_until - self._clock()
+        if self.tokens >= 1:
+            return 0
+        return (1 - self.tokens) * self.period / self.capacity
+
+    def consume(self) -> None:
+        self._refill()
+        self.tokens -= 1
+
+    def update(
+        self, limit: float, remaining: float, reset_in: Optional[float] = None
+    ) -> None:
+        """
+        Synchronizes the bucket with the quota reported by the service, which accounts
+        for requests made by other processes using the same application.
+
+        :param limit: the number of requests allowed per ``period``.
+        :param remaining: the number of requests left in the current window.
+        :param reset_in: the number of seconds until the current window resets, if
+        known. If no requests are left, the bucket stays empty until then, rather
+        than refilling continuously.
+        """
+        self._refill()
+        self.capacity = limit
+        self.tokens = min(self.tokens, max(remaining, 0))
+        if remaining <= 0 and reset_in is not None:
+            self.tokens = 0
+            self._empty_until = self._clock() + max(reset_in, 0)
+
+    def drain(self) -> None:
+        self._refill()
+        self.tokens = min(self.tokens, 0)
+
+
+class RateLimiter:
+    """
+    Thread-safe rate limiter combining one :class:`TokenBucket` per quota window of a
+    service (e.g., Strava has a 15-minute and a daily quota). A request can only be
+    sent once every window has a token available.
+    """
+
+    buckets: dict[str, TokenBucket]
+
+    def __init__(
+        self,
+        windows: Mapping[str, tuple[float, float]],
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        :param windows: maps the name of each quota window to the number of requests
+        allowed in it and its length in seconds.
+        :param clock: returns the current time, in seconds.
+        """
+        self.buckets = {
+            name: TokenBucket(limit, period, clock)
+            for name, (limit, period) in windows.items()
+        }
+        self._clock = clock
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> float:
+        """
+        Consumes a token from every window if all have one available.
+
+        :returns: ``0`` if the request can be sent right away, otherwise the number of
+        seconds to wait before trying again.
+        """
+        with self._lock:
+            wait_time = max(
+                [self._paused_until - self._clock()]
+                + [bucket.wait_time() for bucket in self.buckets.values()]
+            )
+            if wait_time > 0:
+                return wait_time
+            for bucket in self.buckets.values():
+                bucket.consume()
+            return 0
+
+    def acquire(self, sleep: Optional[Callable[[float], None]] = None) -> None:
+        """
+        Blocks until a request can be sent.
+
+        :param sleep: called with the number of seconds to wait. Defaults to
+        :func:`time.sleep`.
+        """
+        while wait_time := self.try_acquire():
+            (sleep or time.sleep)(wait_time)
+
+    def update(
+        self,
+        window: str,
+        limit: float,
+        remaining: float,
+        reset_in: Optional[float] = None,
+    ) -> None:
+        """
+        Synchronizes ``window`` with the quota reported by the service. Windows that
+        weren't declared are ignored. See :meth:`TokenBucket.update`.
+        """
+        with self._lock:
+            if window in self.buckets:
+                self.buckets[window].update(limit, remaining, reset_in)
+
+    def pause(self, seconds: Optional[float] = None) -> None:
+        """
+        Holds back every request, e.g., after the service reported the quota was
+        exceeded.
+
+        :param seconds: how long to hold requests back for. If ``None``, requests are
+        held back until every window has refilled by one token.
+        """
+        with self._lock:
+            if seconds is not None:
+                self._paused_until = max(self._paused_until, self._clock() + seconds)
+                return
+            for bucket in self.buckets.values():
+                bucket.drain()
+
+
+_rate_limiters: dict[str, RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(
+    key: str, windows: Mapping[str, tuple[float, float]]
+) -> RateLimiter:
+    """
+    :param key: identifies the quota being limited, e.g., the service and the client
+    ID of the application.
+    :param windows: the quota windows, used if the rate limiter doesn't exist yet. See
+    :class:`RateLimiter`.
+
+    :returns: the rate limiter for ``key``, shared by the whole process.
+    """
+    with _rate_limiters_lock:
+        if key not in _rate_limiters:
+            _rate_limiters[key] = RateLimiter(windows)
+        return _rate_limiters[key]
+
+
+def seconds_until_window_reset(
+    period: float, now: Callable[[], float] = time.time
+) -> float:
+    """
+    :param period: the length of a quota window that resets at fixed times, every
+    ``period`` seconds since the Unix epoch (e.g., every 15 minutes past the hour, or
+    at midnight UTC for daily windows).
+    :param now: returns the current Unix time.
+
+    :returns: the number of seconds until the window resets.
+    """
+    return period - now() % period
+
+
+def parse_header_numbers(value: object) -> list[float]:
+    """
+    :param value: the value of a header holding one or more comma-separated numbers,
+    e.g., ``'100,1000'``.
+
+    :returns: the numbers in ``value``, or an empty list if it couldn't be parsed.
+    """
+    if not isinstance(value, str):
+        return []
+    try:
+        return [float(number) for number in value.split(',')]
+    except ValueError:
+        return []
+
+
+def parse_retry_after(value: object) -> float | None:
+    """
+    :param value: the value of a ``Retry-After`` header, either a number of seconds or
+    an HTTP date.
+
+    :returns: the number of seconds to wait before retrying, or ``None`` if ``value``
+    couldn't be parsed.
+    """
+    if not isinstance(value, str):
+        return None
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0)
@@ -0,0 +1,121 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+import zlib
+from typing import Any, Iterable, Literal, NamedTuple, Optional
+
+RawRetention = Literal['keep', 'drop', 'spill']
+
+# a gzip (rather than raw deflate) stream, so that spilled records can be inspected
+# with standard tools
+_GZIP_WBITS = 31
+
+
+class SpilledRaw(NamedTuple):
+    """
+    A handle to a raw response written to a :class:`RawSpill`, in place of the
+    response itself.
+    """
+
+    path: str
+    offset: int
+    length: int
+
+    def load(self) -> Any:
+        """
+        :returns: the raw response, read back from disk.
+        """
+        with open(self.path, 'rb') as spill_file:
+            spill_file.seek(self.offset)
+            compressed = spill_file.read(self.length)
+        return json.loads(zlib.decompress(compressed, _GZIP_WBITS))
+
+
+class RawSpill:
+    """
+    An append-only, gzip-compressed file holding the raw responses of a service when
+    its ``raw_retention`` is ``'spill'``. Each response is written as its own gzip
+    member, so it can be read back on its own through the :class:`SpilledRaw` handle
+    returned when writing it.
+
+    Items are compressed to a buffer of their own as they're consumed, and only the
+    finished member is appended to the file, under a lock, so a spill can be shared by
+    several services fetching at once.
+    """
+
+    # the size above which a member being compressed is buffered on disk rather than
+    # in memory
+    MAX_BUFFERED_SIZE = 1024 * 1024
+
+    path: str
+
+    def __init__(self, path: Optional[str] = None, compresslevel: int = 6) -> None:
+        """
+        :param path: the file to append the responses to. Defaults to a new temporary
+        file, which is deleted when the spill is closed.
+        :param compresslevel: the zlib compression level, from 1 (fastest) to 9.
+        """
+        self._delete_on_close = path is None
+        if path is None:
+            file_descriptor, path = tempfile.mkstemp(
+                prefix='pardner-raw-', suffix='.gz'
+            )
+            os.close(file_descriptor)
+        self.path = path
+        self.compresslevel = compresslevel
+        self._file = open(path, 'ab')
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        """Closes the file, deleting it if it's temporary."""
+        self._file.close()
+        if self._delete_on_close:
+            os.remove(self.path)
+
+    def write(self, raw: Any) -> SpilledRaw:
+        """
+        :param raw: the raw response, which must be serializable to JSON.
+
+        :returns: the handle to read ``raw`` back.
+        """
+        return self.write_items([raw], as_list=False)
+
+    def write_items(self, raw_items: Iterable[Any], as_list: bool = True) -> SpilledRaw:
+        """
+        Compresses each of ``raw_items`` as it's consumed, so that they don't need to
+        be held in memory at once. Nothing is written to the file if consuming
+        ``raw_items`` fails.
+
+        :param raw_items: the raw items, which must be serializable to JSON.
+        :param as_list: if ``True``, the items are stored as a list. Otherwise,
+        ``raw_items`` must hold exactly one item, which is stored as is.
+
+        :returns: the handle to read the items back.
+        """
+        with tempfile.SpooledTemporaryFile(self.MAX_BUFFERED_SIZE) as member:
+            compressor = zlib.compressobj(
+                self.compresslevel, zlib.DEFLATED, _GZIP_WBITS
+            )
+            separator = b'[' if as_list else b''
+            for raw_item in raw_items:
+                member.write(compressor.compress(separator))
+                member.write(compressor.compress(json.dumps(raw_item).encode()))
+                separator = b','
+            if as_list:
+                member.write(compressor.compress(b'[]' if separator == b'[' else b']'))
+            member.write(compressor.flush())
+            length = member.tell()
+            member.seek(0)
+
+            with self._lock:
+                offset = self._file.seek(0, os.SEEK_END)
+                try:
+                    shutil.copyfileobj(member, self._file)
+                    self._file.flush()
+                except BaseException:
+                    # drops the partial member, which would break reading the file
+                    self._file.truncate(offset)
+                    raise
+        return SpilledRaw(self.path, offset, length)
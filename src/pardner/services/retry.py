@@ -0,0 +1,101 @@
+import random
+from typing import Optional
+
+
+class RetryPolicy:
+    """
+    Decides whether a failed request should be retried and how long to wait before
+    doing so. Waits grow exponentially with each attempt, with random jitter so that
+    many workers failing at once don't retry in lockstep. When the service says how
+    long to wait (via a ``Retry-After`` header), that is used instead.
+
+    Only idempotent requests (i.e., ``GET``, ``HEAD`` and ``OPTIONS``) are retried.
+    """
+
+    max_retries: int
+    backoff_factor: float
+    max_backoff: float
+    max_retry_after: float
+    jitter: bool
+    retry_statuses: frozenset[int]
+    retry_methods: frozenset[str]
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 60,
+        max_retry_after: float = 300,
+        jitter: bool = True,
+        retry_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504}),
+    ) -> None:
+        """
+        :param max_retries: the maximum number of times a request is retried. ``0``
+        disables retries.
+        :param backoff_factor: the wait before the first retry, in seconds. Doubles on
+        each subsequent retry.
+        :param max_backoff: the longest wait between two attempts, in seconds.
+        :param max_retry_after: the longest ``Retry-After`` the policy is willing to
+        wait for, in seconds. Longer waits (e.g., for a daily quota) are left to the
+        caller.
+        :param jitter: whether or not waits are randomized.
+        :param retry_statuses: the response status codes that are worth retrying.
+        """
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.jitter = jitter
+        self.retry_statuses = retry_statuses
+        self.retry_methods = frozenset({'GET', 'HEAD', 'OPTIONS'})
+
+    def is_retryable(self, method: str, status_code: Optional[int] = None) -> bool:
+        """
+        :param method: the HTTP method of the request.
+        :param status_code: the status code of the response, or ``None`` if the
+        request failed without a response (e.g., the connection was reset).
+
+        :returns: whether the failure is transient and the request safe to repeat.
+        """
+        if method.upper() not in self.retry_methods:
+            return False
+        return status_code is None or status_code in self.retry_statuses
+
+    def should_retry(
+        self,
+        method: str,
+        retries: int,
+        status_code: Optional[int] = None,
+        retry_after: Optional[float] = None,
+    ) -> bool:
+        """
+        :param method: the HTTP method of the request.
+        :param retries: the number of times the request has been retried so far.
+        :param status_code: the status code of the response, or ``None`` if the
+        request failed without a response.
+        :param retry_after: the wait requested by the service, in seconds, if any.
+
+        :returns: whether the request should be retried.
+        """
+        return (
+            retries < self.max_retries
+            and self.is_retryable(method, status_code)
+            and (retry_after is None or retry_after <= self.max_retry_after)
+        )
+
+    def backoff(self, retries: int, retry_after: Optional[float] = None) -> float:
+        """
+        :param retries: the number of times the request has been retried so far.
+        :param retry_after: the wait requested by the service, in seconds, if any.
+
+        :returns: the number of seconds to wait before the next attempt.
+        """
+        if retry_after is not None:
+            return retry_after
+        delay = min(self.max_backoff, self.backoff_factor * 2.0**retries)
+        if self.jitter:
+            delay = random.uniform(delay / 2, delay)
+        return delay
+
+
+NO_RETRIES = RetryPolicy(max_retries=0)
@@ -1,15 +1,84 @@
-from collections import defaultdict
-from datetime import datetime, timedelta
-from typing import Any, Iterable, Literal, Optional, override
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterable, Iterator, Literal, Mapping, Optional, override
 from urllib.parse import urljoin
 
-from pardner.exceptions import UnsupportedRequestException, UnsupportedVerticalException
+from pydantic import AnyHttpUrl
+
+from pardner.exceptions import UnsupportedVerticalException
 from pardner.services import BaseTransferService
-from pardner.services.utils import scope_as_set, scope_as_string
+from pardner.services.async_base import AsyncBaseTransferService
+from pardner.services.mapping import FieldMapping
+from pardner.services.pagination import PageNumberPaginator, PaginatedResource
+from pardner.services.rate_limit import parse_header_numbers, seconds_until_window_reset
+from pardner.services.sync import SyncCursor
+from pardner.services.utils import as_str, scope_as_set, scope_as_string
 from pardner.verticals import PhysicalActivityVertical, SocialPostingVertical, Vertical
 from pardner.verticals.sub_verticals import AssociatedMediaSubVertical
 
 
+def _start_date_to_epoch(start_date: str) -> int:
+    return int(
+        datetime.strptime(start_date, '%Y-%m-%dT%H:%M:%SZ')
+        .replace(tzinfo=timezone.utc)
+        .timestamp()
+    )
+
+
+def _parse_datetime(raw_datetime: str | None) -> datetime | None:
+    if raw_datetime:
+        return datetime.strptime(raw_datetime, '%Y-%m-%dT%H:%M:%SZ')
+    return None
+
+
+def _end_datetime(raw_activity: dict[str, Any]) -> datetime | None:
+    start_datetime = _parse_datetime(raw_activity.get('start_date'))
+    duration_s = raw_activity.get('elapsed_time')
+    if start_datetime and duration_s:
+        return start_datetime + timedelta(seconds=duration_s)
+    return None
+
+
+def _activity_url(activity_id: Any) -> AnyHttpUrl:
+    # converted like validation would, so lazy and full objects hold the same type
+    return AnyHttpUrl(urljoin('https://www.strava.com/activities/', str(activity_id)))
+
+
+def _interaction_count(raw_activity: dict[str, Any]) -> int:
+    interaction_count: int = raw_activity.get('kudos_count', 0) + raw_activity.get(
+        'comment_count', 0
+    )
+    return interaction_count
+
+
+def _status(raw_activity: dict[str, Any]) -> Literal['public', 'private', 'restricted']:
+    if raw_activity.get('private'):
+        return 'private'
+    if raw_activity.get('visibility') == 'followers_only':
+        return 'restricted'
+    return 'public'
+
+
+def _photo_urls(raw_activity: dict[str, Any]) -> list[str]:
+    if raw_activity.get('total_photo_count', 0) <= 0:
+        return []
+    photos = raw_activity.get('photos') or {}
+    return list(photos.get('primary', {}).get('urls', {}).values())
+
+
+_SOCIAL_POSTING_FIELDS = (
+    FieldMapping('creator_user_id', ('athlete', 'id'), str),
+    FieldMapping('data_owner_id', ('athlete', 'id'), str),
+    FieldMapping('service_object_id', 'id', as_str),
+    FieldMapping('created_at', 'start_date', _parse_datetime),
+    FieldMapping('url', 'id', _activity_url),
+    FieldMapping('associated_media', (), _photo_urls, lazy=False),
+    FieldMapping('interaction_count', (), _interaction_count),
+    FieldMapping('status', (), _status),
+    FieldMapping('text', 'description'),
+    FieldMapping('title', 'name'),
+)
+
+
 class StravaTransferService(BaseTransferService):
     """
     Class responsible for obtaining end-user authorization to make requests to
@@ -19,7 +88,42 @@ class StravaTransferService(BaseTransferService):
 
     _authorization_url = 'https://www.strava.com/oauth/authorize'
     _base_url = 'https://www.strava.com/api/v3/'
+    # read quotas, see https://developers.strava.com/docs/rate-limits/
+    _rate_limits = {'15_minutes': (100, 15 * 60), 'daily': (1000, 24 * 60 * 60)}
+    # the windows of the values in the rate limit headers, in order
+    _rate_limit_header_windows = ('15_minutes', 'daily')
+    _sync_cursors = {
+        'physical_activity': SyncCursor(
+            'start_date', 'after', convert=_start_date_to_epoch
+        )
+    }
     _token_url = 'https://www.strava.com/oauth/token'
+    _field_mappings = {
+        'social_posting': _SOCIAL_POSTING_FIELDS,
+        'physical_activity': _SOCIAL_POSTING_FIELDS
+        + (
+            FieldMapping('activity_type', 'sport_type'),
+            FieldMapping('distance', 'distance'),
+            FieldMapping('elevation_high', 'elev_high'),
+            FieldMapping('elevation_low', 'elev_low'),
+            FieldMapping('kilocalories', 'calories'),
+            FieldMapping('max_speed', 'max_speed'),
+            FieldMapping('start_latitude', ('start_latlng', 0)),
+            FieldMapping('start_longitude', ('start_latlng', 1)),
+            FieldMapping('end_latitude', ('end_latlng', 0)),
+            FieldMapping('end_longitude', ('end_latlng', 1)),
+            FieldMapping('start_datetime', 'start_date', _parse_datetime),
+            FieldMapping('end_datetime', (), _end_datetime),
+        ),
+    }
+    _paginated_resources = {
+        'physical_activity': PaginatedResource(
+            'athlete/activities', PageNumberPaginator(max_page_size=200)
+        ),
+        'social_posting': PaginatedResource(
+            'athlete/activities', PageNumberPaginator(max_page_size=200)
+        ),
+    }
 
     def __init__(
         self,
@@ -35,7 +139,7 @@ class StravaTransferService(BaseTransferService):
             client_secret=client_secret,
             redirect_uri=redirect_uri,
             state=state,
-            supported_verticals={PhysicalActivityVertical},
+            supported_verticals={PhysicalActivityVertical, SocialPostingVertical},
             verticals=verticals,
         )
 
@@ -64,14 +168,76 @@ class StravaTransferService(BaseTransferService):
                 raise UnsupportedVerticalException(
                     vertical, service_name=self._service_name
                 )
-            if vertical == PhysicalActivityVertical:
+            # social postings are read from the same activities
+            if vertical in (PhysicalActivityVertical, SocialPostingVertical):
                 sub_scopes.update(['activity:read', 'profile:read_all'])
         return sub_scopes
 
-    def _convert_to_datetime(self, raw_datetime: str | None) -> datetime | None:
-        if raw_datetime:
-            return datetime.strptime(raw_datetime, '%Y-%m-%dT%H:%M:%SZ')
-        return None
+    @override
+    def _update_rate_limits(self, status_code: int, headers: Mapping[str, Any]) -> None:
+        super()._update_rate_limits(status_code, headers)
+        # Strava reports the usage of both windows as comma-separated values, with read
+        # requests also counting towards separate, stricter read quotas. Windows reset
+        # every 15 minutes past the hour and at midnight UTC
+        limits = parse_header_numbers(
+            headers.get('X-ReadRateLimit-Limit', headers.get('X-RateLimit-Limit'))
+        )
+        usages = parse_header_numbers(
+            headers.get('X-ReadRateLimit-Usage', headers.get('X-RateLimit-Usage'))
+        )
+        for window, limit, usage in zip(
+            self._rate_limit_header_windows, limits, usages
+        ):
+            self.rate_limiter.update(
+                window,
+                limit,
+                limit - usage,
+                seconds_until_window_reset(self._rate_limits[window][1]),
+            )
+
+    @override
+    def _sync_data_owner_id(self) -> str:
+        # Strava includes the athlete in the token response
+        athlete = (self.token or {}).get('athlete')
+        if not isinstance(athlete, dict) or 'id' not in athlete:
+            athlete = self._decode_json(self._get_resource_from_path('athlete'))
+        return str(athlete['id'])
+
+    def _convert_to_epoch(self, value: datetime | int | None) -> int | None:
+        if isinstance(value, datetime):
+            return int(value.timestamp())
+        return value
+
+    def _activities_request_params(
+        self,
+        request_params: dict[str, Any],
+        after: datetime | int | None,
+        before: datetime | int | None,
+    ) -> dict[str, Any]:
+        params: dict[str, Any] = {}
+        after_epoch = self._convert_to_epoch(after)
+        before_epoch = self._convert_to_epoch(before)
+        if after_epoch is not None:
+            params['after'] = after_epoch
+        if before_epoch is not None:
+            params['before'] = before_epoch
+        return {**params, **request_params}
+
+    def _activity_fields(
+        self, vertical_name: str, raw_data: dict[str, Any]
+    ) -> dict[str, Any]:
+        """
+        Extracts the fields of a :class:`SocialPostingVertical` or
+        :class:`PhysicalActivityVertical` from a raw activity, using the compiled
+        ``_field_mappings`` of ``vertical_name``.
+        """
+        fields = self._field_mappers[vertical_name](raw_data)
+        fields['service'] = self._service_name
+        fields['associated_media'] = [
+            self._build_model(AssociatedMediaSubVertical, media_type='image', url=url)
+            for url in fields['associated_media']
+        ]
+        return fields
 
     def parse_social_posting_vertical(
         self, raw_data: Any
@@ -87,49 +253,8 @@ class StravaTransferService(BaseTransferService):
         """
         if not isinstance(raw_data, dict):
             return None
-        raw_data_dict = defaultdict(dict, raw_data)
-
-        created_at = raw_data_dict.get('start_date')
-        if created_at:
-            created_at = self._convert_to_datetime(created_at)
-
-        url_str = urljoin(
-            'https://www.strava.com/activities/', str(raw_data_dict.get('id'))
-        )
-        interaction_count = raw_data_dict.get('kudos_count', 0) + raw_data_dict.get(
-            'comment_count', 0
-        )
-
-        status: Literal['public', 'private', 'restricted'] = 'public'
-        if raw_data_dict.get('private'):
-            status = 'private'
-        elif raw_data_dict.get('visibility') == 'followers_only':
-            status = 'restricted'
-
-        associated_media_list = []
-        if raw_data_dict.get('total_photo_count', 0) > 0:
-            photo_urls = (
-                raw_data_dict['photos'].get('primary', {}).get('urls', {}).values()
-            )
-            associated_media_list = [
-                AssociatedMediaSubVertical(media_type='image', url=photo_url)
-                for photo_url in photo_urls
-            ]
-
-        athlete_id = str(raw_data_dict['athlete'].get('id'))
-
-        return SocialPostingVertical(
-            creator_user_id=athlete_id,
-            data_owner_id=athlete_id,
-            service_object_id=raw_data_dict.get('id'),
-            service=self._service_name,
-            created_at=created_at,
-            url=url_str,
-            associated_media=associated_media_list,
-            interaction_count=interaction_count,
-            status=status,
-            text=raw_data_dict.get('description'),
-            title=raw_data_dict.get('name'),
+        return self._build_model(
+            SocialPostingVertical, **self._activity_fields('social_posting', raw_data)
         )
 
     def fetch_social_posting_vertical(
@@ -138,30 +263,51 @@ class StravaTransferService(BaseTransferService):
         """
         Fetches and returns social postings created by the authorized user.
 
-        :param count: number of posts to request. At most 30 at a time.
+        :param count: number of posts to request. Counts larger than Strava's maximum
+        page size are fetched over several requests.
         :param request_params: any other endpoint-specific parameters to be sent
         to the endpoint. Depending on the parameters passed, this could override
         the other arguments to this method.
 
         :returns: two elements: the first, a list of :class:`SocialPostingVertical`s
         or ``None``, if unable to parse; the second, the raw response from making the
-        request.
+        request, as retained according to ``raw_retention``.
+        """
+        return self._parse_and_retain(
+            self._iter_raw_items(
+                self._paginated_resources['social_posting'], request_params, count
+            ),
+            self.parse_social_posting_vertical,
+        )
+
+    def iter_social_posting_vertical(
+        self,
+        request_params: dict[str, Any] = {},
+        after: datetime | int | None = None,
+        before: datetime | int | None = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[SocialPostingVertical | None]:
+        """
+        Lazily fetches every social posting created by the authorized user, paging
+        through the whole history.
 
-        :raises: :class:`UnsupportedRequestException` if the request is unable to be
-        made.
+        :param request_params: any other endpoint-specific parameters to be sent
+        to the endpoint. Depending on the parameters passed, this could override
+        the other arguments to this method.
+        :param after: only postings created after this time (a :class:`datetime` or
+        epoch timestamp) are fetched.
+        :param before: only postings created before this time (a :class:`datetime`
+        or epoch timestamp) are fetched.
+        :param limit: the maximum number of postings to fetch. If ``None``, every
+        posting is fetched.
+
+        :returns: an iterator of :class:`SocialPostingVertical`s or ``None``, if
+        unable to parse.
         """
-        max_count = 30
-        if count <= max_count:
-            raw_social_postings = self._get_resource_from_path(
-                'athlete/activities', params={'per_page': count, **request_params}
-            ).json()
-            return [
-                self.parse_social_posting_vertical(raw_social_posting)
-                for raw_social_posting in raw_social_postings
-            ], raw_social_postings
-        raise UnsupportedRequestException(
-            self._service_name,
-            f'can only make a request for at most {max_count} posts at a time.',
+        yield from self.iter_vertical(
+            SocialPostingVertical,
+            self._activities_request_params(request_params, after, before),
+            limit,
         )
 
     def parse_physical_activity_vertical(
@@ -176,73 +322,70 @@ class StravaTransferService(BaseTransferService):
         :returns: :class:`PhysicalActivityVertical` or ``None``, depending on whether it
         was possible to extract data from the response
         """
-        social_posting = self.parse_social_posting_vertical(raw_data)
-        if not social_posting:
+        if not isinstance(raw_data, dict):
             return None
-
-        social_posting_dict = social_posting.model_dump()
-        raw_data_dict = defaultdict(dict, raw_data)
-
-        start_datetime = self._convert_to_datetime(raw_data_dict.get('start_date'))
-        duration_s = raw_data_dict.get('elapsed_time')
-        duration_timedelta = timedelta(seconds=duration_s) if duration_s else None
-        end_datetime = (
-            start_datetime + duration_timedelta
-            if start_datetime and duration_timedelta
-            else None
+        return self._build_model(
+            PhysicalActivityVertical,
+            **self._activity_fields('physical_activity', raw_data),
         )
 
-        start_latlng = raw_data_dict.get('start_latlng')
-        end_latlng = raw_data_dict.get('end_latlng')
-
-        social_posting_dict.update(
-            {
-                'vertical_name': 'physical_activity',
-                'activity_type': raw_data_dict.get('sport_type'),
-                'distance': raw_data_dict.get('distance'),
-                'elevation_high': raw_data_dict.get('elev_high'),
-                'elevation_low': raw_data_dict.get('elev_low'),
-                'kilocalories': raw_data_dict.get('calories'),
-                'max_speed': raw_data_dict.get('max_speed'),
-                'start_datetime': start_datetime,
-                'end_datetime': end_datetime,
-                'start_latitude': start_latlng[0] if start_latlng else None,
-                'start_longitude': start_latlng[1] if start_latlng else None,
-                'end_latitude': end_latlng[0] if end_latlng else None,
-                'end_longitude': end_latlng[1] if end_latlng else None,
-            }
-        )
-
-        return PhysicalActivityVertical.model_validate(social_posting_dict)
-
     def fetch_physical_activity_vertical(
         self, request_params: dict[str, Any] = {}, count: int = 30
     ) -> tuple[list[PhysicalActivityVertical | None], Any]:
         """
         Fetches and returns activities completed by the authorized user.
 
-        :param count: number of activities to request. At most 30 at a time.
+        :param count: number of activities to request. Counts larger than Strava's
+        maximum page size are fetched over several requests.
         :param request_params: any other endpoint-specific parameters to be sent
         to the endpoint. Depending on the parameters passed, this could override
         the other arguments to this method.
 
         :returns: two elements: the first, a list of :class:`PhysicalActivityVertical`s
         or ``None``, if unable to parse; the second, the raw response from making the
-        request.
+        request, as retained according to ``raw_retention``.
+        """
+        return self._parse_and_retain(
+            self._iter_raw_items(
+                self._paginated_resources['physical_activity'], request_params, count
+            ),
+            self.parse_physical_activity_vertical,
+        )
 
-        :raises: :class:`UnsupportedRequestException` if the request is unable to be
-        made.
+    def iter_physical_activity_vertical(
+        self,
+        request_params: dict[str, Any] = {},
+        after: datetime | int | None = None,
+        before: datetime | int | None = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[PhysicalActivityVertical | None]:
         """
-        max_count = 30
-        if count <= max_count:
-            raw_activities = self._get_resource_from_path(
-                'athlete/activities', params={'per_page': count, **request_params}
-            ).json()
-            return [
-                self.parse_physical_activity_vertical(raw_activity)
-                for raw_activity in raw_activities
-            ], raw_activities
-        raise UnsupportedRequestException(
-            self._service_name,
-            f'can only make a request for at most {max_count} activities at a time.',
+        Lazily fetches every activity completed by the authorized user, paging
+        through the whole history. Pages are only requested as the iterator is
+        consumed, so memory use doesn't grow with the length of the history.
+
+        :param request_params: any other endpoint-specific parameters to be sent
+        to the endpoint. Depending on the parameters passed, this could override
+        the other arguments to this method.
+        :param after: only activities that started after this time (a
+        :class:`datetime` or epoch timestamp) are fetched.
+        :param before: only activities that started before this time (a
+        :class:`datetime` or epoch timestamp) are fetched.
+        :param limit: the maximum number of activities to fetch. If ``None``, every
+        activity is fetched.
+
+        :returns: an iterator of :class:`PhysicalActivityVertical`s or ``None``, if
+        unable to parse.
+        """
+        yield from self.iter_vertical(
+            PhysicalActivityVertical,
+            self._activities_request_params(request_params, after, before),
+            limit,
         )
+
+
+class AsyncStravaTransferService(AsyncBaseTransferService, StravaTransferService):
+    """
+    Asynchronous counterpart of :class:`StravaTransferService`. Data is fetched using
+    :meth:`aiter_vertical` and :meth:`afetch`.
+    """
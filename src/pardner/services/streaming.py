@@ -0,0 +1,162 @@
+import json
+import re
+from typing import Any, Callable, Iterable, Iterator
+
+_WHITESPACE = re.compile(rb'[ \t\n\r]*')
+_STRING_END = re.compile(rb'(?:[^"\\]|\\.)*"', re.DOTALL)
+_STRUCTURAL = re.compile(rb'["\[\]{}]')
+_SCALAR_END = re.compile(rb'[,\]}: \t\n\r]')
+
+
+class _ChunkReader:
+    """
+    A cursor over a JSON document received in chunks. Only the part of the document
+    that hasn't been consumed yet is kept in memory.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self.buffer = bytearray()
+        self.pos = 0
+
+    def fill(self) -> None:
+        """
+        Appends the next chunk to the buffer.
+
+        :raises: :class:`ValueError` if the document ended unexpectedly.
+        """
+        for chunk in self._chunks:
+            if chunk:
+                self.buffer += chunk
+                return
+        raise ValueError('Unexpected end of JSON document.')
+
+    def discard_consumed(self) -> None:
+        del self.buffer[: self.pos]
+        self.pos = 0
+
+    def skip_whitespace(self) -> None:
+        while True:
+            match = _WHITESPACE.match(self.buffer, self.pos)
+            self.pos = match.end() if match else self.pos
+            if self.pos < len(self.buffer):
+                return
+            self.fill()
+
+    def next_char(self) -> bytes:
+        """
+        :returns: the next character that isn't whitespace, which is consumed.
+        """
+        self.skip_whitespace()
+        self.pos += 1
+        return bytes(self.buffer[self.pos - 1 : self.pos])
+
+    def expect(self, char: bytes) -> None:
+        found = self.next_char()
+        if found != char:
+            raise ValueError(
+                f'Unexpected JSON: expected {char.decode()!r}, got {found.decode()!r}.'
+            )
+
+    def _find(self, pattern: re.Pattern[bytes], start: int) -> re.Match[bytes]:
+        while True:
+            match = pattern.search(self.buffer, start)
+            if match:
+                return match
+            self.fill()
+
+    def skip_string(self) -> None:
+        """Consumes a string, whose opening quote has already been consumed."""
+        while True:
+            match = _STRING_END.match(self.buffer, self.pos)
+            if match:
+                self.pos = match.end()
+                return
+            self.fill()
+
+    def skip_value(self) -> None:
+        """Consumes the next value, however deeply nested."""
+        first_char = self.next_char()
+        if first_char == b'"':
+            self.skip_string()
+            return
+        if first_char not in (b'{', b'['):
+            while True:
+                match = _SCALAR_END.search(self.buffer, self.pos)
+                if match:
+                    self.pos = match.start()
+                    return
+                try:
+                    self.fill()
+                except ValueError:
+                    # a scalar may end the document
+                    self.pos = len(self.buffer)
+                    return
+
+        depth = 1
+        while depth:
+            match = self._find(_STRUCTURAL, self.pos)
+            self.pos = match.end()
+            char = match.group()
+            if char == b'"':
+                self.skip_string()
+            elif char in (b'{', b'['):
+                depth += 1
+            else:
+                depth -= 1
+
+
+def iter_json_array_items(
+    chunks: Iterable[bytes],
+    items_path: tuple[str, ...] = (),
+    json_decoder: Callable[[bytes], Any] = json.loads,
+) -> Iterator[Any]:
+    """
+    Incrementally decodes the items of a JSON array from a document received in
+    chunks (e.g., from :meth:`requests.Response.iter_content`). Each item is decoded
+    as soon as it has been received in full, so memory use is bounded by the size of
+    one item rather than the whole document.
+
+    :param chunks: the chunks of the JSON document.
+    :param items_path: the keys leading to the array in the document, e.g.,
+    ``('response', 'posts')``. If empty, the document itself must be an array.
+    :param json_decoder: decodes a single item.
+
+    :returns: an iterator over the decoded items.
+
+    :raises: :class:`ValueError` if there's no array at ``items_path`` or the
+    document is malformed.
+    """
+    reader = _ChunkReader(chunks)
+    for key in items_path:
+        reader.expect(b'{')
+        while True:
+            reader.expect(b'"')
+            key_start = reader.pos
+            reader.skip_string()
+            found_key = json.loads(reader.buffer[key_start - 1 : reader.pos])
+            reader.expect(b':')
+            if found_key == key:
+                break
+            reader.skip_value()
+            if reader.next_char() != b',':
+                raise ValueError(f'Unexpected JSON: no {key!r} key.')
+        reader.discard_consumed()
+
+    reader.expect(b'[')
+    reader.skip_whitespace()
+    if reader.buffer[reader.pos : reader.pos + 1] == b']':
+        return
+    while True:
+        reader.skip_whitespace()
+        item_start = reader.pos
+        reader.skip_value()
+        yield json_decoder(bytes(reader.buffer[item_start : reader.pos]))
+        separator = reader.next_char()
+        reader.discard_consumed()
+        if separator == b']':
+            return
+        if separator != b',':
+            raise ValueError(
+                f'Unexpected JSON: expected "," or "]", got {separator.decode()!r}.'
+            )
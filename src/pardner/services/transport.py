@@ -0,0 +1,136 @@
+import socket
+import threading
+from typing import Any
+from urllib.parse import urlsplit
+
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None  # type: ignore[assignment]
+
+
+class KeepAliveHTTPAdapter(HTTPAdapter):
+    """
+    A :class:`HTTPAdapter` that enables TCP keep-alive on its connections, so idle
+    pooled connections aren't silently dropped between requests.
+    """
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        kwargs.setdefault(
+            'socket_options',
+            [
+                *HTTPConnection.default_socket_options,
+                (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+            ],
+        )
+        super().init_poolmanager(*args, **kwargs)
+
+
+class SharedTransport:
+    """
+    Holds one connection pool per host, shared by every transfer service making
+    requests to that host. Instead of each service (i.e., each user) opening its own
+    connections and paying for new TCP and TLS handshakes, connections to a host are
+    kept alive and reused across all services.
+
+    Asynchronous services share one :class:`httpx.AsyncClient` per host in the same
+    way (see :meth:`get_async_client`), which must then be used from a single event
+    loop.
+    """
+
+    pool_maxsize: int
+    pool_block: bool
+
+    def __init__(
+        self, pool_maxsize: int = DEFAULT_POOLSIZE, pool_block: bool = False
+    ) -> None:
+        """
+        :param pool_maxsize: the maximum number of connections kept alive per host.
+        :param pool_block: whether requests should wait for a free connection when
+        ``pool_maxsize`` connections are in use (``True``) or open a new, throwaway
+        connection (``False``).
+        """
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self._adapters: dict[str, HTTPAdapter] = {}
+        self._async_clients: dict[str, 'httpx.AsyncClient'] = {}
+        self._lock = threading.Lock()
+
+    def _host_prefix(self, url: str) -> str:
+        split_url = urlsplit(url)
+        return f'{split_url.scheme}://{split_url.netloc}/'
+
+    def get_adapter(self, url: str) -> HTTPAdapter:
+        """
+        :param url: a URL on the host for which the adapter is needed.
+
+        :returns: the adapter holding the connection pool for the host of ``url``.
+        """
+        prefix = self._host_prefix(url)
+        with self._lock:
+            if prefix not in self._adapters:
+                self._adapters[prefix] = KeepAliveHTTPAdapter(
+                    pool_maxsize=self.pool_maxsize, pool_block=self.pool_block
+                )
+            return self._adapters[prefix]
+
+    def get_async_client(self, url: str) -> 'httpx.AsyncClient':
+        """
+        :param url: a URL on the host for which the client is needed.
+
+        :returns: the client holding the connection pool for the host of ``url``,
+        with the same limits as the adapters of synchronous services.
+
+        :raises: :class:`ImportError` if ``httpx`` is not installed.
+        """
+        if httpx is None:
+            raise ImportError(
+                'Asynchronous requests require httpx. Install it with '
+                '`pip install pardner[async]`.'
+            )
+        prefix = self._host_prefix(url)
+        with self._lock:
+            if prefix not in self._async_clients:
+                self._async_clients[prefix] = httpx.AsyncClient(
+                    limits=httpx.Limits(
+                        # like pool_block, waits for a free connection rather than
+                        # opening more
+                        max_connections=self.pool_maxsize if self.pool_block else None,
+                        max_keepalive_connections=self.pool_maxsize,
+                    )
+                )
+            return self._async_clients[prefix]
+
+    def mount(self, session: Any, url: str) -> None:
+        """
+        Routes the requests ``session`` makes to the host of ``url`` through the
+        shared connection pool for that host.
+
+        :param session: a :class:`requests.Session`, e.g., an :class:`OAuth2Session`.
+        :param url: a URL on the host whose requests should use the shared pool.
+        """
+        session.mount(self._host_prefix(url), self.get_adapter(url))
+
+    def close(self) -> None:
+        """
+        Closes every pooled connection of synchronous services. See :meth:`aclose` for
+        asynchronous ones.
+        """
+        with self._lock:
+            for adapter in self._adapters.values():
+                adapter.close()
+            self._adapters.clear()
+
+    async def aclose(self) -> None:
+        """Closes every pooled connection of asynchronous services."""
+        with self._lock:
+            async_clients = list(self._async_clients.values())
+            self._async_clients.clear()
+        for async_client in async_clients:
+            await async_client.aclose()
+
+
+default_transport = SharedTransport()
@@ -1,8 +1,11 @@
 import json
-from typing import Any, Iterable, Optional, override
+from typing import Any, Iterable, Iterator, Mapping, Optional, override
 
-from pardner.exceptions import UnsupportedRequestException
 from pardner.services import BaseTransferService
+from pardner.services.async_base import AsyncBaseTransferService
+from pardner.services.pagination import OffsetPaginator, PaginatedResource
+from pardner.services.rate_limit import parse_header_numbers
+from pardner.services.sync import SyncCursor
 from pardner.verticals import SocialPostingVertical, Vertical
 
 
@@ -16,6 +19,18 @@ class TumblrTransferService(BaseTransferService):
     primary_blog_id: str | None = None
     _authorization_url = 'https://www.tumblr.com/oauth2/authorize'
     _base_url = 'https://api.tumblr.com/v2/'
+    _paginated_resources = {
+        'social_posting': PaginatedResource(
+            'user/dashboard',
+            OffsetPaginator(max_page_size=20),
+            items_path=('response', 'posts'),
+            # the same defaults as fetch_social_posting_vertical
+            default_params={'npf': True, 'type': 'text'},
+        )
+    }
+    # see https://www.tumblr.com/docs/en/api/v2#rate-limits
+    _rate_limits = {'hourly': (1000, 60 * 60), 'daily': (5000, 24 * 60 * 60)}
+    _sync_cursors = {'social_posting': SyncCursor('id', 'since_id')}
     _token_url = 'https://api.tumblr.com/v2/oauth2/token'
 
     def __init__(
@@ -55,6 +70,24 @@ class TumblrTransferService(BaseTransferService):
         # Tumblr only needs 'basic' for read access requests
         return {'basic'}
 
+    @override
+    def _update_rate_limits(self, status_code: int, headers: Mapping[str, Any]) -> None:
+        super()._update_rate_limits(status_code, headers)
+        for window, header_window in [('hourly', 'Perhour'), ('daily', 'Perday')]:
+            limits = parse_header_numbers(
+                headers.get(f'X-Ratelimit-{header_window}-Limit')
+            )
+            remaining = parse_header_numbers(
+                headers.get(f'X-Ratelimit-{header_window}-Remaining')
+            )
+            reset_in = parse_header_numbers(
+                headers.get(f'X-Ratelimit-{header_window}-Reset')
+            )
+            if limits and remaining:
+                self.rate_limiter.update(
+                    window, limits[0], remaining[0], reset_in[0] if reset_in else None
+                )
+
     @override
     def fetch_token(
         self,
@@ -80,7 +113,18 @@ class TumblrTransferService(BaseTransferService):
         """
         if self.primary_blog_id:
             return self.primary_blog_id
-        user_info = self._get_resource_from_path('user/info').json().get('response', {})
+        user_info = self._decode_json(self._get_resource_from_path('user/info'))
+        return self._set_primary_blog_id(user_info)
+
+    def _set_primary_blog_id(self, raw_user_info: Any) -> str:
+        """
+        Extracts the primary blog ID from the response of the ``user/info`` endpoint
+        and sets the ``primary_blog_id`` attribute.
+
+        :raises: :class:`ValueError`: if the primary blog ID could not be extracted from
+        the response.
+        """
+        user_info = raw_user_info.get('response', {})
         for blog_info in user_info.get('user', {}).get('blogs', []):
             if (
                 isinstance(blog_info, dict)
@@ -98,6 +142,43 @@ class TumblrTransferService(BaseTransferService):
             f'{json.dumps(user_info, indent=2)}'
         )
 
+    @override
+    def _sync_data_owner_id(self) -> str:
+        return self.fetch_primary_blog_id()
+
+    def _dashboard_request_params(
+        self, request_params: dict[str, Any], text_only: bool
+    ) -> dict[str, Any]:
+        # ``npf`` is sent by default, see ``_paginated_resources``
+        return {'type': 'text' if text_only else '', **request_params}
+
+    def iter_social_posting_vertical(
+        self,
+        request_params: dict[str, Any] = {},
+        text_only: bool = True,
+        limit: Optional[int] = None,
+    ) -> Iterator[Any]:
+        """
+        Lazily fetches posts from the Tumblr feed of the user account whose token was
+        obtained using the Tumblr API, paging through the whole feed.
+
+        :param text_only: whether or not to request only text-based posts (``True``) or
+        not (``False``).
+        :param request_params: any other endpoint-specific parameters to be sent
+        to the endpoint. Depending on the parameters passed, this could override
+        ``text_only``.
+        :param limit: the maximum number of posts to fetch. If ``None``, every post is
+        fetched.
+
+        :returns: an iterator of dictionary objects with information for the posts in
+        a feed.
+        """
+        yield from self.iter_vertical(
+            SocialPostingVertical,
+            self._dashboard_request_params(request_params, text_only),
+            limit,
+        )
+
     def fetch_social_posting_vertical(
         self,
         request_params: dict[str, Any] = {},
@@ -108,7 +189,8 @@ class TumblrTransferService(BaseTransferService):
         Fetches posts from Tumblr feed for user account whose token was
         obtained using the Tumblr API.
 
-        :param count: number of posts to request.
+        :param count: number of posts to request. Counts larger than Tumblr's maximum
+        page size are fetched over several requests.
         :param text_only: whether or not to request only text-based posts (``True``) or
         not (``False``).
         :param request_params: any other endpoint-specific parameters to be sent
@@ -116,22 +198,25 @@ class TumblrTransferService(BaseTransferService):
         ``count`` and ``text_only``.
 
         :returns: a list of dictionary objects with information for the posts in a feed.
-
-        :raises: :class:`UnsupportedRequestException` if the request is unable to be
-        made.
         """
-        if count <= 20:
-            dashboard_response = self._get_resource_from_path(
-                'user/dashboard',
-                {
-                    'limit': count,
-                    'npf': True,
-                    'type': 'text' if text_only else '',
-                    **request_params,
-                },
+        return list(
+            self.iter_social_posting_vertical(
+                request_params, text_only=text_only, limit=count
             )
-            return list(dashboard_response.json().get('response').get('posts'))
-        raise UnsupportedRequestException(
-            self._service_name,
-            'can only make a request for at most 20 posts at a time.',
         )
+
+
+class AsyncTumblrTransferService(AsyncBaseTransferService, TumblrTransferService):
+    """
+    Asynchronous counterpart of :class:`TumblrTransferService`. Data is fetched using
+    :meth:`aiter_vertical` and :meth:`afetch`.
+    """
+
+    async def afetch_primary_blog_id(self) -> str:
+        """
+        Asynchronous counterpart of :meth:`fetch_primary_blog_id`.
+        """
+        if self.primary_blog_id:
+            return self.primary_blog_id
+        user_info = self._decode_json(await self._aget_resource_from_path('user/info'))
+        return self._set_primary_blog_id(user_info)
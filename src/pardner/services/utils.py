@@ -1,5 +1,8 @@
+from datetime import datetime, timezone
 from typing import Any
 
+from pardner.verticals import Vertical
+
 
 def scope_as_string(scopes: Any, delimiter: str = ' ') -> str | None:
     """
@@ -35,3 +38,39 @@ def scope_as_set(scope: Any, delimiter: str = ' ') -> set[str]:
     elif scope is None:
         return set()
     return set(scope.strip().split(delimiter))
+
+
+def get_vertical_name(vertical: Vertical) -> str:
+    """
+    :param vertical: a :class:`Vertical` class.
+
+    :returns: the snake case name of ``vertical``, e.g., ``'physical_activity'``.
+    """
+    return str(vertical.model_fields['vertical_name'].default)
+
+
+def as_str(value: Any) -> str | None:
+    """
+    Normalizes an identifier the way verticals do (see ``coerce_numbers_to_str``), so
+    that parsers can build verticals without validation.
+
+    :returns: ``value`` as a string, or ``None`` if ``value`` is ``None``.
+    """
+    return None if value is None else str(value)
+
+
+def epoch_to_datetime(value: Any) -> datetime | None:
+    """
+    :param value: a UNIX timestamp, in seconds, as a number or a string.
+
+    :returns: the timezone-aware (UTC) :class:`datetime` for ``value``, or ``None`` if
+    ``value`` isn't a timestamp.
+    """
+    if isinstance(value, str):
+        try:
+            value = float(value)
+        except ValueError:
+            return None
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return datetime.fromtimestamp(value, timezone.utc)
@@ -1,8 +1,11 @@
 from pardner.verticals import sub_verticals as sub_verticals
 from pardner.verticals.base import BaseVertical as BaseVertical
 from pardner.verticals.base import Vertical as Vertical
+from pardner.verticals.base import deterministic_object_id as deterministic_object_id
+from pardner.verticals.base import get_vertical_class as get_vertical_class
 from pardner.verticals.blocked_user import BlockedUserVertical as BlockedUserVertical
 from pardner.verticals.chat_bot import ChatBotVertical as ChatBotVertical
+from pardner.verticals.collection import VerticalCollection as VerticalCollection
 from pardner.verticals.conversation import ConversationVertical as ConversationVertical
 from pardner.verticals.conversation_direct import (
     ConversationDirectVertical as ConversationDirectVertical,
@@ -10,6 +13,8 @@ from pardner.verticals.conversation_direct import (
 from pardner.verticals.conversation_group import (
     ConversationGroupVertical as ConversationGroupVertical,
 )
+from pardner.verticals.frame import ActivityFrame as ActivityFrame
+from pardner.verticals.lazy import LazyVertical as LazyVertical
 from pardner.verticals.message import MessageVertical as MessageVertical
 from pardner.verticals.physical_activity import (
     PhysicalActivityVertical as PhysicalActivityVertical,
@@ -1,9 +1,84 @@
+import functools
+import hashlib
+import json
 import uuid
 from abc import ABC
 from datetime import datetime
-from typing import Type
+from typing import Any, ClassVar, Optional, Type
 
-from pydantic import AnyHttpUrl, BaseModel, ConfigDict, Field
+from pydantic import AnyHttpUrl, AnyUrl, BaseModel, ConfigDict, Field, ValidationError
+
+from pardner.verticals.utils import Converter, convert_items, map_annotation
+
+PARDNER_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, 'https://github.com/dtinit/pardner')
+
+
+def deterministic_object_id(
+    service: str, vertical_name: str, service_object_id: str
+) -> str:
+    """
+    Derives a ``pardner_object_id`` from the identity of an object on its service
+    (a UUID version 5), so that fetching the same object twice gives it the same id.
+
+    :param service: the name of the service the object was fetched from.
+    :param vertical_name: the name of the vertical of the object.
+    :param service_object_id: the id of the object, generated by the service.
+
+    :returns: the id, as a hex string like the ids generated by default.
+    """
+    return uuid.uuid5(
+        PARDNER_NAMESPACE, f'{service}/{vertical_name}/{service_object_id}'
+    ).hex
+
+
+def _url_normalizer(annotation: Any) -> Optional[Converter]:
+    if isinstance(annotation, type):
+        if issubclass(annotation, AnyUrl):
+            url_type = annotation
+
+            def normalize_url(value: Any) -> Any:
+                try:
+                    return str(url_type(value))
+                except ValidationError:
+                    return value
+
+            return normalize_url
+        if issubclass(annotation, BaseModel):
+            model = annotation
+            return lambda fields: _normalize_urls(model, fields)
+    return None
+
+
+@functools.cache
+def _url_normalizers(model: type[BaseModel]) -> dict[str, Converter]:
+    """
+    :returns: maps the fields of ``model`` holding URLs (or models holding URLs) to
+    the functions normalizing their dumped values.
+    """
+    url_normalizers = {}
+    for field_name, field_info in model.model_fields.items():
+        normalize = map_annotation(
+            field_info.annotation, _url_normalizer, convert_items
+        )
+        if normalize is not None:
+            url_normalizers[field_name] = normalize
+    return url_normalizers
+
+
+def _normalize_urls(model: type[BaseModel], fields: Any) -> Any:
+    """
+    Normalizes the URLs in ``fields``, the JSON dump of a ``model`` object, as
+    validation would (e.g., ``'https://a.com'`` becomes ``'https://a.com/'``), so that
+    objects built with ``trusted_parsing``, whose URLs are plain strings, dump like
+    validated ones.
+    """
+    if not isinstance(fields, dict):
+        return fields
+    for field_name, normalize in _url_normalizers(model).items():
+        value = fields.get(field_name)
+        if value is not None:
+            fields[field_name] = normalize(value)
+    return fields
 
 
 class BaseVertical(BaseModel, ABC):
@@ -15,6 +90,9 @@ class BaseVertical(BaseModel, ABC):
 
     model_config = ConfigDict(coerce_numbers_to_str=True)
 
+    # fields that can differ between fetches of an unchanged object
+    volatile_fields: ClassVar[frozenset[str]] = frozenset({'pardner_object_id'})
+
     pardner_object_id: str = Field(
         default_factory=lambda: uuid.uuid4().hex,
         description='The id of the vertical object for identification from pardner. '
@@ -46,5 +124,42 @@ class BaseVertical(BaseModel, ABC):
     def __str__(self):
         return self.vertical_name
 
+    def content_hash(self) -> str:
+        """
+        :returns: a hash of the content of the vertical object, excluding
+        ``volatile_fields``, which is stable across fetches and processes. Used to
+        tell whether an object changed on its service since it was last fetched. URLs
+        are normalized first, so objects built with or without ``trusted_parsing``
+        hash the same.
+        """
+        content = _normalize_urls(
+            type(self),
+            self.model_dump(
+                mode='json', exclude=set(self.volatile_fields), warnings=False
+            ),
+        )
+        return hashlib.blake2b(
+            json.dumps(content, sort_keys=True, separators=(',', ':')).encode(),
+            digest_size=16,
+        ).hexdigest()
+
 
 Vertical = Type[BaseVertical]
+
+
+def get_vertical_class(vertical_name: str) -> Vertical:
+    """
+    :param vertical_name: the snake case name of a vertical, e.g.,
+    ``'physical_activity'``, as found in the ``vertical_name`` of its objects.
+
+    :returns: the :class:`BaseVertical` subclass with that name.
+
+    :raises: :class:`KeyError` if no vertical has that name.
+    """
+    subclasses = list(BaseVertical.__subclasses__())
+    while subclasses:
+        vertical = subclasses.pop()
+        if vertical.model_fields['vertical_name'].default == vertical_name:
+            return vertical
+        subclasses.extend(vertical.__subclasses__())
+    raise KeyError(vertical_name)
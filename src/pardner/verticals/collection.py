@@ -0,0 +1,161 @@
+import sys
+from typing import Any, Generic, Iterable, Iterator, TypeVar, cast, overload
+
+from pydantic import BaseModel
+
+from pardner.verticals.base import BaseVertical
+
+VerticalObject = TypeVar('VerticalObject', bound=BaseVertical)
+
+
+def _deep_sizeof(value: Any, seen: set[int]) -> int:
+    """
+    :returns: the size of ``value`` and of the objects it holds, in bytes, skipping
+    the objects in ``seen`` (which are shared, so counted once).
+    """
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(_deep_sizeof(item, seen) for item in value)
+    elif isinstance(value, dict):
+        size += sum(
+            _deep_sizeof(key, seen) + _deep_sizeof(item, seen)
+            for key, item in value.items()
+        )
+    elif isinstance(value, BaseModel):
+        size += _deep_sizeof(value.__dict__, seen)
+    return size
+
+
+class VerticalCollection(Generic[VerticalObject]):
+    """
+    A compact, append-only collection of vertical objects of one class, for holding
+    many of them at once (e.g., a whole backfill). Objects are stored column by
+    column, as one list per field, rather than as a model with its own ``__dict__``
+    each, and the strings of the fields listed in ``INTERNED_FIELDS``, which repeat
+    across objects (e.g., ``service``, ``data_owner_id``), are stored once. Objects
+    are converted back to models as they are read.
+
+    .. code-block:: python
+
+        activities = VerticalCollection(
+            PhysicalActivityVertical, strava.iter_vertical(PhysicalActivityVertical)
+        )
+        print(len(activities), activities.bytes_per_record())
+        total_distance = sum(filter(None, activities.column('distance')))
+    """
+
+    __slots__ = (
+        '_columns',
+        '_field_names',
+        '_interned',
+        '_strings',
+        '_vertical_name',
+        'vertical',
+    )
+
+    # fields with few distinct values; interning unique values (e.g., ids, text)
+    # would only add a dictionary entry per object
+    INTERNED_FIELDS = frozenset(
+        {'creator_user_id', 'data_owner_id', 'service', 'vertical_name'}
+    )
+
+    def __init__(
+        self, vertical: type[VerticalObject], vertical_objs: Iterable[Any] = ()
+    ) -> None:
+        """
+        :param vertical: the :class:`BaseVertical` subclass of the objects.
+        :param vertical_objs: the objects to add to the collection, see
+        :meth:`append`.
+        """
+        self.vertical = vertical
+        self._vertical_name = vertical.model_fields['vertical_name'].default
+        self._field_names = tuple(vertical.model_fields)
+        self._columns: tuple[list[Any], ...] = tuple([] for _ in self._field_names)
+        self._interned = tuple(
+            field_name in self.INTERNED_FIELDS for field_name in self._field_names
+        )
+        self._strings: dict[str, str] = {}
+        self.extend(vertical_objs)
+
+    def __len__(self) -> int:
+        return len(self._columns[0])
+
+    @overload
+    def __getitem__(self, index: int) -> VerticalObject: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[VerticalObject]: ...
+
+    def __getitem__(self, index: int | slice) -> VerticalObject | list[VerticalObject]:
+        if isinstance(index, slice):
+            return [self[item_index] for item_index in range(*index.indices(len(self)))]
+        # the values came from objects that were already built, so they aren't
+        # validated again
+        vertical_obj = self.vertical.model_construct(
+            **{
+                field_name: column[index]
+                for field_name, column in zip(self._field_names, self._columns)
+            }
+        )
+        return cast(VerticalObject, vertical_obj)
+
+    def __iter__(self) -> Iterator[VerticalObject]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def append(self, vertical_obj: Any) -> None:
+        """
+        :param vertical_obj: an object of the collection's vertical, or a
+        :class:`LazyVertical` standing for one.
+
+        :raises: :class:`TypeError` if ``vertical_obj`` is of another vertical.
+        """
+        if getattr(vertical_obj, 'vertical_name', None) != self._vertical_name:
+            raise TypeError(
+                f'Expected a {self.vertical.__name__}, got: {vertical_obj!r}'
+            )
+        strings = self._strings
+        for field_name, column, interned in zip(
+            self._field_names, self._columns, self._interned
+        ):
+            value = getattr(vertical_obj, field_name)
+            if interned and isinstance(value, str):
+                value = strings.setdefault(value, value)
+            column.append(value)
+
+    def extend(self, vertical_objs: Iterable[Any]) -> None:
+        for vertical_obj in vertical_objs:
+            self.append(vertical_obj)
+
+    def column(self, field_name: str) -> list[Any]:
+        """
+        :returns: the values of ``field_name`` for every object, in order, without
+        building the objects. The list mustn't be modified.
+
+        :raises: :class:`KeyError` if the vertical doesn't have ``field_name``.
+        """
+        try:
+            return self._columns[self._field_names.index(field_name)]
+        except ValueError:
+            raise KeyError(field_name) from None
+
+    def nbytes(self) -> int:
+        """
+        :returns: an estimate of the memory used by the collection, in bytes,
+        counting each shared value once.
+        """
+        seen: set[int] = set()
+        return (
+            sys.getsizeof(self)
+            + _deep_sizeof(self._strings, seen)
+            + sum(_deep_sizeof(column, seen) for column in self._columns)
+        )
+
+    def bytes_per_record(self) -> float:
+        """
+        :returns: the average memory used per object in the collection, in bytes.
+        """
+        return self.nbytes() / len(self) if len(self) else 0.0
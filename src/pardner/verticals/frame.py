@@ -0,0 +1,243 @@
+from array import array
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterable, Literal, Optional, Sequence
+
+from pardner.verticals.collection import VerticalCollection
+from pardner.verticals.physical_activity import PhysicalActivityVertical
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+Reduction = Literal['count', 'mean', 'sum']
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+# how NumPy stores NaT
+_NAT = -(2**63)
+
+
+def _to_float(value: Optional[float]) -> float:
+    return float('nan') if value is None else value
+
+
+def _to_microseconds(value: Optional[datetime]) -> int:
+    """:returns: the microseconds since the epoch of ``value`` (in UTC), or NaT."""
+    if value is None:
+        return _NAT
+    if value.tzinfo:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+class ActivityFrame:
+    """
+    A columnar view of many :class:`PhysicalActivityVertical`s, holding each numeric
+    field in a NumPy array, so that aggregates over hundreds of thousands of
+    activities are computed without a Python loop per activity. Missing values are
+    ``NaN`` in the float columns and ``NaT`` in the timestamp columns (in UTC), and
+    :meth:`mask` tells which values are present. Requires NumPy (``pip install
+    pardner[frames]``).
+
+    .. code-block:: python
+
+        frame = ActivityFrame(strava.iter_vertical(PhysicalActivityVertical))
+        avg_speed = frame.mean('max_speed')
+        distance_by_type = frame.group_by_activity_type('distance', 'sum')
+        buckets, weekly_distance = frame.totals_by_period('distance', 'W')
+    """
+
+    FLOAT_FIELDS = (
+        'distance',
+        'elevation_high',
+        'elevation_low',
+        'kilocalories',
+        'max_speed',
+        'start_latitude',
+        'start_longitude',
+        'end_latitude',
+        'end_longitude',
+    )
+    DATETIME_FIELDS = ('start_datetime', 'end_datetime')
+
+    activity_types: 'np.ndarray'
+    columns: dict[str, 'np.ndarray']
+
+    def __init__(
+        self,
+        activities: Iterable[PhysicalActivityVertical]
+        | VerticalCollection[PhysicalActivityVertical],
+    ) -> None:
+        """
+        :param activities: the activities (or :class:`LazyVertical`s), e.g., as
+        yielded by ``iter_vertical``, or held in a :class:`VerticalCollection`. Only
+        the fields of the columns are read, into compact arrays, as the activities
+        are consumed.
+
+        :raises: :class:`ImportError` if NumPy isn't installed.
+        """
+        if np is None:
+            raise ImportError(
+                'ActivityFrame requires NumPy. Install it with '
+                '`pip install pardner[frames]`.'
+            )
+        float_values = {field_name: array('d') for field_name in self.FLOAT_FIELDS}
+        datetime_values = {
+            field_name: array('q') for field_name in self.DATETIME_FIELDS
+        }
+        activity_types: list[Optional[str]] = []
+        if isinstance(activities, VerticalCollection):
+            for field_name, values in float_values.items():
+                values.extend(map(_to_float, activities.column(field_name)))
+            for field_name, microseconds in datetime_values.items():
+                microseconds.extend(
+                    map(_to_microseconds, activities.column(field_name))
+                )
+            activity_types = activities.column('activity_type')
+        else:
+            for activity in activities:
+                for field_name, values in float_values.items():
+                    values.append(_to_float(getattr(activity, field_name)))
+                for field_name, microseconds in datetime_values.items():
+                    microseconds.append(_to_microseconds(getattr(activity, field_name)))
+                activity_types.append(activity.activity_type)
+
+        self.columns = {}
+        for field_name, values in float_values.items():
+            self.columns[field_name] = np.frombuffer(values, dtype=np.float64)
+        for field_name, microseconds in datetime_values.items():
+            self.columns[field_name] = np.frombuffer(microseconds, dtype=np.int64).view(
+                'datetime64[us]'
+            )
+        # missing types are grouped under the empty string
+        self.activity_types = np.array(
+            [activity_type or '' for activity_type in activity_types], dtype=str
+        )
+
+    def __len__(self) -> int:
+        return len(self.activity_types)
+
+    def column(self, field_name: str) -> 'np.ndarray':
+        """
+        :returns: the values of ``field_name`` for every activity.
+
+        :raises: :class:`KeyError` if ``field_name`` isn't a column.
+        """
+        return self.columns[field_name]
+
+    def mask(self, field_name: str) -> 'np.ndarray':
+        """
+        :returns: a boolean array telling which activities have a value for
+        ``field_name``.
+        """
+        values = self.column(field_name)
+        present: np.ndarray = (
+            ~np.isnat(values) if values.dtype.kind == 'M' else ~np.isnan(values)
+        )
+        return present
+
+    def mean(self, field_name: str) -> float | None:
+        """
+        :returns: the mean of the values of ``field_name`` that are present, or
+        ``None`` if there are none.
+        """
+        values = self.column(field_name)[self.mask(field_name)]
+        return float(values.mean()) if len(values) else None
+
+    def percentile(self, field_name: str, q: float | Sequence[float]) -> Any:
+        """
+        :param q: the percentile or percentiles to compute, between 0 and 100.
+
+        :returns: the percentile, or an array of the percentiles, of the values of
+        ``field_name`` that are present (``NaN`` if there are none).
+        """
+        values = self.column(field_name)[self.mask(field_name)]
+        percentiles = np.asarray(q, dtype=np.float64)
+        if not len(values):
+            return np.full(percentiles.shape, np.nan)[()]
+        return np.percentile(values, percentiles)
+
+    @staticmethod
+    def _grouped(
+        keys: 'np.ndarray',
+        values: 'np.ndarray',
+        present: 'np.ndarray',
+        reduction: Reduction,
+    ) -> tuple['np.ndarray', 'np.ndarray']:
+        """
+        :returns: the distinct ``keys`` (sorted) and the reduction of the ``values``
+        with each key, ignoring the values that aren't ``present``.
+        """
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        counts = np.bincount(inverse, weights=present, minlength=len(unique_keys))
+        if reduction == 'count':
+            return unique_keys, counts
+        totals = np.bincount(
+            inverse, weights=np.where(present, values, 0.0), minlength=len(unique_keys)
+        )
+        if reduction == 'sum':
+            return unique_keys, totals
+        if reduction == 'mean':
+            with np.errstate(invalid='ignore', divide='ignore'):
+                return unique_keys, totals / counts
+        raise ValueError(f'Invalid reduction: {reduction!r}')
+
+    def group_by_activity_type(
+        self, field_name: str, reduction: Reduction = 'mean'
+    ) -> dict[str, float]:
+        """
+        :param field_name: the float column to reduce.
+        :param reduction: ``'count'``, ``'mean'`` or ``'sum'``.
+
+        :returns: maps each activity type to the reduction of the values of
+        ``field_name`` for activities of that type. Activities without a type are
+        under ``''``.
+
+        :raises: :class:`ValueError` if ``reduction`` isn't valid.
+        """
+        activity_types, reduced = self._grouped(
+            self.activity_types,
+            self.column(field_name),
+            self.mask(field_name),
+            reduction,
+        )
+        return dict(zip(activity_types.tolist(), reduced.tolist()))
+
+    def totals_by_period(
+        self,
+        field_name: str,
+        period: Literal['D', 'W', 'M', 'Y'] = 'D',
+        time_field: str = 'start_datetime',
+    ) -> tuple['np.ndarray', 'np.ndarray']:
+        """
+        Sums the values of ``field_name`` over periods of time, e.g., the distance
+        covered each week.
+
+        :param field_name: the float column to sum.
+        :param period: the length of the periods: a day, week (starting on Monday,
+        as ISO weeks), month or year.
+        :param time_field: the timestamp column that places activities in periods.
+
+        :returns: two arrays: the start of each period that has activities, in
+        order (as days for weeks); and the total of ``field_name`` over each of those
+        periods.
+        """
+        has_time = self.mask(time_field)
+        times = self.column(time_field)[has_time]
+        if period == 'W':
+            # NumPy's weeks start on Thursdays (like the epoch), so times are moved
+            # three days later, mapping each Monday-to-Sunday week onto one NumPy
+            # week, and the starts of the weeks back to Mondays
+            shift = np.timedelta64(3, 'D')
+            period_starts = (times + shift).astype('datetime64[W]').astype(
+                'datetime64[D]'
+            ) - shift
+        else:
+            period_starts = times.astype(f'datetime64[{period}]')
+        return self._grouped(
+            period_starts,
+            self.column(field_name)[has_time],
+            self.mask(field_name)[has_time],
+            'sum',
+        )
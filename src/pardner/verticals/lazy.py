@@ -0,0 +1,97 @@
+from typing import Any, Callable, Generic, Mapping, TypeVar
+
+from pardner.verticals.base import BaseVertical
+
+VerticalObject = TypeVar('VerticalObject', bound=BaseVertical)
+
+
+class LazyVertical(Generic[VerticalObject]):
+    """
+    A read-only view of a vertical object that wraps the raw data returned by a
+    service and only converts each field the first time it's read, caching the
+    result. Exposes the same attribute names as the :class:`BaseVertical` subclass it
+    stands for. Fields that can't be read on their own are read from the full vertical
+    object, which is built (and cached) on demand by :meth:`materialize`.
+
+    Fields read lazily are normalized by the service's parser but not validated, as
+    with ``trusted_parsing``.
+
+    .. code-block:: python
+
+        for activity in strava.iter_vertical(PhysicalActivityVertical, lazy=True):
+            print(activity.max_speed, activity.distance)
+    """
+
+    __slots__ = (
+        '_field_getters',
+        '_materialize',
+        '_raw_data',
+        '_values',
+        '_vertical',
+        '_vertical_obj',
+    )
+
+    def __init__(
+        self,
+        vertical: type[VerticalObject],
+        raw_data: dict[str, Any],
+        field_getters: Mapping[str, Callable[[dict[str, Any]], Any]],
+        materialize: Callable[[], VerticalObject | None],
+        fields: Mapping[str, Any] = {},
+    ) -> None:
+        """
+        :param vertical: the :class:`BaseVertical` subclass being represented.
+        :param raw_data: the raw data returned by the service.
+        :param field_getters: maps field names to the functions extracting them from
+        ``raw_data``.
+        :param materialize: builds the full vertical object from ``raw_data``.
+        :param fields: the values of fields that don't depend on ``raw_data`` (e.g.,
+        the service name).
+        """
+        self._vertical = vertical
+        self._raw_data = raw_data
+        self._field_getters = field_getters
+        self._materialize = materialize
+        self._values: dict[str, Any] = dict(fields)
+        self._vertical_obj: VerticalObject | None = None
+
+    def __getattr__(self, name: str) -> Any:
+        # only called for attributes not found on the object, i.e., fields
+        if name.startswith('_'):
+            raise AttributeError(name)
+        values = self._values
+        if name in values:
+            return values[name]
+        if name in self._field_getters:
+            value = values[name] = self._field_getters[name](self._raw_data)
+            return value
+        if name in self._vertical.model_fields:
+            return getattr(self.materialize(), name)
+        raise AttributeError(
+            f'{self._vertical.__name__} object has no attribute {name!r}'
+        )
+
+    def __repr__(self) -> str:
+        return f'Lazy{self._vertical.__name__}({self._raw_data!r})'
+
+    @property
+    def raw_data(self) -> dict[str, Any]:
+        return self._raw_data
+
+    def content_hash(self) -> str:
+        """See :meth:`BaseVertical.content_hash`."""
+        return self.materialize().content_hash()
+
+    def materialize(self) -> VerticalObject:
+        """
+        :returns: the full vertical object, built the first time it's requested.
+
+        :raises: :class:`ValueError` if the service couldn't parse the raw data.
+        """
+        if self._vertical_obj is None:
+            self._vertical_obj = self._materialize()
+            if self._vertical_obj is None:
+                raise ValueError(
+                    f'Could not parse {self._vertical.__name__} from {self._raw_data!r}'
+                )
+        return self._vertical_obj
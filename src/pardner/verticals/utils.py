@@ -0,0 +1,44 @@
+import types
+import typing
+from typing import Any, Callable, Optional, TypeVar
+
+Converter = Callable[[Any], Any]
+Mapped = TypeVar('Mapped')
+
+
+def map_annotation(
+    annotation: Any,
+    map_type: Callable[[Any], Mapped],
+    map_list: Callable[[Mapped], Mapped],
+) -> Mapped:
+    """
+    Maps the type annotation of a field, e.g., to a function converting the values
+    of the field.
+
+    :param annotation: the type annotation. ``Optional`` annotations are mapped like
+    the type they wrap.
+    :param map_type: maps annotations that aren't ``Optional`` or ``list`` (e.g.,
+    models, timestamps, unions of several types).
+    :param map_list: maps ``list`` annotations, given the mapping of their items.
+
+    :returns: the mapping of ``annotation``.
+    """
+    origin = typing.get_origin(annotation)
+    if origin in (typing.Union, types.UnionType):
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return map_annotation(args[0], map_type, map_list)
+    elif origin is list:
+        (item_annotation,) = typing.get_args(annotation)
+        return map_list(map_annotation(item_annotation, map_type, map_list))
+    return map_type(annotation)
+
+
+def convert_items(convert_item: Optional[Converter]) -> Optional[Converter]:
+    """
+    :returns: a function converting each item of a list with ``convert_item``, or
+    ``None`` if the items are kept as is (``convert_item`` is ``None``).
+    """
+    if convert_item is None:
+        return None
+    return lambda value: [convert_item(item) for item in value]
@@ -0,0 +1,105 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from pardner.serialization import (
+    decode_vertical,
+    decode_verticals,
+    encode_vertical,
+    encode_verticals,
+)
+from pardner.serialization.msgpack_codec import LAYOUTS, _Layout
+from pardner.verticals import (
+    BaseVertical,
+    ChatBotVertical,
+    ConversationGroupVertical,
+    PhysicalActivityVertical,
+    SocialPostingVertical,
+)
+from pardner.verticals.sub_verticals import AssociatedMediaSubVertical
+
+msgpack = pytest.importorskip('msgpack')
+
+
+@pytest.fixture
+def vertical_objs():
+    shared_posting = SocialPostingVertical(
+        service='Tumblr', data_owner_id='1', text='shared'
+    )
+    return [
+        PhysicalActivityVertical(
+            service='Strava',
+            service_object_id=1,
+            data_owner_id='1',
+            created_at=datetime(2025, 1, 1, 12, tzinfo=timezone.utc),
+            start_datetime=datetime(2025, 1, 1, 12),
+            distance=1000.0,
+            keywords=['run'],
+            associated_media=[
+                AssociatedMediaSubVertical(
+                    media_type='image', url='https://a.com/1.jpg'
+                )
+            ],
+        ),
+        SocialPostingVertical(
+            service='Tumblr',
+            data_owner_id='1',
+            url='https://tumblr.com/1',
+            shared_content=[shared_posting],
+        ),
+        ConversationGroupVertical(service='GroupMe', data_owner_id='1'),
+    ]
+
+
+def test_round_trip(vertical_objs):
+    activity = vertical_objs[0]
+    payload = encode_vertical(activity)
+    decoded_activity = decode_vertical(payload)
+
+    assert len(payload) < len(activity.model_dump_json()) / 2
+    assert type(decoded_activity) is PhysicalActivityVertical
+    # URLs aren't validated, so remain strings
+    assert decoded_activity.associated_media[0].url == 'https://a.com/1.jpg'
+    assert decoded_activity.start_datetime == datetime(2025, 1, 1, 12)
+    assert decoded_activity.model_dump_json(warnings=False) == (
+        activity.model_dump_json()
+    )
+
+
+def test_bulk_round_trip(vertical_objs):
+    decoded_objs = decode_verticals(encode_verticals([*vertical_objs, None]))
+
+    assert [
+        vertical_obj.model_dump(mode='json', warnings=False)
+        for vertical_obj in decoded_objs
+    ] == [vertical_obj.model_dump(mode='json') for vertical_obj in vertical_objs]
+    assert decoded_objs[1].shared_content[0].text == 'shared'
+
+
+def test_decodes_other_versions():
+    chat_bot = ChatBotVertical(service='GroupMe', data_owner_id='1', name='bot')
+    row = msgpack.unpackb(encode_vertical(chat_bot))
+    vertical_name, version, *values = row
+
+    # encoded before ``name`` was added
+    older_payload = msgpack.packb([vertical_name, version - 1, *values[:-1]])
+    assert decode_vertical(older_payload).name is None
+
+    # encoded after another field was added
+    newer_payload = msgpack.packb([vertical_name, version + 1, *values, 'new value'])
+    assert decode_vertical(newer_payload) == chat_bot
+
+    with pytest.raises(ValueError):
+        decode_vertical(msgpack.packb([vertical_name, version + 1, *values]))
+
+
+def test_every_vertical_has_a_layout():
+    verticals = [*BaseVertical.__subclasses__(), AssociatedMediaSubVertical]
+    while verticals:
+        vertical = verticals.pop()
+        verticals.extend(vertical.__subclasses__())
+        # skips the verticals defined by tests
+        if vertical.__module__.startswith('pardner.'):
+            assert vertical in LAYOUTS
+            # fails if a field is missing from the layout
+            _Layout(vertical)
@@ -0,0 +1,86 @@
+from datetime import datetime, timezone
+
+import pytest
+from pydantic import ValidationError
+
+from pardner.serialization import NDJSONWriter, iter_ndjson
+from pardner.verticals import (
+    ConversationGroupVertical,
+    PhysicalActivityVertical,
+    SocialPostingVertical,
+    get_vertical_class,
+)
+from pardner.verticals.sub_verticals import AssociatedMediaSubVertical
+
+
+@pytest.fixture
+def vertical_objs():
+    shared_posting = SocialPostingVertical(
+        service='Tumblr', data_owner_id='1', text='shared'
+    )
+    return [
+        PhysicalActivityVertical(
+            service='Strava',
+            service_object_id=1,
+            data_owner_id='1',
+            created_at=datetime(2025, 1, 1, 12, tzinfo=timezone.utc),
+            distance=1000.0,
+            associated_media=[
+                AssociatedMediaSubVertical(
+                    media_type='image', url='https://a.com/1.jpg'
+                )
+            ],
+        ),
+        SocialPostingVertical(
+            service='Tumblr',
+            data_owner_id='1',
+            url='https://tumblr.com/1',
+            shared_content=[shared_posting],
+        ),
+        None,
+        ConversationGroupVertical(service='GroupMe', data_owner_id='1'),
+    ]
+
+
+@pytest.mark.parametrize('suffix', ['jsonl', 'jsonl.gz', 'jsonl.zst'])
+def test_round_trip(tmp_path, vertical_objs, suffix):
+    if suffix.endswith('.zst'):
+        pytest.importorskip('zstandard')
+    path = str(tmp_path / f'export.{suffix}')
+    with NDJSONWriter(path) as writer:
+        writer.write_all(vertical_objs)
+
+    assert list(iter_ndjson(path)) == [
+        vertical_obj for vertical_obj in vertical_objs if vertical_obj is not None
+    ]
+
+
+def test_trusted_round_trip(tmp_path, vertical_objs):
+    path = str(tmp_path / 'export.jsonl')
+    with NDJSONWriter(path) as writer:
+        writer.write_all(vertical_objs)
+
+    activity, posting, conversation = iter_ndjson(path, trusted=True)
+
+    assert type(activity) is PhysicalActivityVertical
+    assert activity.created_at == datetime(2025, 1, 1, 12, tzinfo=timezone.utc)
+    assert activity.associated_media[0].media_type == 'image'
+    # URLs aren't validated, so remain strings
+    assert activity.associated_media[0].url == 'https://a.com/1.jpg'
+    assert posting.shared_content[0].text == 'shared'
+    assert posting.url == 'https://tumblr.com/1'
+    assert conversation.model_dump() == vertical_objs[3].model_dump()
+
+
+def test_validates_untrusted_lines(tmp_path):
+    path = tmp_path / 'export.jsonl'
+    path.write_text('{"vertical_name": "physical_activity", "service": "Strava"}\n')
+
+    with pytest.raises(ValidationError):
+        list(iter_ndjson(str(path)))
+
+
+def test_get_vertical_class():
+    assert get_vertical_class('conversation_group') is ConversationGroupVertical
+    with pytest.raises(KeyError):
+        get_vertical_class('unknown')
@@ -0,0 +1,95 @@
+import os
+from datetime import datetime, timezone
+
+import pytest
+
+from pardner.serialization import ParquetSink
+from pardner.verticals import (
+    ConversationGroupVertical,
+    PhysicalActivityVertical,
+    SocialPostingVertical,
+)
+from pardner.verticals.sub_verticals import AssociatedMediaSubVertical
+
+pytest.importorskip('pyarrow')
+import pyarrow.dataset as ds  # noqa: E402
+
+
+def activity(activity_id, day=1, **fields):
+    return PhysicalActivityVertical(
+        service='Strava',
+        service_object_id=activity_id,
+        data_owner_id='1',
+        created_at=datetime(2025, 1, day, 12, tzinfo=timezone.utc),
+        distance=1000.0,
+        associated_media=[
+            AssociatedMediaSubVertical(media_type='image', url='https://a.com/1.jpg')
+        ],
+        **fields,
+    )
+
+
+def read_partition(path, *partition):
+    return ds.dataset(os.path.join(path, *partition), partitioning='hive').to_table()
+
+
+def test_partitions_and_nested_columns(tmp_path):
+    shared_posting = SocialPostingVertical(
+        service='Strava', data_owner_id='1', text='shared'
+    )
+    with ParquetSink(str(tmp_path)) as sink:
+        sink.write_all(
+            [
+                activity(1),
+                activity(2, day=2, shared_content=[shared_posting]),
+                None,
+                ConversationGroupVertical(
+                    service='GroupMe', data_owner_id='1', member_user_ids=['1', '2']
+                ),
+            ]
+        )
+
+    assert sorted(
+        os.listdir(tmp_path / 'service=Strava' / 'vertical_name=physical_activity')
+    ) == ['date=2025-01-01', 'date=2025-01-02']
+    activities = (
+        read_partition(tmp_path, 'service=Strava', 'vertical_name=physical_activity')
+        .sort_by('service_object_id')
+        .to_pylist()
+    )
+    assert [row['service_object_id'] for row in activities] == ['1', '2']
+    assert activities[0]['associated_media'] == [
+        {'media_type': 'image', 'url': 'https://a.com/1.jpg'}
+    ]
+    assert activities[1]['shared_content'][0]['text'] == 'shared'
+    # postings nested in postings are stored as JSON
+    assert activities[1]['shared_content'][0]['shared_content'] == []
+
+    groups = read_partition(
+        tmp_path,
+        'service=GroupMe',
+        'vertical_name=conversation_group',
+        'date=__HIVE_DEFAULT_PARTITION__',
+    ).to_pylist()
+    assert groups[0]['member_user_ids'] == ['1', '2']
+
+
+def test_row_groups_and_open_files(tmp_path):
+    with ParquetSink(str(tmp_path), row_group_size=2, max_open_files=1) as sink:
+        for activity_id in range(5):
+            sink.write(activity(activity_id, day=1))
+        assert len(sink._writers[next(iter(sink._writers))].pending) == 1
+        sink.write(activity(5, day=2))
+        sink.write(activity(6, day=1))
+
+    day_one = (
+        tmp_path
+        / 'service=Strava'
+        / 'vertical_name=physical_activity'
+        / 'date=2025-01-01'
+    )
+    # the first file was closed when the second partition was written to
+    assert len(os.listdir(day_one)) == 2
+    fragments = list(ds.dataset(str(day_one)).get_fragments())
+    assert sorted(fragment.metadata.num_row_groups for fragment in fragments) == [1, 3]
+    assert ds.dataset(str(day_one)).count_rows() == 6
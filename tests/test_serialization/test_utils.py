@@ -0,0 +1,37 @@
+from typing import Optional
+
+from pardner.serialization.utils import ModelMapping, map_annotation
+from pardner.verticals import SocialPostingVertical
+
+
+def describe(annotation):
+    return map_annotation(
+        annotation,
+        lambda annotation: getattr(annotation, '__name__', 'other'),
+        lambda item: f'list[{item}]',
+    )
+
+
+def test_map_annotation():
+    assert describe(int) == 'int'
+    assert describe(Optional[int]) == 'int'
+    assert describe(list[str] | None) == 'list[str]'
+    assert describe(Optional[list[Optional[float]]]) == 'list[float]'
+    assert describe(int | str) == 'other'
+
+
+class FieldNames(ModelMapping):
+    def map_fields(self):
+        self.nested = {
+            field_name: FieldNames.get(SocialPostingVertical)
+            for field_name in self.model.model_fields
+            if field_name == 'shared_content'
+        }
+
+
+def test_model_mapping_supports_models_containing_themselves():
+    mapping = FieldNames.get(SocialPostingVertical)
+
+    assert mapping.model is SocialPostingVertical
+    assert mapping.nested['shared_content'] is mapping
+    assert FieldNames.get(SocialPostingVertical) is mapping
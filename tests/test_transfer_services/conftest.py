@@ -6,6 +6,7 @@ from pardner.services import (
     GroupMeTransferService,
     StravaTransferService,
     TumblrTransferService,
+    rate_limit,
 )
 from pardner.verticals import (
     BlockedUserVertical,
@@ -29,6 +30,11 @@ class ExtraScopeVertical(BaseVertical):
 # FIXTURES
 
 
+@pytest.fixture(autouse=True)
+def reset_rate_limiters(monkeypatch):
+    monkeypatch.setattr(rate_limit, '_rate_limiters', {})
+
+
 @pytest.fixture
 def mock_nested_dict(mocker):
     def nested_dict():
@@ -86,6 +92,7 @@ def mock_oauth2_bad_response(mocker):
     mock_response = mocker.create_autospec(Response)
     mock_response.ok = False
     mock_response.status_code = 400
+    mock_response.headers = {}
     mock_response.reason = 'fake reason'
     mock_response.url = 'fake url'
     mock_response.raise_for_status = lambda: Response.raise_for_status(mock_response)
@@ -104,8 +111,10 @@ def mock_oauth2_good_response(mocker, mock_nested_dict):
     mock_response = mocker.create_autospec(Response)
     mock_response.ok = True
     mock_response.status_code = 200
+    mock_response.headers = {}
     mock_response.url = 'fake url'
     mock_response.json.return_value = mock_nested_dict
+    mock_response.content = b'{}'
     return mock_response
 
 
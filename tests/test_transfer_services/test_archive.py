@@ -0,0 +1,140 @@
+import asyncio
+import json
+
+import pytest
+
+from pardner.services import AsyncStravaTransferService, RawResponseArchive
+from pardner.verticals import PhysicalActivityVertical
+from tests.test_transfer_services.conftest import mock_oauth2_session_get
+
+pytest.importorskip('zstandard')
+
+
+def raw_page(page):
+    return json.dumps(
+        [
+            {
+                'id': page * 10 + index,
+                'athlete': {'id': 1, 'resource_state': 1},
+                'name': f'Morning Run {page}-{index}',
+                'type': 'Run',
+                'distance': 1000.0 * index,
+                'start_date': '2018-05-02T12:15:09Z',
+            }
+            for index in range(10)
+        ]
+    ).encode()
+
+
+@pytest.fixture
+def raw_archive(tmp_path):
+    raw_archive = RawResponseArchive(
+        str(tmp_path / 'archive.db'), dictionary_size=4096, training_sample_count=50
+    )
+    yield raw_archive
+    raw_archive.close()
+
+
+def test_put_and_get(raw_archive):
+    raw_archive.put('strava', 'athlete/activities', 'page=1', b'[1]', fetched_at=1)
+    raw_archive.put('strava', 'athlete/activities', 'page=1', b'[2]', fetched_at=2)
+
+    assert raw_archive.get('strava', 'athlete/activities', 'page=1') == b'[2]'
+    assert raw_archive.get('strava', 'athlete/activities', 'page=1', 1) == b'[1]'
+    assert raw_archive.get('strava', 'athlete/activities', 'page=2') is None
+
+
+def test_dictionary_is_trained(raw_archive):
+    for page in range(60):
+        raw_archive.put('strava', 'athlete/activities', f'page={page}', raw_page(page))
+
+    dictionary_ids = {
+        dictionary_id
+        for (dictionary_id,) in raw_archive._connection.execute(
+            'SELECT dictionary_id FROM responses'
+        )
+    }
+    assert len(dictionary_ids) == 1
+    assert None not in dictionary_ids
+    assert [
+        archived_response.content
+        for archived_response in raw_archive.iter_responses('strava')
+    ] == [raw_page(page) for page in range(60)]
+
+
+def test_iter_responses_filters_by_endpoint(raw_archive):
+    raw_archive.put('strava', 'athlete/activities', 'page=1', b'[]', fetched_at=2)
+    raw_archive.put('strava', 'athlete', '{}', b'{}', fetched_at=1)
+    raw_archive.put('tumblr', 'user/dashboard', '{}', b'{}', fetched_at=3)
+
+    assert [
+        archived_response.endpoint
+        for archived_response in raw_archive.iter_responses('strava')
+    ] == ['athlete', 'athlete/activities']
+    assert [
+        archived_response.cursor
+        for archived_response in raw_archive.iter_responses(
+            'strava', 'athlete/activities'
+        )
+    ] == ['page=1']
+
+
+def test_service_archives_and_reparses_pages(
+    mocker, raw_archive, strava_transfer_service
+):
+    response_object = mocker.MagicMock()
+    response_object.content = raw_page(0)
+    oauth2_session_get = mock_oauth2_session_get(mocker, response_object)
+    strava_transfer_service.raw_archive = raw_archive
+
+    activities, _ = strava_transfer_service.fetch(PhysicalActivityVertical, limit=10)
+    oauth2_session_get.reset_mock()
+    reparsed_activities = list(
+        raw_archive.reparse(strava_transfer_service, PhysicalActivityVertical)
+    )
+
+    oauth2_session_get.assert_not_called()
+    assert [activity.service_object_id for activity in reparsed_activities] == [
+        activity.service_object_id for activity in activities
+    ]
+
+
+def test_groupme_archives_common_resources(
+    mocker, raw_archive, groupme_transfer_service
+):
+    groupme_transfer_service._user_id = 'fake_user_id'
+    groupme_transfer_service.raw_archive = raw_archive
+    response_object = mocker.MagicMock()
+    response_object.content = json.dumps({'response': {'blocks': []}}).encode()
+    mock_oauth2_session_get(mocker, response_object)
+
+    groupme_transfer_service.fetch_blocked_user_vertical()
+
+    assert [
+        (archived_response.endpoint, archived_response.content)
+        for archived_response in raw_archive.iter_responses('GroupMe')
+    ] == [('blocks', response_object.content)]
+
+
+def test_async_service_archives_pages(raw_archive):
+    httpx = pytest.importorskip('httpx')
+    strava = AsyncStravaTransferService(
+        'fake_client_id',
+        'fake_client_secret',
+        'https://redirect_uri',
+        None,
+        {PhysicalActivityVertical},
+    )
+    strava.raw_archive = raw_archive
+    strava.async_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(
+            lambda _: httpx.Response(200, content=raw_page(0))
+        )
+    )
+
+    activities = asyncio.run(strava.afetch(PhysicalActivityVertical, limit=10))
+    reparsed_activities = list(raw_archive.reparse(strava, PhysicalActivityVertical))
+
+    assert [activity.service_object_id for activity in reparsed_activities] == [
+        activity.service_object_id for activity in activities
+    ]
@@ -0,0 +1,164 @@
+import asyncio
+
+import pytest
+
+from pardner.services import (
+    AsyncGroupMeTransferService,
+    AsyncStravaTransferService,
+    AsyncTumblrTransferService,
+    SharedTransport,
+)
+from pardner.verticals import (
+    ConversationGroupVertical,
+    PhysicalActivityVertical,
+    SocialPostingVertical,
+)
+
+httpx = pytest.importorskip('httpx')
+
+
+def mock_async_client(handler):
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.fixture
+def async_strava_transfer_service():
+    strava = AsyncStravaTransferService(
+        'fake_client_id',
+        'fake_client_secret',
+        'https://redirect_uri',
+        None,
+        {PhysicalActivityVertical},
+    )
+    strava._oAuth2Session.token = {'access_token': 'fake_token', 'token_type': 'Bearer'}
+    return strava
+
+
+def test_afetch(async_strava_transfer_service):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        page = int(request.url.params['page'])
+        activities = [{'id': page, 'athlete': {'id': 1}}] * (200 if page == 1 else 1)
+        return httpx.Response(200, json=activities)
+
+    async_strava_transfer_service.async_client = mock_async_client(handler)
+
+    async def afetch():
+        async with async_strava_transfer_service:
+            return await async_strava_transfer_service.afetch(PhysicalActivityVertical)
+
+    activities = asyncio.run(afetch())
+
+    assert len(activities) == 201
+    assert all(
+        isinstance(activity, PhysicalActivityVertical) for activity in activities
+    )
+    assert [str(request.url.path) for request in requests] == [
+        '/api/v3/athlete/activities'
+    ] * 2
+    assert requests[0].headers['Authorization'] == 'Bearer fake_token'
+    assert async_strava_transfer_service.async_client is None
+
+
+def test_afetch_raises_http_exception(async_strava_transfer_service):
+    async_strava_transfer_service.async_client = mock_async_client(
+        lambda _: httpx.Response(400)
+    )
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(async_strava_transfer_service.afetch(PhysicalActivityVertical))
+
+
+def test_afetch_requires_httpx(mocker, async_strava_transfer_service):
+    mocker.patch('pardner.services.async_base.httpx', None)
+    with pytest.raises(ImportError):
+        asyncio.run(async_strava_transfer_service.afetch(PhysicalActivityVertical))
+
+
+def test_afetch_groupme():
+    groupme = AsyncGroupMeTransferService(
+        client_id='fake_client_id',
+        redirect_uri='https://redirect_uri',
+        verticals={ConversationGroupVertical},
+    )
+    groupme._oAuth2Session.token = {'access_token': 'fake_token'}
+
+    def handler(request):
+        if request.url.path == '/v3/users/me':
+            return httpx.Response(200, json={'response': {'id': 'fake_user_id'}})
+        assert request.url.params['user'] == 'fake_user_id'
+        assert request.url.params['token'] == 'fake_token'
+        return httpx.Response(200, json={'response': [{'id': 'group_id'}]})
+
+    groupme.async_client = mock_async_client(handler)
+
+    (group,) = asyncio.run(groupme.afetch(ConversationGroupVertical, limit=5))
+    assert group.service_object_id == 'group_id'
+    assert group.data_owner_id == 'fake_user_id'
+
+
+def test_afetch_primary_blog_id():
+    tumblr = AsyncTumblrTransferService(
+        'fake_client_id', 'fake_client_secret', 'https://redirect_uri', None
+    )
+    tumblr.async_client = mock_async_client(
+        lambda _: httpx.Response(
+            200,
+            json={'response': {'user': {'blogs': [{'primary': True, 'uuid': 'id'}]}}},
+        )
+    )
+
+    assert asyncio.run(tumblr.afetch_primary_blog_id()) == 'id'
+    assert tumblr.primary_blog_id == 'id'
+
+
+def test_aiter_vertical_tumblr():
+    tumblr = AsyncTumblrTransferService(
+        'fake_client_id', 'fake_client_secret', 'https://redirect_uri', None
+    )
+    tumblr.async_client = mock_async_client(
+        lambda _: httpx.Response(200, json={'response': {'posts': ['post'] * 20}})
+    )
+
+    async def aiter_vertical():
+        return [
+            post
+            async for post in tumblr.aiter_vertical(SocialPostingVertical, limit=30)
+        ]
+
+    assert asyncio.run(aiter_vertical()) == ['post'] * 30
+
+
+def test_afetch_retries(mocker, async_strava_transfer_service):
+    mock_sleep = mocker.patch('asyncio.sleep')
+    responses = iter([httpx.Response(502), httpx.Response(200, json=[])])
+    async_strava_transfer_service.async_client = mock_async_client(
+        lambda _: next(responses)
+    )
+
+    assert (
+        asyncio.run(async_strava_transfer_service.afetch(PhysicalActivityVertical))
+        == []
+    )
+    assert mock_sleep.call_count == 1
+
+
+def test_services_share_async_client(monkeypatch, async_strava_transfer_service):
+    transport = SharedTransport(pool_maxsize=3, pool_block=True)
+    monkeypatch.setattr(AsyncStravaTransferService, 'transport', transport)
+    other_strava_transfer_service = AsyncStravaTransferService(
+        'other_client_id', 'other_client_secret', 'https://redirect_uri'
+    )
+
+    async_client = async_strava_transfer_service._get_async_client()
+    assert other_strava_transfer_service._get_async_client() is async_client
+    assert async_client is transport.get_async_client('https://www.strava.com/')
+    assert async_client._transport._pool._max_connections == 3
+    assert async_client._transport._pool._max_keepalive_connections == 3
+
+    # closing a service leaves the shared client open for the others
+    asyncio.run(async_strava_transfer_service.aclose())
+    assert not async_client.is_closed
+    asyncio.run(transport.aclose())
+    assert async_client.is_closed
@@ -1,14 +1,22 @@
+import json
 from urllib import parse
 
 import pytest
 
+from pardner.exceptions import UnsupportedRequestException
 from pardner.services import (
     BaseTransferService,
     InsufficientScopeException,
     UnsupportedVerticalException,
 )
+from pardner.services.decoding import default_json_decoder, stdlib_json_decoder
+from pardner.services.pagination import OffsetPaginator, PaginatedResource
 from pardner.verticals import SocialPostingVertical
-from tests.test_transfer_services.conftest import ExtraScopeVertical, NewVertical
+from tests.test_transfer_services.conftest import (
+    ExtraScopeVertical,
+    NewVertical,
+    mock_oauth2_session_get,
+)
 
 SAMPLE_SCOPE = {'fake', 'scope'}
 SAMPLE_BASE_URL = 'https://api.example.com/v1'
@@ -126,3 +134,86 @@ def test_fetch_token_raises_error(mock_transfer_service):
 def test__build_resource_url(path, base, mock_transfer_service):
     resource_url = mock_transfer_service._build_resource_url(path, base)
     assert resource_url == 'https://api.example.com/v1/test/path'
+
+
+@pytest.fixture
+def paginated_transfer_service(mock_transfer_service, monkeypatch):
+    monkeypatch.setattr(
+        mock_transfer_service,
+        '_paginated_resources',
+        {
+            'social_posting': PaginatedResource(
+                'posts', OffsetPaginator(max_page_size=2), items_path=('posts',)
+            )
+        },
+    )
+    return mock_transfer_service
+
+
+def test_iter_vertical(mocker, paginated_transfer_service):
+    full_page = mocker.MagicMock()
+    full_page.content = json.dumps({'posts': ['first', 'second']}).encode()
+    last_page = mocker.MagicMock()
+    last_page.content = json.dumps({'posts': ['third']}).encode()
+    oauth2_session_get = mock_oauth2_session_get(mocker)
+    oauth2_session_get.side_effect = [full_page, last_page]
+
+    assert list(paginated_transfer_service.iter_vertical(SocialPostingVertical)) == [
+        'first',
+        'second',
+        'third',
+    ]
+    assert [call.kwargs['params'] for call in oauth2_session_get.call_args_list] == [
+        {'limit': 2},
+        {'limit': 2, 'offset': 2},
+    ]
+
+
+def test_fetch_passes_limit_as_count(blank_transfer_service):
+    calls = []
+
+    def fetch_social_posting_vertical(request_params={}, count=10, text_only=True):
+        calls.append((request_params, count, text_only))
+        return ['post'] * count
+
+    blank_transfer_service.fetch_social_posting_vertical = fetch_social_posting_vertical
+
+    assert (
+        blank_transfer_service.fetch(
+            SocialPostingVertical, {'param': 1}, limit=3, text_only=False
+        )
+        == ['post'] * 3
+    )
+    assert calls == [({'param': 1}, 3, False)]
+    with pytest.raises(ValueError):
+        blank_transfer_service.fetch(SocialPostingVertical, limit=3, count=4)
+
+
+def test_fetch_with_limit_raises_exception(blank_transfer_service):
+    blank_transfer_service.fetch_social_posting_vertical = lambda request_params: []
+    with pytest.raises(UnsupportedRequestException):
+        blank_transfer_service.fetch(SocialPostingVertical, limit=3)
+
+
+def test_iter_vertical_raises_exception(mock_transfer_service):
+    with pytest.raises(UnsupportedRequestException):
+        next(mock_transfer_service.iter_vertical(SocialPostingVertical))
+
+
+def test_default_json_decoder():
+    orjson = pytest.importorskip('orjson')
+    assert default_json_decoder is orjson.loads
+    assert stdlib_json_decoder(b'{"posts": [1]}') == {'posts': [1]}
+
+
+def test_iter_vertical_uses_json_decoder(mocker, paginated_transfer_service):
+    response_object = mocker.MagicMock()
+    response_object.content = b'{"posts": ["post"]}'
+    mock_oauth2_session_get(mocker, response_object)
+    json_decoder = mocker.MagicMock(wraps=stdlib_json_decoder)
+    paginated_transfer_service.json_decoder = json_decoder
+
+    assert list(paginated_transfer_service.iter_vertical(SocialPostingVertical)) == [
+        'post'
+    ]
+    json_decoder.assert_called_once_with(b'{"posts": ["post"]}')
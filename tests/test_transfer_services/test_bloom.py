@@ -0,0 +1,76 @@
+import json
+
+import pytest
+
+from pardner.services import BloomDedupIndex, InMemoryDedupIndex, ScalableBloomFilter
+from pardner.verticals import PhysicalActivityVertical
+from tests.test_transfer_services.conftest import mock_oauth2_session_get
+
+
+def test_scalable_bloom_filter_grows():
+    bloom_filter = ScalableBloomFilter(initial_capacity=100, error_rate=0.01)
+    keys = [f'key-{index}' for index in range(1000)]
+    for key in keys:
+        bloom_filter.add(key)
+
+    assert len(bloom_filter._slices) > 1
+    assert all(key in bloom_filter for key in keys)
+    false_positives = sum(f'other-{index}' in bloom_filter for index in range(1000))
+    assert false_positives <= 30
+
+
+def test_scalable_bloom_filter_persists(tmp_path):
+    path = str(tmp_path / 'bloom')
+    bloom_filter = ScalableBloomFilter(path, initial_capacity=10)
+    assert all(bloom_filter.add(f'key-{index}') for index in range(50))
+    bloom_filter.flush()
+    bloom_filter.close()
+
+    bloom_filter = ScalableBloomFilter(path, initial_capacity=10)
+    assert len(bloom_filter) == 50
+    assert 'key-7' in bloom_filter
+    assert not bloom_filter.add('key-7')
+    bloom_filter.clear()
+    assert 'key-7' not in bloom_filter
+    bloom_filter.close()
+
+
+def test_bloom_dedup_index_checks_positives():
+    exact = InMemoryDedupIndex()
+    dedup_index = BloomDedupIndex(exact=exact)
+    assert dedup_index.add('a')
+    assert 'a' in exact
+
+    # simulates a false positive of the filter
+    dedup_index.bloom_filter.add('b')
+    assert 'b' not in dedup_index
+    assert dedup_index.add('b')
+    assert not dedup_index.add('b')
+
+
+def test_iter_vertical_until_seen(mocker, strava_transfer_service):
+    response_object = mocker.MagicMock()
+    response_object.content = json.dumps(
+        [{'id': activity_id, 'athlete': {'id': 1}} for activity_id in (3, 2, 1)]
+    ).encode()
+    mock_oauth2_session_get(mocker, response_object)
+    strava_transfer_service.dedup_index = BloomDedupIndex()
+    list(strava_transfer_service.iter_vertical(PhysicalActivityVertical, limit=1))
+
+    response_object.content = json.dumps(
+        [{'id': activity_id, 'athlete': {'id': 1}} for activity_id in (5, 4, 3, 2)]
+    ).encode()
+    activities = strava_transfer_service.iter_vertical(
+        PhysicalActivityVertical, until_seen=True
+    )
+
+    assert [activity.service_object_id for activity in activities] == ['5', '4']
+
+
+def test_iter_vertical_until_seen_requires_dedup_index(strava_transfer_service):
+    with pytest.raises(ValueError):
+        next(
+            strava_transfer_service.iter_vertical(
+                PhysicalActivityVertical, until_seen=True
+            )
+        )
@@ -0,0 +1,167 @@
+import json
+
+import pytest
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+from pardner.services.cache import (
+    CacheEntry,
+    HTTPCache,
+    InMemoryCacheBackend,
+    SQLiteCacheBackend,
+)
+from tests.test_transfer_services.conftest import mock_oauth2_session_get
+
+ACTIVITIES_URL = 'https://www.strava.com/api/v3/athlete/activities'
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_response(status_code=200, headers={}, body=None, url=ACTIVITIES_URL):
+    response = Response()
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict(headers)
+    response.url = url
+    response._content = json.dumps(body).encode() if body is not None else b''
+    return response
+
+
+def make_entry(content=b'[]', stored_at=0.0, url=ACTIVITIES_URL):
+    return CacheEntry(url, 200, {'ETag': '"abc"'}, content, stored_at)
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def cache_backend(request, tmp_path):
+    if request.param == 'memory':
+        return InMemoryCacheBackend(max_bytes=10)
+    return SQLiteCacheBackend(str(tmp_path / 'cache.sqlite'), max_bytes=10)
+
+
+def test_cache_backend_get_set_delete(cache_backend):
+    assert cache_backend.get('a') is None
+    cache_backend.set('a', make_entry(b'1234'))
+    assert cache_backend.get('a') == make_entry(b'1234')
+    cache_backend.delete('a')
+    assert cache_backend.get('a') is None
+
+
+def test_cache_backend_evicts_least_recently_used(cache_backend, mocker):
+    mocker.patch('time.time', side_effect=range(100))
+    cache_backend.set('a', make_entry(b'1234'))
+    cache_backend.set('b', make_entry(b'1234'))
+    cache_backend.get('a')
+    cache_backend.set('c', make_entry(b'1234'))
+    assert cache_backend.get('a') is not None
+    assert cache_backend.get('b') is None
+    assert cache_backend.get('c') is not None
+
+
+def test_cache_backend_skips_oversized_entries(cache_backend):
+    cache_backend.set('a', make_entry(b'x' * 11))
+    assert cache_backend.get('a') is None
+
+
+def test_in_memory_cache_backend_max_entries():
+    backend = InMemoryCacheBackend(max_entries=1)
+    backend.set('a', make_entry())
+    backend.set('b', make_entry())
+    assert len(backend) == 1
+    assert backend.get('a') is None
+
+
+def test_sqlite_cache_backend_persists(tmp_path):
+    path = str(tmp_path / 'cache.sqlite')
+    backend = SQLiteCacheBackend(path)
+    backend.set('a', make_entry())
+    backend.close()
+    assert SQLiteCacheBackend(path).get('a') == make_entry()
+
+
+def test_http_cache_key():
+    cache = HTTPCache()
+    assert cache.key(ACTIVITIES_URL, {'page': 1, 'per_page': 2}) == cache.key(
+        ACTIVITIES_URL, {'per_page': 2, 'page': 1}
+    )
+    assert cache.key(ACTIVITIES_URL, {'page': 1}) != cache.key(
+        ACTIVITIES_URL, {'page': 2}
+    )
+    assert cache.key(ACTIVITIES_URL, {}, 'token_1') != cache.key(
+        ACTIVITIES_URL, {}, 'token_2'
+    )
+
+
+def test_http_cache_ttl():
+    cache = HTTPCache(default_ttl=1, ttls={'activities': 10, 'athlete/activities': 100})
+    assert cache.ttl(ACTIVITIES_URL) == 100
+    assert cache.ttl('https://www.strava.com/api/v3/activities') == 10
+    assert cache.ttl('https://api.groupme.com/v3/groups') == 1
+
+
+def test_http_cache_conditional_headers():
+    entry = CacheEntry(
+        ACTIVITIES_URL,
+        200,
+        {'etag': '"abc"', 'Last-Modified': 'Wed, 21 Oct 2015 07:28:00 GMT'},
+        b'[]',
+        0.0,
+    )
+    assert HTTPCache().conditional_headers(entry) == {
+        'If-None-Match': '"abc"',
+        'If-Modified-Since': 'Wed, 21 Oct 2015 07:28:00 GMT',
+    }
+    assert HTTPCache().conditional_headers(None) == {}
+
+
+def test_http_cache_only_stores_cacheable_responses():
+    cache = HTTPCache()
+    cache.update('a', make_response(body=[]))
+    cache.update('b', make_response(404, {'ETag': '"abc"'}))
+    assert cache.get('a') is None
+    assert cache.get('b') is None
+
+    cache.update('c', make_response(headers={'ETag': '"abc"'}, body=[1]))
+    assert cache.get('c').content == b'[1]'
+
+
+def test_get_resource_serves_fresh_responses_from_cache(
+    mocker, strava_transfer_service
+):
+    strava_transfer_service.cache = HTTPCache(ttls={'athlete/activities': 60})
+    oauth2_session_get = mock_oauth2_session_get(
+        mocker, make_response(body=[{'id': 1}])
+    )
+
+    for _ in range(2):
+        response = strava_transfer_service._get_resource(ACTIVITIES_URL, {'page': 1})
+        assert response.json() == [{'id': 1}]
+    assert oauth2_session_get.call_count == 1
+
+
+def test_get_resource_revalidates_stale_responses(mocker, strava_transfer_service):
+    clock = FakeClock()
+    strava_transfer_service.cache = HTTPCache(clock=clock)
+    oauth2_session_get = mock_oauth2_session_get(mocker)
+    oauth2_session_get.side_effect = [
+        make_response(headers={'ETag': '"v1"'}, body=[{'id': 1}]),
+        make_response(304, {'ETag': '"v1"'}),
+        make_response(headers={'ETag': '"v2"'}, body=[{'id': 2}]),
+    ]
+
+    first = strava_transfer_service._get_resource(ACTIVITIES_URL)
+    second = strava_transfer_service._get_resource(ACTIVITIES_URL)
+    third = strava_transfer_service._get_resource(ACTIVITIES_URL)
+
+    assert [call.kwargs['headers'] for call in oauth2_session_get.call_args_list] == [
+        {},
+        {'If-None-Match': '"v1"'},
+        {'If-None-Match': '"v1"'},
+    ]
+    assert first.json() == second.json() == [{'id': 1}]
+    assert second.status_code == 200
+    assert third.json() == [{'id': 2}]
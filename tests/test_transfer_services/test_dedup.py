@@ -0,0 +1,98 @@
+import json
+
+import pytest
+
+from pardner.services import InMemoryDedupIndex, SQLiteDedupIndex
+from pardner.services.dedup import get_dedup_key
+from pardner.verticals import PhysicalActivityVertical, deterministic_object_id
+from tests.test_transfer_services.conftest import mock_oauth2_session_get
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def dedup_index(request, tmp_path):
+    if request.param == 'memory':
+        yield InMemoryDedupIndex()
+        return
+    dedup_index = SQLiteDedupIndex(str(tmp_path / 'dedup.db'))
+    yield dedup_index
+    dedup_index.close()
+
+
+def activities_content(activity_ids):
+    return json.dumps(
+        [{'id': activity_id, 'athlete': {'id': 1}} for activity_id in activity_ids]
+    ).encode()
+
+
+def mock_activities(mocker, activity_ids):
+    response_object = mocker.MagicMock()
+    response_object.content = activities_content(activity_ids)
+    mock_oauth2_session_get(mocker, response_object)
+    return response_object
+
+
+def test_deterministic_object_id():
+    object_id = deterministic_object_id('Strava', 'physical_activity', '1')
+    assert object_id == deterministic_object_id('Strava', 'physical_activity', '1')
+    assert object_id != deterministic_object_id('Strava', 'social_posting', '1')
+    assert len(object_id) == 32
+
+
+@pytest.mark.parametrize('trusted_parsing', [False, True])
+def test_deterministic_ids(mocker, strava_transfer_service, trusted_parsing):
+    strava_transfer_service.deterministic_ids = True
+    strava_transfer_service.trusted_parsing = trusted_parsing
+    mock_activities(mocker, [1, 1])
+
+    (first, second), _ = strava_transfer_service.fetch(
+        PhysicalActivityVertical, limit=2
+    )
+
+    assert first.pardner_object_id == second.pardner_object_id
+    assert first.pardner_object_id == deterministic_object_id(
+        'Strava', 'physical_activity', '1'
+    )
+
+
+def test_random_ids_by_default(mocker, strava_transfer_service):
+    mock_activities(mocker, [1, 1])
+    (first, second), _ = strava_transfer_service.fetch(
+        PhysicalActivityVertical, limit=2
+    )
+    assert first.pardner_object_id != second.pardner_object_id
+
+
+def test_dedup_index_add(dedup_index):
+    assert dedup_index.add('a')
+    assert not dedup_index.add('a')
+    assert 'a' in dedup_index
+    dedup_index.clear()
+    assert 'a' not in dedup_index
+
+
+def test_iter_vertical_drops_seen_objects(mocker, dedup_index, strava_transfer_service):
+    strava_transfer_service.dedup_index = dedup_index
+    response_object = mock_activities(mocker, [1, 2, 1])
+    activities = list(
+        strava_transfer_service.iter_vertical(PhysicalActivityVertical, limit=3)
+    )
+    assert [activity.service_object_id for activity in activities] == ['1', '2']
+
+    # objects seen by earlier fetches are dropped too
+    response_object.content = activities_content([2, 3])
+    activities = list(
+        strava_transfer_service.iter_vertical(
+            PhysicalActivityVertical, limit=2, lazy=True
+        )
+    )
+    assert [activity.service_object_id for activity in activities] == ['3']
+
+
+def test_dedup_index_keeps_unidentified_objects(dedup_index):
+    assert get_dedup_key(None) is None
+    assert list(dedup_index.filter([None, None, {'id': 1}, {'id': 1}])) == [
+        None,
+        None,
+        {'id': 1},
+        {'id': 1},
+    ]
@@ -0,0 +1,91 @@
+from pardner.services.dedup import get_dedup_key
+from pardner.services.diff import Change, diff_verticals
+from pardner.verticals import (
+    ConversationGroupVertical,
+    LazyVertical,
+    SocialPostingVertical,
+)
+from pardner.verticals.sub_verticals import AssociatedMediaSubVertical
+
+
+def group(group_id, messages_count, **fields):
+    return ConversationGroupVertical(
+        service='GroupMe',
+        service_object_id=group_id,
+        data_owner_id='1',
+        messages_count=messages_count,
+        **fields,
+    )
+
+
+def test_content_hash_is_stable():
+    assert group('a', 1).content_hash() == group('a', 1).content_hash()
+    assert group('a', 1).content_hash() != group('a', 2).content_hash()
+    assert (
+        group('a', 1).content_hash()
+        == ConversationGroupVertical.model_construct(
+            **group('a', 1).model_dump()
+        ).content_hash()
+    )
+
+
+def test_content_hash_normalizes_urls():
+    fields = {
+        'pardner_object_id': 'a',
+        'service': 'Tumblr',
+        'service_object_id': '1',
+        'data_owner_id': '1',
+        'url': 'https://tumblr.com',
+    }
+    media = {'media_type': 'image', 'url': 'https://a.com'}
+    validated = SocialPostingVertical(
+        **fields,
+        associated_media=[AssociatedMediaSubVertical(**media)],
+        shared_content=[SocialPostingVertical(**fields)],
+    )
+    # as built with trusted_parsing, with URLs left as strings
+    trusted = SocialPostingVertical.model_construct(
+        **fields,
+        associated_media=[AssociatedMediaSubVertical.model_construct(**media)],
+        shared_content=[SocialPostingVertical.model_construct(**fields)],
+    )
+
+    assert str(validated.url) == 'https://tumblr.com/'
+    assert trusted.url == 'https://tumblr.com'
+    assert trusted.content_hash() == validated.content_hash()
+
+
+def test_lazy_vertical_content_hash():
+    vertical_obj = group('a', 1)
+    lazy_vertical = LazyVertical(
+        ConversationGroupVertical, {}, {}, lambda: vertical_obj
+    )
+    assert lazy_vertical.content_hash() == vertical_obj.content_hash()
+
+
+def test_diff_verticals():
+    content_hashes = {}
+    first_sync = list(diff_verticals([group('a', 1), group('b', 1)], content_hashes))
+    assert [change.kind for change in first_sync] == ['inserted', 'inserted']
+
+    b_updated, c_inserted = group('b', 2), group('c', 1)
+    second_sync = list(
+        diff_verticals([group('a', 1), b_updated, c_inserted, None], content_hashes)
+    )
+
+    assert second_sync == [
+        Change('updated', get_dedup_key(b_updated), b_updated),
+        Change('inserted', get_dedup_key(c_inserted), c_inserted),
+    ]
+    assert list(diff_verticals([group('b', 2)], content_hashes)) == [
+        Change('deleted', get_dedup_key(group('a', 1))),
+        Change('deleted', get_dedup_key(c_inserted)),
+    ]
+    assert set(content_hashes) == {get_dedup_key(b_updated)}
+
+
+def test_diff_verticals_without_deletions():
+    content_hashes = {}
+    list(diff_verticals([group('a', 1)], content_hashes))
+    assert list(diff_verticals([], content_hashes, detect_deletions=False)) == []
+    assert len(content_hashes) == 1
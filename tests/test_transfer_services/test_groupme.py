@@ -1,7 +1,8 @@
+import json
 from datetime import datetime, timezone
 
 import pytest
-from pydantic import AnyHttpUrl
+from pydantic import AnyHttpUrl, ValidationError
 
 from pardner.exceptions import UnsupportedRequestException
 from tests.test_transfer_services.conftest import (
@@ -40,7 +41,7 @@ def test_fetch_token(mock_oauth2_session_request, groupme_transfer_service):
 def test__fetch_resource_common_raises_exception(groupme_transfer_service, mocker):
     response_object = mocker.MagicMock()
     response_object.status_code = 200
-    response_object.json.return_value = {'response': {'id': USER_ID}}
+    response_object.content = json.dumps({'response': {'id': USER_ID}}).encode()
     oauth2_session_get = mock_oauth2_session_get(mocker, response_object)
 
     groupme_transfer_service._fetch_resource_common('https://api.groupme.com/v3/fake')
@@ -58,7 +59,7 @@ def test_fetch_user_data_raises_no_token(groupme_transfer_service):
 def test_fetch_user_data(mocker, groupme_transfer_service):
     expected_respose = {'id': USER_ID}
     response_object = mocker.MagicMock()
-    response_object.json.return_value = {'response': expected_respose}
+    response_object.content = json.dumps({'response': expected_respose}).encode()
     oauth2_session_get = mock_oauth2_session_get(mocker, response_object)
 
     assert groupme_transfer_service.fetch_user_data() == expected_respose
@@ -70,7 +71,7 @@ def test_fetch_blocked_users_raises_exception(groupme_transfer_service, mocker):
     groupme_transfer_service._user_id = USER_ID
     response_object = mocker.MagicMock()
     response_object.status_code = 200
-    response_object.json.return_value = {'response': {'no_blocks': []}}
+    response_object.content = json.dumps({'response': {'no_blocks': []}}).encode()
     mock_oauth2_session_get(mocker, response_object)
     with pytest.raises(ValueError):
         groupme_transfer_service.fetch_blocked_user_vertical()
@@ -81,18 +82,20 @@ def test_fetch_blocked_user_vertical(groupme_transfer_service, mocker):
     response_object = mocker.MagicMock()
     # adapted from
     # https://dev.groupme.com/docs/v3#blocks_index
-    response_object.json.return_value = {
-        'response': {
-            'blocks': [
-                {
-                    'user_id': USER_ID,
-                    'blocked_user_id': '1234567890',
-                    'created_at': 1302623328,
-                },
-                {'blocked_user_id': '12345678901', 'created_at': 1302623348},
-            ]
+    response_object.content = json.dumps(
+        {
+            'response': {
+                'blocks': [
+                    {
+                        'user_id': USER_ID,
+                        'blocked_user_id': '1234567890',
+                        'created_at': 1302623328,
+                    },
+                    {'blocked_user_id': '12345678901', 'created_at': 1302623348},
+                ]
+            }
         }
-    }
+    ).encode()
     oauth2_session_get = mock_oauth2_session_get(mocker, response_object)
     model_objs, _ = groupme_transfer_service.fetch_blocked_user_vertical()
     model_obj_dumps = dump_and_filter_model_objs(model_objs)
@@ -128,25 +131,27 @@ def test_fetch_chat_bot_vertical(groupme_transfer_service, mocker):
     response_object = mocker.MagicMock()
     # adapted from
     # https://dev.groupme.com/docs/v3#bots_index
-    response_object.json.return_value = {
-        'response': [
-            {
-                'bot_id': '1234567890',
-                'group_id': '1234567890',
-                'name': 'hal9000',
-                'avatar_url': 'https://i.groupme.com/123456789',
-                'callback_url': 'https://example.com/bots/callback',
-                'dm_notification': False,
-                'active': True,
-            },
-            {
-                'bot_id': '123',
-                'name': 'hal9001',
-                'avatar_url': 'https://i.groupme.com/123456789',
-                'callback_url': 'https://example.com/bots/callback',
-            },
-        ]
-    }
+    response_object.content = json.dumps(
+        {
+            'response': [
+                {
+                    'bot_id': '1234567890',
+                    'group_id': '1234567890',
+                    'name': 'hal9000',
+                    'avatar_url': 'https://i.groupme.com/123456789',
+                    'callback_url': 'https://example.com/bots/callback',
+                    'dm_notification': False,
+                    'active': True,
+                },
+                {
+                    'bot_id': '123',
+                    'name': 'hal9001',
+                    'avatar_url': 'https://i.groupme.com/123456789',
+                    'callback_url': 'https://example.com/bots/callback',
+                },
+            ]
+        }
+    ).encode()
     oauth2_session_get = mock_oauth2_session_get(mocker, response_object)
     model_objs, _ = groupme_transfer_service.fetch_chat_bot_vertical()
 
@@ -173,9 +178,37 @@ def test_fetch_chat_bot_vertical(groupme_transfer_service, mocker):
     'method_name',
     ['fetch_conversation_direct_vertical', 'fetch_conversation_group_vertical'],
 )
-def test_fetch_conversations_raises_exception(method_name, groupme_transfer_service):
-    with pytest.raises(UnsupportedRequestException):
-        getattr(groupme_transfer_service, method_name)(count=11)
+def test_fetch_conversations_pages(method_name, groupme_transfer_service, mocker):
+    groupme_transfer_service._user_id = USER_ID
+    response_object = mocker.MagicMock()
+    response_object.content = json.dumps(
+        {'response': [{'id': '1', 'other_user': {'id': '2'}}] * 10}
+    ).encode()
+    oauth2_session_get = mock_oauth2_session_get(mocker, response_object)
+
+    model_objs, raw_response = getattr(groupme_transfer_service, method_name)(count=11)
+
+    assert len(model_objs) == len(raw_response) == 11
+    assert [call.kwargs['params'] for call in oauth2_session_get.call_args_list] == [
+        {'token': TOKEN, 'user': USER_ID, 'per_page': 10, 'page': 1},
+        {'token': TOKEN, 'user': USER_ID, 'per_page': 10, 'page': 2},
+    ]
+
+
+@pytest.mark.parametrize(
+    'method_name',
+    ['fetch_conversation_direct_vertical', 'fetch_conversation_group_vertical'],
+)
+def test_fetch_conversations_raises_exception(
+    method_name, groupme_transfer_service, mocker
+):
+    groupme_transfer_service._user_id = USER_ID
+    response_object = mocker.MagicMock()
+    response_object.content = json.dumps({'response': {'not': 'a list'}}).encode()
+    mock_oauth2_session_get(mocker, response_object)
+
+    with pytest.raises(ValueError):
+        getattr(groupme_transfer_service, method_name)()
 
 
 def test_fetch_conversation_direct_vertical(groupme_transfer_service, mocker):
@@ -183,74 +216,76 @@ def test_fetch_conversation_direct_vertical(groupme_transfer_service, mocker):
     response_object = mocker.MagicMock()
     # adapted from
     # https://dev.groupme.com/docs/v3#chats_index
-    response_object.json.return_value = {
-        'response': [
-            {
-                'created_at': 1352299338,
-                'updated_at': 1352299338,
-                'last_message': {
-                    'attachments': [],
-                    'avatar_url': 'https://i.groupme.com/200x200.jpeg.abcdef',
-                    'conversation_id': '12345+67890',
+    response_object.content = json.dumps(
+        {
+            'response': [
+                {
                     'created_at': 1352299338,
-                    'favorited_by': [],
-                    'id': '1234567890',
-                    'name': 'John Doe',
-                    'recipient_id': '67890',
-                    'sender_id': '12345',
-                    'sender_type': 'user',
-                    'source_guid': 'GUID',
-                    'text': 'Hello world',
-                    'user_id': '12345',
-                },
-                'messages_count': 10,
-                'other_user': {
-                    'avatar_url': 'https://i.groupme.com/200x200.jpeg.abcdef',
-                    'id': 12345,
-                    'name': 'John Doe',
+                    'updated_at': 1352299338,
+                    'last_message': {
+                        'attachments': [],
+                        'avatar_url': 'https://i.groupme.com/200x200.jpeg.abcdef',
+                        'conversation_id': '12345+67890',
+                        'created_at': 1352299338,
+                        'favorited_by': [],
+                        'id': '1234567890',
+                        'name': 'John Doe',
+                        'recipient_id': '67890',
+                        'sender_id': '12345',
+                        'sender_type': 'user',
+                        'source_guid': 'GUID',
+                        'text': 'Hello world',
+                        'user_id': '12345',
+                    },
+                    'messages_count': 10,
+                    'other_user': {
+                        'avatar_url': 'https://i.groupme.com/200x200.jpeg.abcdef',
+                        'id': 12345,
+                        'name': 'John Doe',
+                    },
                 },
-            },
-            {
-                'created_at': 1668785830,
-                'last_message': {
-                    'attachments': [
-                        {
-                            'type': 'image',
-                            'url': 'https://i.groupme.com/351x672.png.101010',
-                        }
-                    ],
-                    'avatar_url': None,
-                    'conversation_id': '101010+202020',
+                {
                     'created_at': 1668785830,
-                    'favorited_by': [],
-                    'id': '166116611',
-                    'name': 'Gabriel',
-                    'recipient_id': '101010',
-                    'sender_id': '202020',
-                    'sender_type': 'user',
-                    'source_guid': 'caabcdef',
-                    'text': None,
-                    'user_id': '202020',
-                    'pinned_at': None,
-                    'pinned_by': '',
-                },
-                'messages_count': 1,
-                'other_user': {
-                    'avatar_url': 'https://i.groupme.com/512x512.jpeg.1010',
-                    'id': '101010',
-                    'name': 'Gabriel',
+                    'last_message': {
+                        'attachments': [
+                            {
+                                'type': 'image',
+                                'url': 'https://i.groupme.com/351x672.png.101010',
+                            }
+                        ],
+                        'avatar_url': None,
+                        'conversation_id': '101010+202020',
+                        'created_at': 1668785830,
+                        'favorited_by': [],
+                        'id': '166116611',
+                        'name': 'Gabriel',
+                        'recipient_id': '101010',
+                        'sender_id': '202020',
+                        'sender_type': 'user',
+                        'source_guid': 'caabcdef',
+                        'text': None,
+                        'user_id': '202020',
+                        'pinned_at': None,
+                        'pinned_by': '',
+                    },
+                    'messages_count': 1,
+                    'other_user': {
+                        'avatar_url': 'https://i.groupme.com/512x512.jpeg.1010',
+                        'id': '101010',
+                        'name': 'Gabriel',
+                    },
+                    'updated_at': 1668785830,
+                    'message_deletion_period': 2147483647,
+                    'message_deletion_mode': ['sender'],
+                    'requires_approval': False,
+                    'unread_count': None,
+                    'last_read_message_id': None,
+                    'last_read_at': None,
+                    'message_edit_period': 15,
                 },
-                'updated_at': 1668785830,
-                'message_deletion_period': 2147483647,
-                'message_deletion_mode': ['sender'],
-                'requires_approval': False,
-                'unread_count': None,
-                'last_read_message_id': None,
-                'last_read_at': None,
-                'message_edit_period': 15,
-            },
-        ]
-    }
+            ]
+        }
+    ).encode()
     oauth2_session_get = mock_oauth2_session_get(mocker, response_object)
     model_objs, _ = groupme_transfer_service.fetch_conversation_direct_vertical()
 
@@ -294,123 +329,131 @@ def test_fetch_conversation_group_vertical(groupme_transfer_service, mocker):
     response_object = mocker.MagicMock()
     # adapted from
     # https://dev.groupme.com/docs/v3#groups_index
-    response_object.json.return_value = {
-        'response': [
-            {
-                'id': '1234567890',
-                'name': 'Family',
-                'type': 'private',
-                'description': 'Coolest Family Ever',
-                'image_url': 'https://i.groupme.com/123456789',
-                'creator_user_id': USER_ID,
-                'created_at': 1302623328,
-                'updated_at': 1302623328,
-                'members': [
-                    {
-                        'user_id': USER_ID,
-                        'nickname': 'Jane',
-                        'muted': False,
-                        'image_url': 'https://i.groupme.com/123456789',
-                    }
-                ],
-                'share_url': 'https://groupme.com/join_group/1234567890/SHARE_TOKEN',
-                'messages': {
-                    'count': 100,
-                    'last_message_id': '1234567890',
-                    'last_message_created_at': 1302623328,
-                    'preview': {
-                        'nickname': 'Jane',
-                        'text': 'Hello world',
-                        'image_url': 'https://i.groupme.com/123456789',
-                        'attachments': [
-                            {'type': 'image', 'url': 'https://i.groupme.com/123456789'},
-                            {'type': 'image', 'url': 'https://i.groupme.com/123456789'},
-                            {
-                                'type': 'location',
-                                'lat': '40.738206',
-                                'lng': '-73.993285',
-                                'name': 'GroupMe HQ',
-                            },
-                            {'type': 'split', 'token': 'SPLIT_TOKEN'},
-                            {
-                                'type': 'emoji',
-                                'placeholder': '☃',
-                                'charmap': [[1, 42], [2, 34]],
-                            },
-                        ],
+    response_object.content = json.dumps(
+        {
+            'response': [
+                {
+                    'id': '1234567890',
+                    'name': 'Family',
+                    'type': 'private',
+                    'description': 'Coolest Family Ever',
+                    'image_url': 'https://i.groupme.com/123456789',
+                    'creator_user_id': USER_ID,
+                    'created_at': 1302623328,
+                    'updated_at': 1302623328,
+                    'members': [
+                        {
+                            'user_id': USER_ID,
+                            'nickname': 'Jane',
+                            'muted': False,
+                            'image_url': 'https://i.groupme.com/123456789',
+                        }
+                    ],
+                    'share_url': 'https://groupme.com/join_group/1234567890/SHARE_TOKEN',
+                    'messages': {
+                        'count': 100,
+                        'last_message_id': '1234567890',
+                        'last_message_created_at': 1302623328,
+                        'preview': {
+                            'nickname': 'Jane',
+                            'text': 'Hello world',
+                            'image_url': 'https://i.groupme.com/123456789',
+                            'attachments': [
+                                {
+                                    'type': 'image',
+                                    'url': 'https://i.groupme.com/123456789',
+                                },
+                                {
+                                    'type': 'image',
+                                    'url': 'https://i.groupme.com/123456789',
+                                },
+                                {
+                                    'type': 'location',
+                                    'lat': '40.738206',
+                                    'lng': '-73.993285',
+                                    'name': 'GroupMe HQ',
+                                },
+                                {'type': 'split', 'token': 'SPLIT_TOKEN'},
+                                {
+                                    'type': 'emoji',
+                                    'placeholder': '☃',
+                                    'charmap': [[1, 42], [2, 34]],
+                                },
+                            ],
+                        },
                     },
                 },
-            },
-            {
-                'id': '111111',
-                'group_id': '111111',
-                'name': 'Second Group',
-                'phone_number': '+199999999999',
-                'type': 'closed',
-                'description': "Hey y'all!",
-                'image_url': None,
-                'creator_user_id': 'u222222',
-                'created_at': 1554220666,
-                'updated_at': 1579220489,
-                'muted_until': None,
-                'messages': {
-                    'count': 380,
-                    'last_message_id': '101010',
-                    'last_message_created_at': 1579220489,
-                    'last_message_updated_at': 1579220489,
-                    'preview': {
-                        'nickname': 'Kenneth',
-                        'text': 'these are cool',
-                        'image_url': 'https://i.groupme.com/1818x1228.jpeg',
-                        'attachments': [],
+                {
+                    'id': '111111',
+                    'group_id': '111111',
+                    'name': 'Second Group',
+                    'phone_number': '+199999999999',
+                    'type': 'closed',
+                    'description': "Hey y'all!",
+                    'image_url': None,
+                    'creator_user_id': 'u222222',
+                    'created_at': 1554220666,
+                    'updated_at': 1579220489,
+                    'muted_until': None,
+                    'messages': {
+                        'count': 380,
+                        'last_message_id': '101010',
+                        'last_message_created_at': 1579220489,
+                        'last_message_updated_at': 1579220489,
+                        'preview': {
+                            'nickname': 'Kenneth',
+                            'text': 'these are cool',
+                            'image_url': 'https://i.groupme.com/1818x1228.jpeg',
+                            'attachments': [],
+                        },
                     },
+                    'max_members': 5000,
+                    'theme_name': None,
+                    'like_icon': None,
+                    'requires_approval': False,
+                    'show_join_question': False,
+                    'join_question': None,
+                    'message_deletion_period': 2147483647,
+                    'message_deletion_mode': ['admin', 'sender'],
+                    'message_edit_period': 15,
+                    'children_count': 0,
+                    'share_url': None,
+                    'share_qr_code_url': None,
+                    'directories': None,
+                    'members': [
+                        {
+                            'user_id': USER_ID,
+                            'nickname': 'Member1',
+                            'image_url': 'https://i.groupme.com/750x750.jpeg',
+                            'id': USER_ID,
+                            'muted': False,
+                            'autokicked': False,
+                            'roles': ['admin', 'owner'],
+                            'name': 'Member1',
+                        },
+                        {
+                            'user_id': 'u222222',
+                            'nickname': 'Member2',
+                            'image_url': 'https://i.groupme.com/960x720.jpeg',
+                            'id': 'u222222',
+                            'muted': False,
+                            'autokicked': False,
+                            'roles': ['user'],
+                            'name': 'Member2',
+                        },
+                    ],
+                    'members_count': 2,
+                    'locations': None,
+                    'visibility': None,
+                    'category_ids': None,
+                    'active_call_participants': None,
+                    'unread_count': None,
+                    'last_read_message_id': None,
+                    'last_read_at': None,
                 },
-                'max_members': 5000,
-                'theme_name': None,
-                'like_icon': None,
-                'requires_approval': False,
-                'show_join_question': False,
-                'join_question': None,
-                'message_deletion_period': 2147483647,
-                'message_deletion_mode': ['admin', 'sender'],
-                'message_edit_period': 15,
-                'children_count': 0,
-                'share_url': None,
-                'share_qr_code_url': None,
-                'directories': None,
-                'members': [
-                    {
-                        'user_id': USER_ID,
-                        'nickname': 'Member1',
-                        'image_url': 'https://i.groupme.com/750x750.jpeg',
-                        'id': USER_ID,
-                        'muted': False,
-                        'autokicked': False,
-                        'roles': ['admin', 'owner'],
-                        'name': 'Member1',
-                    },
-                    {
-                        'user_id': 'u222222',
-                        'nickname': 'Member2',
-                        'image_url': 'https://i.groupme.com/960x720.jpeg',
-                        'id': 'u222222',
-                        'muted': False,
-                        'autokicked': False,
-                        'roles': ['user'],
-                        'name': 'Member2',
-                    },
-                ],
-                'members_count': 2,
-                'locations': None,
-                'visibility': None,
-                'category_ids': None,
-                'active_call_participants': None,
-                'unread_count': None,
-                'last_read_message_id': None,
-                'last_read_at': None,
-            },
-        ]
-    }
+            ]
+        }
+    ).encode()
     oauth2_session_get = mock_oauth2_session_get(mocker, response_object)
     model_objs, _ = groupme_transfer_service.fetch_conversation_group_vertical()
 
@@ -459,3 +502,37 @@ def test_fetch_conversation_group_vertical(groupme_transfer_service, mocker):
             'title': 'Second Group',
         },
     ]
+
+
+def test_parse_conversation_group_vertical_trusted(groupme_transfer_service):
+    groupme_transfer_service._user_id = USER_ID
+    raw_group = {
+        'id': 1234567890,
+        'type': 'private',
+        'created_at': 1302623328,
+        'image_url': 'https://i.groupme.com/123456789',
+        'members': [{'user_id': 12345}],
+        'messages': {'count': 100},
+    }
+    validated_group = groupme_transfer_service.parse_conversation_group_vertical(
+        raw_group
+    )
+    groupme_transfer_service.trusted_parsing = True
+    trusted_group = groupme_transfer_service.parse_conversation_group_vertical(
+        raw_group
+    )
+
+    assert trusted_group.pardner_object_id != validated_group.pardner_object_id
+    assert trusted_group.model_dump(
+        exclude={'pardner_object_id', 'associated_media'}
+    ) == validated_group.model_dump(exclude={'pardner_object_id', 'associated_media'})
+
+
+def test_parse_blocked_user_vertical_trusted_skips_validation(groupme_transfer_service):
+    groupme_transfer_service.trusted_parsing = True
+    blocked_user = groupme_transfer_service.parse_blocked_user_vertical({})
+    assert blocked_user.blocked_user_id is None
+
+    groupme_transfer_service.validation_sample_rate = 1
+    with pytest.raises(ValidationError):
+        groupme_transfer_service.parse_blocked_user_vertical({})
@@ -0,0 +1,59 @@
+import pytest
+
+from pardner.services import AsyncStravaTransferService, StravaTransferService
+from pardner.services.mapping import FieldMapping, compile_field_mappings
+
+
+def test_compile_field_mappings():
+    map_fields = compile_field_mappings(
+        [
+            FieldMapping('id', 'id', str),
+            FieldMapping('owner', ('athlete', 'id')),
+            FieldMapping('latitude', ('latlng', 0)),
+            FieldMapping('longitude', ('latlng', 1)),
+            FieldMapping('count', 'count', default=0),
+            FieldMapping('total', (), lambda raw: raw['a'] + raw['b'], default=0),
+        ],
+        'map_test_fields',
+    )
+
+    assert map_fields.__name__ == 'map_test_fields'
+    assert map_fields(
+        {'id': 1, 'athlete': {'id': 2}, 'latlng': [3.0, 4.0], 'a': 1, 'b': 2}
+    ) == {
+        'id': '1',
+        'owner': 2,
+        'latitude': 3.0,
+        'longitude': 4.0,
+        'count': 0,
+        'total': 3,
+    }
+
+
+@pytest.mark.parametrize(
+    'raw_item', [{}, {'athlete': None, 'latlng': None}, {'athlete': 'x', 'latlng': []}]
+)
+def test_compile_field_mappings_uses_default(raw_item):
+    map_fields = compile_field_mappings(
+        [
+            FieldMapping('owner', ('athlete', 'id'), default='unknown'),
+            FieldMapping('latitude', ('latlng', 0)),
+        ]
+    )
+    assert map_fields(raw_item) == {'owner': 'unknown', 'latitude': None}
+
+
+def test_compile_field_mappings_raises_exception():
+    with pytest.raises(ValueError):
+        compile_field_mappings([FieldMapping('latitude', (0,))])
+
+
+def test_field_mappers_compiled_per_class():
+    assert set(StravaTransferService._field_mappers) == {
+        'physical_activity',
+        'social_posting',
+    }
+    assert (
+        AsyncStravaTransferService._field_mappers
+        is StravaTransferService._field_mappers
+    )
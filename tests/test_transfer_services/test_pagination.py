@@ -0,0 +1,69 @@
+import pytest
+
+from pardner.services.pagination import (
+    BeforeIdPaginator,
+    OffsetPaginator,
+    PageNumberPaginator,
+    TimestampPaginator,
+)
+
+
+@pytest.mark.parametrize(
+    ['paginator', 'expected_initial_params', 'expected_next_params'],
+    [
+        (
+            PageNumberPaginator(max_page_size=2),
+            {'per_page': 2, 'page': 1},
+            {'per_page': 2, 'page': 2},
+        ),
+        (OffsetPaginator(max_page_size=2), {'limit': 2}, {'limit': 2, 'offset': 2}),
+        (
+            BeforeIdPaginator(max_page_size=2),
+            {'limit': 2},
+            {'limit': 2, 'before_id': 'second'},
+        ),
+        (
+            TimestampPaginator(
+                max_page_size=2, timestamp_key='created', convert_timestamp=int
+            ),
+            {'per_page': 2},
+            {'per_page': 2, 'before': 20},
+        ),
+    ],
+)
+def test_paginator_next_params(
+    paginator, expected_initial_params, expected_next_params
+):
+    params = paginator.initial_params(2)
+    assert params == expected_initial_params
+    assert (
+        paginator.next_params(params, 2, {'id': 'second', 'created': '20'})
+        == expected_next_params
+    )
+
+
+@pytest.mark.parametrize(
+    'paginator',
+    [
+        PageNumberPaginator(max_page_size=2),
+        OffsetPaginator(max_page_size=2),
+        BeforeIdPaginator(max_page_size=2),
+        TimestampPaginator(max_page_size=2, timestamp_key='created'),
+    ],
+)
+@pytest.mark.parametrize(['item_count', 'last_item'], [(0, None), (1, {'id': 1})])
+def test_paginator_next_params_last_page(paginator, item_count, last_item):
+    params = paginator.initial_params(2)
+    assert paginator.next_params(params, item_count, last_item) is None
+
+
+@pytest.mark.parametrize(
+    'paginator',
+    [
+        BeforeIdPaginator(max_page_size=2),
+        TimestampPaginator(max_page_size=2, timestamp_key='created'),
+    ],
+)
+def test_paginator_next_params_missing_cursor(paginator):
+    params = paginator.initial_params(2)
+    assert paginator.next_params(params, 2, {'unrelated': 'key'}) is None
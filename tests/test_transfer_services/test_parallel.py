@@ -0,0 +1,101 @@
+import json
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pardner.services import ParseExecutor
+from pardner.services.parallel import _parse_chunk
+from pardner.verticals import ConversationDirectVertical, PhysicalActivityVertical
+from tests.test_transfer_services.conftest import mock_oauth2_session_get
+
+
+def raw_activities(count):
+    return [
+        {'id': activity_id, 'athlete': {'id': 1}, 'start_date': '2018-05-02T12:15:09Z'}
+        for activity_id in range(count)
+    ]
+
+
+@pytest.fixture
+def parse_executor():
+    with ParseExecutor(max_workers=2, chunk_size=3) as parse_executor:
+        yield parse_executor
+
+
+def test_parse_chunk(groupme_transfer_service):
+    groupme_transfer_service._user_id = '1'
+    conversations = _parse_chunk(
+        type(groupme_transfer_service),
+        groupme_transfer_service._parse_state(),
+        ConversationDirectVertical,
+        [{'id': 'a', 'other_user': {'id': '2'}}, None],
+    )
+    assert conversations[0].member_user_ids == ['1', '2']
+    assert conversations[1] is None
+
+
+def test_parse_executor_preserves_order(parse_executor, strava_transfer_service):
+    activities = list(
+        parse_executor.map(
+            strava_transfer_service, PhysicalActivityVertical, raw_activities(20)
+        )
+    )
+    assert [activity.service_object_id for activity in activities] == [
+        str(activity_id) for activity_id in range(20)
+    ]
+
+
+def test_parse_executor_bounds_pending_chunks(strava_transfer_service):
+    consumed = []
+
+    def raw_items():
+        for raw_activity in raw_activities(20):
+            consumed.append(raw_activity)
+            yield raw_activity
+
+    with ThreadPoolExecutor(1) as executor:
+        parse_executor = ParseExecutor(max_workers=1, chunk_size=3, executor=executor)
+        activities = parse_executor.map(
+            strava_transfer_service, PhysicalActivityVertical, raw_items()
+        )
+        next(activities)
+        # only the first chunk is read before the first activity is yielded
+        assert len(consumed) == 3
+        next(activities)
+        assert len(consumed) == 6
+        # at most max_pending_chunks chunks are read ahead of the one being yielded
+        next(activities)
+        next(activities)
+        assert len(consumed) == 9
+        assert len(list(activities)) == 16
+
+
+def random_value():
+    # a function rather than random.random, whose pickled instance holds its state
+    return random.random()
+
+
+def test_parse_executor_reseeds_workers():
+    random.seed(0)
+    parent_value = random.random()
+    random.seed(0)
+    with ParseExecutor(max_workers=1) as parse_executor:
+        worker_value = parse_executor._executor.submit(random_value).result()
+    assert worker_value != parent_value
+
+
+def test_iter_vertical_uses_parse_executor(
+    mocker, parse_executor, strava_transfer_service
+):
+    response_object = mocker.MagicMock()
+    response_object.content = json.dumps(raw_activities(10)).encode()
+    mock_oauth2_session_get(mocker, response_object)
+    strava_transfer_service.parse_executor = parse_executor
+
+    activities = list(strava_transfer_service.iter_vertical(PhysicalActivityVertical))
+
+    assert len(activities) == 10
+    assert all(
+        isinstance(activity, PhysicalActivityVertical) for activity in activities
+    )
@@ -0,0 +1,178 @@
+import json
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+from requests import HTTPError
+
+from pardner.services.rate_limit import (
+    RateLimiter,
+    get_rate_limiter,
+    parse_header_numbers,
+    parse_retry_after,
+    seconds_until_window_reset,
+)
+from pardner.services.retry import NO_RETRIES
+from tests.test_transfer_services.conftest import mock_oauth2_session_get
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def test_rate_limiter_acquire(clock):
+    rate_limiter = RateLimiter({'minute': (2, 60), 'hour': (100, 3600)}, clock)
+
+    rate_limiter.acquire(clock.sleep)
+    rate_limiter.acquire(clock.sleep)
+    assert clock.now == 0
+    assert rate_limiter.try_acquire() == pytest.approx(30)
+
+    rate_limiter.acquire(clock.sleep)
+    assert clock.now == pytest.approx(30)
+
+
+def test_rate_limiter_update(clock):
+    rate_limiter = RateLimiter({'minute': (60, 60)}, clock)
+    rate_limiter.update('minute', 60, 0)
+    rate_limiter.update('unknown', 60, 0)
+
+    assert rate_limiter.try_acquire() == pytest.approx(1)
+
+
+def test_rate_limiter_update_holds_until_reset(clock):
+    rate_limiter = RateLimiter({'hour': (100, 3600)}, clock)
+    rate_limiter.update('hour', 100, 0, reset_in=600)
+
+    # doesn't refill in the meantime, even though 100 tokens/hour would
+    clock.sleep(599)
+    assert rate_limiter.try_acquire() == pytest.approx(1)
+    clock.sleep(1)
+    assert rate_limiter.try_acquire() == 0
+    assert rate_limiter.buckets['hour'].tokens == pytest.approx(99)
+
+
+def test_seconds_until_window_reset():
+    # 2025-01-01 10:05 UTC
+    now = datetime(2025, 1, 1, 10, 5, tzinfo=timezone.utc).timestamp
+    assert seconds_until_window_reset(15 * 60, now) == 10 * 60
+    assert seconds_until_window_reset(24 * 60 * 60, now) == (13 * 60 + 55) * 60
+
+
+def test_rate_limiter_pause(clock):
+    rate_limiter = RateLimiter({}, clock)
+    rate_limiter.pause(10)
+
+    assert rate_limiter.try_acquire() == 10
+    rate_limiter.acquire(clock.sleep)
+    assert clock.now == 10
+
+
+def test_get_rate_limiter():
+    rate_limiter = get_rate_limiter('key', {'minute': (1, 60)})
+    assert get_rate_limiter('key', {}) is rate_limiter
+    assert get_rate_limiter('other key', {}) is not rate_limiter
+
+
+@pytest.mark.parametrize(
+    ['value', 'expected'],
+    [('100,1000', [100, 1000]), ('7', [7]), ('', []), ('a,b', []), (None, [])],
+)
+def test_parse_header_numbers(value, expected):
+    assert parse_header_numbers(value) == expected
+
+
+def test_parse_retry_after():
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=120)
+
+    assert parse_retry_after('30') == 30
+    assert parse_retry_after(format_datetime(retry_at, usegmt=True)) == pytest.approx(
+        120, abs=2
+    )
+    assert parse_retry_after('soon') is None
+    assert parse_retry_after(None) is None
+
+
+def test_strava_updates_rate_limiter(mocker, strava_transfer_service):
+    response_object = mocker.MagicMock()
+    response_object.headers = {
+        'X-RateLimit-Limit': '200,2000',
+        'X-RateLimit-Usage': '10,1999',
+        'X-ReadRateLimit-Limit': '100,1000',
+        'X-ReadRateLimit-Usage': '100,500',
+    }
+    response_object.content = json.dumps([]).encode()
+    mock_oauth2_session_get(mocker, response_object)
+
+    strava_transfer_service.fetch_physical_activity_vertical()
+
+    buckets = strava_transfer_service.rate_limiter.buckets
+    assert buckets['15_minutes'].tokens == pytest.approx(0, abs=0.01)
+    assert buckets['daily'].capacity == 1000
+
+
+def test_strava_exhausted_quota_waits_for_reset(mocker, strava_transfer_service):
+    response_object = mocker.MagicMock()
+    response_object.headers = {
+        'X-ReadRateLimit-Limit': '100,1000',
+        'X-ReadRateLimit-Usage': '10,1000',
+    }
+    response_object.content = json.dumps([]).encode()
+    mock_oauth2_session_get(mocker, response_object)
+
+    strava_transfer_service.fetch_physical_activity_vertical()
+
+    assert strava_transfer_service.rate_limiter.try_acquire() == pytest.approx(
+        seconds_until_window_reset(24 * 60 * 60), abs=1
+    )
+
+
+def test_tumblr_updates_rate_limiter(mocker, tumblr_transfer_service):
+    response_object = mocker.MagicMock()
+    response_object.headers = {
+        'X-Ratelimit-Perhour-Limit': '1000',
+        'X-Ratelimit-Perhour-Remaining': '10',
+        'X-Ratelimit-Perday-Limit': '5000',
+        'X-Ratelimit-Perday-Remaining': '4000',
+    }
+    response_object.content = json.dumps({'response': {'posts': []}}).encode()
+    mock_oauth2_session_get(mocker, response_object)
+
+    tumblr_transfer_service.fetch_social_posting_vertical()
+
+    buckets = tumblr_transfer_service.rate_limiter.buckets
+    assert buckets['hourly'].tokens == pytest.approx(10, abs=0.01)
+    assert buckets['daily'].tokens == pytest.approx(4000, abs=0.01)
+
+
+def test_rate_limiter_paused_on_too_many_requests(
+    strava_transfer_service, mock_oauth2_session_get_bad_response
+):
+    strava_transfer_service.retry_policy = NO_RETRIES
+    mock_oauth2_session_get_bad_response.return_value.status_code = 429
+    mock_oauth2_session_get_bad_response.return_value.headers = {'Retry-After': '60'}
+
+    with pytest.raises(HTTPError):
+        strava_transfer_service.fetch_physical_activity_vertical()
+    assert strava_transfer_service.rate_limiter.try_acquire() == pytest.approx(
+        60, abs=1
+    )
+
+
+def test_rate_limiter_pause_drains_buckets(clock):
+    rate_limiter = RateLimiter({'minute': (60, 60)}, clock)
+    rate_limiter.pause()
+
+    assert rate_limiter.try_acquire() == pytest.approx(1)
@@ -0,0 +1,130 @@
+import gzip
+import json
+import os
+
+import pytest
+
+from pardner.services import RawSpill
+from tests.test_transfer_services.conftest import mock_oauth2_session_get
+
+
+@pytest.fixture
+def raw_spill(tmp_path):
+    raw_spill = RawSpill(str(tmp_path / 'raw.gz'))
+    yield raw_spill
+    raw_spill.close()
+
+
+def test_raw_spill_round_trip(raw_spill):
+    first = raw_spill.write({'id': 1})
+    second = raw_spill.write_items(iter([{'id': 2}, {'id': 3}]))
+    empty = raw_spill.write_items([])
+
+    assert second.load() == [{'id': 2}, {'id': 3}]
+    assert first.load() == {'id': 1}
+    assert empty.load() == []
+    # each record is a gzip member, so the whole file is readable with gzip
+    with gzip.open(raw_spill.path) as spill_file:
+        assert spill_file.read() == b'{"id": 1}[{"id": 2},{"id": 3}][]'
+
+
+def test_raw_spill_temporary_file_is_deleted():
+    raw_spill = RawSpill()
+    assert raw_spill.write([1]).load() == [1]
+    raw_spill.close()
+    assert not os.path.exists(raw_spill.path)
+
+
+def test_raw_spill_consumes_items_without_the_lock(raw_spill):
+    def raw_items():
+        assert not raw_spill._lock.locked()
+        yield {'id': 1}
+
+    assert raw_spill.write_items(raw_items()).load() == [{'id': 1}]
+
+
+def test_raw_spill_write_fails(raw_spill):
+    first = raw_spill.write({'id': 1})
+
+    def raw_items():
+        yield {'id': 2}
+        raise RuntimeError('fetch failed')
+
+    with pytest.raises(RuntimeError):
+        raw_spill.write_items(raw_items())
+    second = raw_spill.write({'id': 3})
+
+    assert first.load() == {'id': 1}
+    assert second.load() == {'id': 3}
+    with gzip.open(raw_spill.path) as spill_file:
+        assert spill_file.read() == b'{"id": 1}{"id": 3}'
+
+
+def fetch_activities(mocker, strava_transfer_service):
+    response_object = mocker.MagicMock()
+    response_object.content = json.dumps(
+        [{'id': activity_id, 'athlete': {'id': 1}} for activity_id in range(3)]
+    ).encode()
+    mock_oauth2_session_get(mocker, response_object)
+    return strava_transfer_service.fetch_physical_activity_vertical(count=3)
+
+
+def test_raw_retention_keep(mocker, strava_transfer_service):
+    activities, raw_activities = fetch_activities(mocker, strava_transfer_service)
+    assert len(activities) == 3
+    assert [raw_activity['id'] for raw_activity in raw_activities] == [0, 1, 2]
+
+
+def test_raw_retention_drop(mocker, strava_transfer_service):
+    strava_transfer_service.raw_retention = 'drop'
+    activities, raw_activities = fetch_activities(mocker, strava_transfer_service)
+    assert len(activities) == 3
+    assert raw_activities is None
+
+
+def test_raw_retention_spill(mocker, raw_spill, strava_transfer_service):
+    strava_transfer_service.raw_retention = 'spill'
+    strava_transfer_service.raw_spill = raw_spill
+    activities, spilled_activities = fetch_activities(mocker, strava_transfer_service)
+    assert [activity.service_object_id for activity in activities] == ['0', '1', '2']
+    assert [raw_activity['id'] for raw_activity in spilled_activities.load()] == [
+        0,
+        1,
+        2,
+    ]
+
+
+def test_raw_retention_spill_whole_response(mocker, groupme_transfer_service):
+    groupme_transfer_service._user_id = '1'
+    groupme_transfer_service.raw_retention = 'spill'
+    response_object = mocker.MagicMock()
+    response_object.content = json.dumps(
+        {'response': {'blocks': [{'user_id': '1', 'blocked_user_id': '2'}]}}
+    ).encode()
+    mock_oauth2_session_get(mocker, response_object)
+
+    blocked_users, spilled_response = (
+        groupme_transfer_service.fetch_blocked_user_vertical()
+    )
+
+    assert len(blocked_users) == 1
+    assert spilled_response.load() == {
+        'blocks': [{'user_id': '1', 'blocked_user_id': '2'}]
+    }
+    groupme_transfer_service.raw_spill.close()
+
+
+def test_raw_retention_spill_fetch_fails(mocker, strava_transfer_service):
+    strava_transfer_service.raw_retention = 'spill'
+    mock_oauth2_session_get(mocker, None).side_effect = RuntimeError('fetch failed')
+
+    with pytest.raises(RuntimeError):
+        strava_transfer_service.fetch_physical_activity_vertical(count=3)
+
+    assert strava_transfer_service.raw_spill is None
+
+
+def test_invalid_raw_retention(mocker, strava_transfer_service):
+    strava_transfer_service.raw_retention = 'discard'
+    with pytest.raises(ValueError):
+        fetch_activities(mocker, strava_transfer_service)
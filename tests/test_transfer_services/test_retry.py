@@ -0,0 +1,129 @@
+import json
+
+import pytest
+from requests import ConnectionError, HTTPError
+
+from pardner.exceptions import RetriesExhaustedException
+from pardner.services.rate_limit import RateLimiter
+from pardner.services.retry import RetryPolicy
+from tests.test_transfer_services.conftest import mock_oauth2_session_get
+
+
+@pytest.fixture
+def mock_sleep(mocker):
+    return mocker.patch('time.sleep')
+
+
+def mock_status_response(mocker, status_code, headers={}):
+    response_object = mocker.MagicMock()
+    response_object.ok = status_code < 400
+    response_object.status_code = status_code
+    response_object.headers = headers
+    response_object.content = json.dumps([]).encode()
+    return response_object
+
+
+@pytest.mark.parametrize(
+    ['method', 'status_code', 'expected'],
+    [
+        ('GET', 502, True),
+        ('get', 429, True),
+        ('GET', None, True),
+        ('GET', 404, False),
+        ('POST', 502, False),
+    ],
+)
+def test_retry_policy_is_retryable(method, status_code, expected):
+    assert RetryPolicy().is_retryable(method, status_code) == expected
+
+
+def test_retry_policy_should_retry():
+    retry_policy = RetryPolicy(max_retries=2, max_retry_after=10)
+
+    assert retry_policy.should_retry('GET', 1, 503)
+    assert not retry_policy.should_retry('GET', 2, 503)
+    assert not retry_policy.should_retry('GET', 0, 503, retry_after=11)
+
+
+def test_retry_policy_backoff():
+    retry_policy = RetryPolicy(backoff_factor=1, max_backoff=5)
+
+    assert 2 <= retry_policy.backoff(2) <= 4
+    assert 2.5 <= retry_policy.backoff(10) <= 5
+    assert retry_policy.backoff(0, retry_after=7) == 7
+    assert RetryPolicy(backoff_factor=1, jitter=False).backoff(3) == 8
+
+
+def test_get_resource_retries(mocker, mock_sleep, strava_transfer_service):
+    # the rate limiter would also hold requests back for the Retry-After delay
+    mocker.patch.object(RateLimiter, 'pause')
+    oauth2_session_get = mock_oauth2_session_get(mocker)
+    responses = [
+        mock_status_response(mocker, 502),
+        ConnectionError(),
+        mock_status_response(mocker, 429, {'Retry-After': '2'}),
+        mock_status_response(mocker, 200),
+    ]
+    oauth2_session_get.side_effect = responses
+
+    strava_transfer_service.fetch_physical_activity_vertical()
+
+    assert oauth2_session_get.call_count == 4
+    assert mock_sleep.call_args_list[-1].args == (2,)
+    # the responses that are retried release their connections
+    responses[0].close.assert_called_once()
+    responses[2].close.assert_called_once()
+
+
+def test_get_resource_raises_retries_exhausted(
+    mocker, mock_sleep, strava_transfer_service
+):
+    strava_transfer_service.retry_policy = RetryPolicy(max_retries=1)
+    mock_oauth2_session_get(mocker, mock_status_response(mocker, 503))
+
+    with pytest.raises(RetriesExhaustedException) as exc_info:
+        strava_transfer_service.fetch_physical_activity_vertical()
+
+    assert exc_info.value.attempts == 2
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.retry_after is None
+    assert mock_sleep.call_count == 1
+
+
+def test_get_resource_raises_retries_exhausted_on_long_retry_after(
+    mocker, mock_sleep, strava_transfer_service
+):
+    mock_oauth2_session_get(
+        mocker, mock_status_response(mocker, 429, {'Retry-After': '3600'})
+    )
+
+    with pytest.raises(RetriesExhaustedException) as exc_info:
+        strava_transfer_service.fetch_physical_activity_vertical()
+
+    assert exc_info.value.attempts == 1
+    assert exc_info.value.retry_after == 3600
+    mock_sleep.assert_not_called()
+
+
+def test_get_resource_raises_retries_exhausted_on_connection_error(
+    mocker, mock_sleep, strava_transfer_service
+):
+    strava_transfer_service.retry_policy = RetryPolicy(max_retries=0)
+    mock_oauth2_session_get(mocker).side_effect = ConnectionError()
+
+    with pytest.raises(RetriesExhaustedException) as exc_info:
+        strava_transfer_service.fetch_physical_activity_vertical()
+
+    assert exc_info.value.status_code is None
+    assert isinstance(exc_info.value.__cause__, ConnectionError)
+
+
+def test_get_resource_does_not_retry_client_errors(
+    mock_sleep, strava_transfer_service, mock_oauth2_session_get_bad_response
+):
+    with pytest.raises(HTTPError) as exc_info:
+        strava_transfer_service.fetch_physical_activity_vertical()
+
+    assert not isinstance(exc_info.value, RetriesExhaustedException)
+    assert mock_oauth2_session_get_bad_response.call_count == 1
+    mock_sleep.assert_not_called()
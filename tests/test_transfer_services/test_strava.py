@@ -1,10 +1,13 @@
 import datetime
+import json
 
 import pytest
 from pydantic import AnyHttpUrl
 from requests import HTTPError
 
-from pardner.exceptions import UnsupportedRequestException, UnsupportedVerticalException
+from pardner.exceptions import UnsupportedVerticalException
+from pardner.services import InMemoryDedupIndex
+from pardner.verticals import SocialPostingVertical
 from pardner.verticals.physical_activity import PhysicalActivityVertical
 from tests.test_transfer_services.conftest import (
     NewVertical,
@@ -19,7 +22,11 @@ def test_scope(strava_transfer_service):
 
 @pytest.mark.parametrize(
     ['verticals', 'expected_scope'],
-    [([], set()), ([PhysicalActivityVertical], {'activity:read', 'profile:read_all'})],
+    [
+        ([], set()),
+        ([PhysicalActivityVertical], {'activity:read', 'profile:read_all'}),
+        ([SocialPostingVertical], {'activity:read', 'profile:read_all'}),
+    ],
 )
 def test_scope_for_verticals(strava_transfer_service, verticals, expected_scope):
     assert strava_transfer_service.scope_for_verticals(verticals) == expected_scope
@@ -30,9 +37,22 @@ def test_scope_for_verticals_raises_error(strava_transfer_service):
         strava_transfer_service.scope_for_verticals([NewVertical])
 
 
-def test_fetch_physical_activity_raises_exception(strava_transfer_service):
-    with pytest.raises(UnsupportedRequestException):
-        strava_transfer_service.fetch_physical_activity_vertical(count=31)
+def test_fetch_physical_activity_vertical_pages(mocker, strava_transfer_service):
+    response_object = mocker.MagicMock()
+    response_object.content = json.dumps(
+        [{'id': activity_id, 'athlete': {'id': 1}} for activity_id in range(200)]
+    ).encode()
+    oauth2_session_get = mock_oauth2_session_get(mocker, response_object)
+
+    model_objs, raw_activities = (
+        strava_transfer_service.fetch_physical_activity_vertical(count=250)
+    )
+
+    assert len(model_objs) == len(raw_activities) == 250
+    assert [call.kwargs['params'] for call in oauth2_session_get.call_args_list] == [
+        {'per_page': 200, 'page': 1},
+        {'per_page': 200, 'page': 2},
+    ]
 
 
 def test_fetch_physical_activity_vertical_raises_http_exception(
@@ -165,7 +185,7 @@ def test_fetch_physical_activity_vertical(mocker, strava_transfer_service):
     ]
 
     response_object = mocker.MagicMock()
-    response_object.json.return_value = sample_response
+    response_object.content = json.dumps(sample_response).encode()
 
     oauth2_session_get = mock_oauth2_session_get(mocker, response_object)
 
@@ -239,3 +259,79 @@ def test_fetch_physical_activity_vertical(mocker, strava_transfer_service):
             'end_datetime': datetime.datetime(2018, 4, 30, 14, 5, 51),
         },
     ]
+
+
+def test_iter_physical_activity_vertical_pages(mocker, strava_transfer_service):
+    raw_activity = {'id': 1, 'athlete': {'id': 2}, 'start_date': '2018-05-02T12:15:09Z'}
+    full_page = mocker.MagicMock()
+    full_page.content = json.dumps([raw_activity] * 200).encode()
+    last_page = mocker.MagicMock()
+    last_page.content = json.dumps([raw_activity] * 3).encode()
+
+    oauth2_session_get = mock_oauth2_session_get(mocker)
+    oauth2_session_get.side_effect = [full_page, full_page, last_page]
+
+    activities = strava_transfer_service.iter_physical_activity_vertical(
+        after=datetime.datetime(2018, 1, 1, tzinfo=datetime.timezone.utc),
+        before=1600000000,
+    )
+    oauth2_session_get.assert_not_called()
+
+    activities_list = list(activities)
+    assert len(activities_list) == 403
+    assert all(
+        isinstance(activity, PhysicalActivityVertical) for activity in activities_list
+    )
+    assert [call.kwargs['params'] for call in oauth2_session_get.call_args_list] == [
+        {'per_page': 200, 'after': 1514764800, 'before': 1600000000, 'page': page}
+        for page in [1, 2, 3]
+    ]
+
+
+def test_iter_social_posting_vertical_raises_exception(mocker, strava_transfer_service):
+    response_object = mocker.MagicMock()
+    response_object.content = json.dumps({'message': 'Authorization Error'}).encode()
+    mock_oauth2_session_get(mocker, response_object)
+
+    with pytest.raises(ValueError):
+        next(strava_transfer_service.iter_social_posting_vertical())
+
+
+def test_iter_social_posting_vertical_skips_seen(mocker, strava_transfer_service):
+    strava_transfer_service.dedup_index = InMemoryDedupIndex()
+    strava_transfer_service.deterministic_ids = True
+    response_object = mocker.MagicMock()
+    response_object.content = json.dumps([{'id': 1, 'athlete': {'id': 2}}] * 2).encode()
+    mock_oauth2_session_get(mocker, response_object)
+
+    social_postings = list(strava_transfer_service.iter_social_posting_vertical())
+
+    assert len(social_postings) == 1
+    assert isinstance(social_postings[0], SocialPostingVertical)
+
+
+def test_parse_physical_activity_vertical_validates_once(
+    mocker, strava_transfer_service
+):
+    social_posting_vertical = mocker.patch(
+        'pardner.services.strava.SocialPostingVertical'
+    )
+    raw_activity = {
+        'id': 1,
+        'athlete': {'id': 2},
+        'start_date': '2018-05-02T12:15:09Z',
+        'elapsed_time': 60,
+        'total_photo_count': 1,
+        'photos': {'primary': {'urls': {'100': 'https://example.com/1.jpg'}}},
+    }
+
+    activity = strava_transfer_service.parse_physical_activity_vertical(raw_activity)
+
+    social_posting_vertical.assert_not_called()
+    assert activity.created_at == activity.start_datetime
+    assert activity.end_datetime == datetime.datetime(2018, 5, 2, 12, 16, 9)
+    assert str(activity.associated_media[0].url) == 'https://example.com/1.jpg'
+
+
+def test_parse_physical_activity_vertical_invalid(strava_transfer_service):
+    assert strava_transfer_service.parse_physical_activity_vertical([]) is None
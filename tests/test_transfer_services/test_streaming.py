@@ -0,0 +1,84 @@
+import json
+
+import pytest
+
+from pardner.services.streaming import iter_json_array_items
+from pardner.verticals import SocialPostingVertical
+from tests.test_transfer_services.conftest import mock_oauth2_session_get
+
+
+def chunked(document, chunk_size):
+    encoded = json.dumps(document).encode()
+    return [
+        encoded[index : index + chunk_size]
+        for index in range(0, len(encoded), chunk_size)
+    ]
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 1000])
+def test_iter_json_array_items(chunk_size):
+    items = [
+        {'id': 1, 'text': 'quote " and brackets ] } [ {', 'nested': [[1, {'a': 2}]]},
+        'string \\ with escapes é',
+        -1.5e3,
+        True,
+        None,
+        [],
+    ]
+    document = {'meta': {'skip': [1, {'posts': []}]}, 'response': {'posts': items}}
+    assert (
+        list(
+            iter_json_array_items(chunked(document, chunk_size), ('response', 'posts'))
+        )
+        == items
+    )
+
+
+def test_iter_json_array_items_empty_and_top_level():
+    assert list(iter_json_array_items([b' [ ', b' ] '])) == []
+    assert list(iter_json_array_items([b'[1,', b'2]'])) == [1, 2]
+
+
+def test_iter_json_array_items_is_incremental():
+    def chunks():
+        yield b'{"items": [{"id": 1}, '
+        yield b'{"id": 2}'
+        raise AssertionError('read past the second item')
+
+    items = iter_json_array_items(chunks(), ('items',))
+    assert next(items) == {'id': 1}
+
+
+@pytest.mark.parametrize(
+    'chunks, items_path',
+    [
+        ([b'{"items": {}}'], ('items',)),
+        ([b'{"other": []}'], ('items',)),
+        ([b'[1, 2'], ()),
+        ([b'[1 2]'], ()),
+    ],
+)
+def test_iter_json_array_items_malformed(chunks, items_path):
+    with pytest.raises(ValueError):
+        list(iter_json_array_items(chunks, items_path))
+
+
+def test_iter_vertical_streams_responses(mocker, tumblr_transfer_service):
+    posts = [{'id': post_id, 'blog': {'uuid': 'u'}} for post_id in range(3)]
+    response_object = mocker.MagicMock()
+    response_object.iter_content.return_value = chunked(
+        {'response': {'posts': posts}}, 7
+    )
+    oauth2_session_get = mock_oauth2_session_get(mocker, response_object)
+    tumblr_transfer_service.stream_responses = True
+
+    raw_posts = list(
+        tumblr_transfer_service._iter_raw_items(
+            tumblr_transfer_service._get_paginated_resource(SocialPostingVertical),
+            limit=2,
+        )
+    )
+
+    assert raw_posts == posts[:2]
+    assert oauth2_session_get.call_args.kwargs['stream'] is True
+    response_object.close.assert_called_once()
@@ -0,0 +1,146 @@
+import json
+
+import pytest
+
+from pardner.exceptions import UnsupportedRequestException
+from pardner.services.sync import (
+    InMemoryCheckpointStore,
+    SQLiteCheckpointStore,
+    SyncCursor,
+    get_checkpoint,
+)
+from pardner.verticals import (
+    BlockedUserVertical,
+    ConversationGroupVertical,
+    PhysicalActivityVertical,
+    SocialPostingVertical,
+)
+from tests.test_transfer_services.conftest import mock_oauth2_session_get
+
+
+def mock_pages(mocker, *pages):
+    responses = []
+    for page in pages:
+        response_object = mocker.MagicMock()
+        response_object.content = json.dumps(page).encode()
+        responses.append(response_object)
+    oauth2_session_get = mock_oauth2_session_get(mocker)
+    oauth2_session_get.side_effect = responses
+    return oauth2_session_get
+
+
+def strava_activity(activity_id, start_date):
+    return {'id': activity_id, 'athlete': {'id': 7}, 'start_date': start_date}
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def checkpoint_store(request, tmp_path):
+    if request.param == 'memory':
+        return InMemoryCheckpointStore()
+    return SQLiteCheckpointStore(str(tmp_path / 'checkpoints.sqlite'))
+
+
+def test_checkpoint_store(checkpoint_store):
+    assert checkpoint_store.get('Strava', '1', 'physical_activity') is None
+    checkpoint_store.set('Strava', '1', 'physical_activity', 10)
+    checkpoint_store.set('Strava', '1', 'physical_activity', 20)
+    checkpoint_store.set('Strava', '2', 'physical_activity', 30)
+    assert checkpoint_store.get('Strava', '1', 'physical_activity') == 20
+    checkpoint_store.delete('Strava', '1', 'physical_activity')
+    assert checkpoint_store.get('Strava', '1', 'physical_activity') is None
+    assert checkpoint_store.get('Strava', '2', 'physical_activity') == 30
+
+
+@pytest.mark.parametrize(
+    ['raw_item', 'expected'],
+    [({'id': '12'}, 12), ({'id': 'abc'}, None), ({}, None), (None, None)],
+)
+def test_get_checkpoint(raw_item, expected):
+    assert get_checkpoint(raw_item, SyncCursor('id')) == expected
+
+
+def test_strava_sync(mocker, strava_transfer_service):
+    strava_transfer_service.token = {'access_token': 'token', 'athlete': {'id': 7}}
+    checkpoints = InMemoryCheckpointStore()
+    oauth2_session_get = mock_pages(
+        mocker,
+        [
+            strava_activity(1, '2025-01-01T00:00:00Z'),
+            strava_activity(2, '2025-01-02T00:00:00Z'),
+        ],
+        [strava_activity(3, '2025-01-03T00:00:00Z')],
+    )
+
+    first_sync = list(
+        strava_transfer_service.sync(PhysicalActivityVertical, checkpoints)
+    )
+    assert checkpoints.get('Strava', '7', 'physical_activity') == 1735776000
+    second_sync = list(
+        strava_transfer_service.sync(PhysicalActivityVertical, checkpoints)
+    )
+
+    assert [activity.service_object_id for activity in first_sync] == ['1', '2']
+    assert [activity.service_object_id for activity in second_sync] == ['3']
+    assert 'after' not in oauth2_session_get.call_args_list[0].kwargs['params']
+    assert oauth2_session_get.call_args_list[1].kwargs['params']['after'] == 1735776000
+    assert checkpoints.get('Strava', '7', 'physical_activity') == 1735862400
+
+
+def test_sync_only_saves_checkpoint_once_exhausted(mocker, strava_transfer_service):
+    strava_transfer_service.token = {'access_token': 'token', 'athlete': {'id': 7}}
+    checkpoints = InMemoryCheckpointStore()
+    mock_pages(mocker, [strava_activity(1, '2025-01-01T00:00:00Z')])
+
+    synced = strava_transfer_service.sync(PhysicalActivityVertical, checkpoints)
+    next(synced)
+    assert checkpoints.get('Strava', '7', 'physical_activity') is None
+    list(synced)
+    assert checkpoints.get('Strava', '7', 'physical_activity') == 1735689600
+
+
+def test_tumblr_sync(mocker, tumblr_transfer_service):
+    tumblr_transfer_service.primary_blog_id = 'blog'
+    checkpoints = InMemoryCheckpointStore()
+    checkpoints.set('Tumblr', 'blog', 'social_posting', 5)
+    oauth2_session_get = mock_pages(
+        mocker, {'response': {'posts': [{'id': 7}, {'id': 6}]}}
+    )
+
+    posts = list(tumblr_transfer_service.sync(SocialPostingVertical, checkpoints))
+
+    assert posts == [{'id': 7}, {'id': 6}]
+    params = oauth2_session_get.call_args.kwargs['params']
+    assert params['since_id'] == 5
+    assert params['npf'] is True
+    assert checkpoints.get('Tumblr', 'blog', 'social_posting') == 7
+
+
+def test_groupme_sync_filters_client_side(mocker, groupme_transfer_service):
+    groupme_transfer_service._user_id = '1'
+    checkpoints = InMemoryCheckpointStore()
+    checkpoints.set('GroupMe', '1', 'conversation_group', 100)
+    oauth2_session_get = mock_pages(
+        mocker,
+        {
+            'response': [
+                {'id': 'a', 'updated_at': 150},
+                {'id': 'b', 'updated_at': 100},
+                {'id': 'c', 'updated_at': 50},
+            ]
+        },
+    )
+
+    groups = list(groupme_transfer_service.sync(ConversationGroupVertical, checkpoints))
+
+    assert [group.service_object_id for group in groups] == ['a']
+    assert 'since_id' not in oauth2_session_get.call_args.kwargs['params']
+    assert checkpoints.get('GroupMe', '1', 'conversation_group') == 150
+
+
+def test_sync_raises_exception_without_cursor(groupme_transfer_service):
+    with pytest.raises(UnsupportedRequestException):
+        list(
+            groupme_transfer_service.sync(
+                BlockedUserVertical, InMemoryCheckpointStore()
+            )
+        )
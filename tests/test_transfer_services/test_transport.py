@@ -0,0 +1,81 @@
+import socket
+
+import pytest
+
+from pardner.services import (
+    GroupMeTransferService,
+    SharedTransport,
+    StravaTransferService,
+    TransferServicePool,
+)
+
+STRAVA_URL = 'https://www.strava.com/api/v3/athlete/activities'
+
+
+def test_services_share_adapter(strava_transfer_service, groupme_transfer_service):
+    other_strava_transfer_service = StravaTransferService(
+        'other_client_id', 'other_client_secret', 'https://redirect_uri'
+    )
+    strava_adapter = strava_transfer_service._oAuth2Session.get_adapter(STRAVA_URL)
+
+    assert (
+        other_strava_transfer_service._oAuth2Session.get_adapter(STRAVA_URL)
+        is strava_adapter
+    )
+    assert (
+        groupme_transfer_service._oAuth2Session.get_adapter('https://api.groupme.com/')
+        is not strava_adapter
+    )
+
+
+def test_shared_transport_configuration(monkeypatch):
+    transport = SharedTransport(pool_maxsize=3, pool_block=True)
+    monkeypatch.setattr(GroupMeTransferService, 'transport', transport)
+    groupme = GroupMeTransferService('client_id', 'https://redirect_uri')
+
+    adapter = groupme._oAuth2Session.get_adapter('https://api.groupme.com/v3/groups')
+    assert adapter is transport.get_adapter('https://api.groupme.com/')
+    assert adapter.poolmanager.connection_pool_kw['maxsize'] == 3
+    assert adapter.poolmanager.connection_pool_kw['block']
+    assert (
+        socket.SOL_SOCKET,
+        socket.SO_KEEPALIVE,
+        1,
+    ) in adapter.poolmanager.connection_pool_kw['socket_options']
+
+    transport.close()
+    assert transport.get_adapter('https://api.groupme.com/') is not adapter
+
+
+@pytest.fixture
+def strava_service_pool():
+    return TransferServicePool(
+        lambda: StravaTransferService(
+            'fake_client_id', 'fake_client_secret', 'https://redirect_uri'
+        ),
+        maxsize=2,
+    )
+
+
+def test_transfer_service_pool(strava_service_pool):
+    first_service = strava_service_pool.get({'access_token': 'first'})
+    assert first_service.token['access_token'] == 'first'
+    assert strava_service_pool.get({'access_token': 'first'}) is first_service
+
+    second_service = strava_service_pool.get({'access_token': 'second'})
+    assert second_service is not first_service
+
+    # 'first' was used least recently, so it's dropped to make room for 'third'
+    strava_service_pool.get({'access_token': 'second'})
+    strava_service_pool.get({'access_token': 'third'})
+    assert len(strava_service_pool) == 2
+    assert 'first' not in strava_service_pool
+    assert 'second' in strava_service_pool
+
+    strava_service_pool.evict('second')
+    assert 'second' not in strava_service_pool
+
+
+def test_transfer_service_pool_raises_error(strava_service_pool):
+    with pytest.raises(ValueError):
+        strava_service_pool.get({})
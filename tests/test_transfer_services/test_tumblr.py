@@ -1,7 +1,8 @@
+import json
+
 import pytest
 from requests import HTTPError
 
-from pardner.exceptions import UnsupportedRequestException
 from pardner.verticals import SocialPostingVertical
 from tests.test_transfer_services.conftest import mock_oauth2_session_get
 
@@ -14,9 +15,35 @@ def test_scope_for_vertical(tumblr_transfer_service, verticals, expected_scope):
     assert tumblr_transfer_service.scope_for_verticals(verticals) == expected_scope
 
 
-def test_fetch_social_posting_vertical_raises_exception(tumblr_transfer_service):
-    with pytest.raises(UnsupportedRequestException):
-        tumblr_transfer_service.fetch_social_posting_vertical(count=21)
+def test_fetch_social_posting_vertical_pages(mocker, tumblr_transfer_service):
+    response_object = mocker.MagicMock()
+    response_object.content = json.dumps(
+        {'response': {'posts': ['post'] * 20}}
+    ).encode()
+    oauth2_session_get = mock_oauth2_session_get(mocker, response_object)
+
+    assert (
+        tumblr_transfer_service.fetch_social_posting_vertical(count=21) == ['post'] * 21
+    )
+    assert [call.kwargs['params'] for call in oauth2_session_get.call_args_list] == [
+        {'limit': 20, 'npf': True, 'type': 'text'},
+        {'limit': 20, 'npf': True, 'type': 'text', 'offset': 20},
+    ]
+
+
+def test_iter_vertical_sends_dashboard_params(mocker, tumblr_transfer_service):
+    response_object = mocker.MagicMock()
+    response_object.content = json.dumps({'response': {'posts': ['post']}}).encode()
+    oauth2_session_get = mock_oauth2_session_get(mocker, response_object)
+
+    assert tumblr_transfer_service.fetch(SocialPostingVertical, limit=1) == ['post']
+    assert list(tumblr_transfer_service.iter_vertical(SocialPostingVertical)) == [
+        'post'
+    ]
+    assert [call.kwargs['params'] for call in oauth2_session_get.call_args_list] == [
+        {'limit': 1, 'npf': True, 'type': 'text'},
+        {'limit': 20, 'npf': True, 'type': 'text'},
+    ]
 
 
 def test_fetch_social_posting_vertical_raises_http_exception(
@@ -28,7 +55,9 @@ def test_fetch_social_posting_vertical_raises_http_exception(
 
 def test_fetch_social_posting_vertical(mocker, tumblr_transfer_service):
     response_object = mocker.MagicMock()
-    response_object.json.return_value = {'response': {'posts': ['sample', 'posts']}}
+    response_object.content = json.dumps(
+        {'response': {'posts': ['sample', 'posts']}}
+    ).encode()
 
     oauth2_session_get = mock_oauth2_session_get(mocker, response_object)
 
@@ -49,17 +78,19 @@ def test_fetch_primary_blog_id_already_set(tumblr_transfer_service):
 
 def test_fetch_primary_blog_id_success(mocker, tumblr_transfer_service):
     response_object = mocker.MagicMock()
-    response_object.json.return_value = {
-        'response': {
-            'user': {
-                'blogs': [
-                    {'primary': False, 'uuid': 'secondary-blog-id'},
-                    {'primary': True, 'uuid': 'primary-blog-id', 'name': 'my-blog'},
-                    {'primary': False, 'uuid': 'another-secondary-id'},
-                ]
+    response_object.content = json.dumps(
+        {
+            'response': {
+                'user': {
+                    'blogs': [
+                        {'primary': False, 'uuid': 'secondary-blog-id'},
+                        {'primary': True, 'uuid': 'primary-blog-id', 'name': 'my-blog'},
+                        {'primary': False, 'uuid': 'another-secondary-id'},
+                    ]
+                }
             }
         }
-    }
+    ).encode()
     oauth2_session_get = mock_oauth2_session_get(mocker, response_object)
 
     assert tumblr_transfer_service.fetch_primary_blog_id() == 'primary-blog-id'
@@ -0,0 +1,69 @@
+import pytest
+
+from pardner.verticals import (
+    ConversationGroupVertical,
+    PhysicalActivityVertical,
+    VerticalCollection,
+)
+from pardner.verticals.collection import _deep_sizeof
+
+
+def activity(activity_id):
+    return PhysicalActivityVertical(
+        # built at runtime, so that equal strings are distinct objects
+        service=''.join(['Str', 'ava']),
+        service_object_id=activity_id,
+        data_owner_id=str(1000 + activity_id % 2),
+        activity_type='Run',
+        distance=1000.0 * activity_id,
+        url=f'https://www.strava.com/activities/{activity_id}',
+    )
+
+
+@pytest.fixture
+def activities():
+    return [activity(activity_id) for activity_id in range(100)]
+
+
+def test_round_trip(activities):
+    collection = VerticalCollection(PhysicalActivityVertical, activities)
+
+    assert len(collection) == 100
+    assert collection[5] == activities[5]
+    assert list(collection)[-1] == activities[-1]
+    assert collection[1:3] == activities[1:3]
+    assert collection.column('distance')[2] == 2000.0
+
+
+def test_strings_are_interned():
+    collection = VerticalCollection(
+        PhysicalActivityVertical, [activity(1), activity(2)]
+    )
+    services = collection.column('service')
+    assert services[0] is services[1]
+    assert activity(1).service is not activity(2).service
+
+
+def test_only_repeated_fields_are_interned():
+    collection = VerticalCollection(
+        PhysicalActivityVertical, [activity(1), activity(3)]
+    )
+    assert set(collection._strings) == {'Strava', 'physical_activity', '1001'}
+    assert collection.nbytes() > sum(
+        _deep_sizeof(column, set()) for column in collection._columns
+    )
+
+
+def test_bytes_per_record(activities):
+    collection = VerticalCollection(PhysicalActivityVertical, activities)
+    models_size = _deep_sizeof(activities, set())
+    assert 0 < collection.bytes_per_record() < models_size / len(activities)
+
+
+def test_rejects_other_verticals():
+    collection = VerticalCollection(ConversationGroupVertical)
+    assert collection.bytes_per_record() == 0
+    with pytest.raises(TypeError):
+        collection.append(activity(1))
+    with pytest.raises(KeyError):
+        collection.column('distance')
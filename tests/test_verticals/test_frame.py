@@ -0,0 +1,127 @@
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from pardner.verticals import (
+    ActivityFrame,
+    LazyVertical,
+    PhysicalActivityVertical,
+    VerticalCollection,
+)
+
+np = pytest.importorskip('numpy')
+
+START = datetime(2025, 1, 6, 8, tzinfo=timezone.utc)
+
+
+def activity(activity_id, activity_type, distance, max_speed=None, days=0):
+    return PhysicalActivityVertical(
+        service='Strava',
+        service_object_id=activity_id,
+        data_owner_id='1',
+        activity_type=activity_type,
+        distance=distance,
+        max_speed=max_speed,
+        start_datetime=START + timedelta(days=days) if days is not None else None,
+    )
+
+
+@pytest.fixture
+def activities():
+    return [
+        activity(1, 'Run', 5000.0, 4.0),
+        activity(2, 'Run', 10000.0, 5.0, days=1),
+        activity(3, 'Ride', 30000.0, days=8),
+        activity(4, None, None, 2.0, days=None),
+    ]
+
+
+@pytest.mark.parametrize('as_collection', [False, True])
+def test_columns_and_masks(activities, as_collection):
+    if as_collection:
+        activities = VerticalCollection(PhysicalActivityVertical, activities)
+    frame = ActivityFrame(activities)
+
+    assert len(frame) == 4
+    assert frame.mask('distance').tolist() == [True, True, True, False]
+    assert frame.mask('start_datetime').tolist() == [True, True, True, False]
+    assert frame.column('start_datetime')[0] == np.datetime64('2025-01-06T08:00')
+
+
+def test_reads_only_the_columns(activities):
+    def lazy_activity(activity):
+        return LazyVertical(
+            PhysicalActivityVertical,
+            activity.model_dump(),
+            {
+                field_name: lambda raw_data, field_name=field_name: raw_data[field_name]
+                for field_name in (
+                    *ActivityFrame.FLOAT_FIELDS,
+                    *ActivityFrame.DATETIME_FIELDS,
+                    'activity_type',
+                )
+            },
+            lambda: pytest.fail('materialized'),
+        )
+
+    frame = ActivityFrame(map(lazy_activity, activities))
+
+    assert frame.column('distance').tolist()[:3] == [5000.0, 10000.0, 30000.0]
+    assert frame.mask('start_datetime').tolist() == [True, True, True, False]
+    assert frame.activity_types.tolist() == ['Run', 'Run', 'Ride', '']
+
+
+def test_empty_frame():
+    frame = ActivityFrame([])
+
+    assert len(frame) == 0
+    assert frame.mean('distance') is None
+    assert frame.column('start_datetime').dtype == np.dtype('datetime64[us]')
+
+
+def test_reductions(activities):
+    frame = ActivityFrame(activities)
+
+    assert frame.mean('max_speed') == pytest.approx(11 / 3)
+    assert frame.mean('kilocalories') is None
+    assert frame.percentile('distance', 50) == 10000.0
+    assert frame.percentile('distance', [0, 100]).tolist() == [5000.0, 30000.0]
+    assert np.isnan(frame.percentile('kilocalories', 50))
+
+
+def test_group_by_activity_type(activities):
+    frame = ActivityFrame(activities)
+
+    assert frame.group_by_activity_type('distance', 'sum') == {
+        '': 0.0,
+        'Ride': 30000.0,
+        'Run': 15000.0,
+    }
+    assert frame.group_by_activity_type('max_speed', 'count') == {
+        '': 1.0,
+        'Ride': 0.0,
+        'Run': 2.0,
+    }
+    assert frame.group_by_activity_type('max_speed')['Run'] == 4.5
+    with pytest.raises(ValueError):
+        frame.group_by_activity_type('distance', 'median')
+
+
+def test_totals_by_period(activities):
+    weeks, totals = ActivityFrame(activities).totals_by_period('distance', 'W')
+
+    assert weeks.tolist() == [date(2025, 1, 6), date(2025, 1, 13)]
+    assert totals.tolist() == [15000.0, 30000.0]
+
+
+def test_weeks_start_on_monday():
+    # a Sunday, Monday and Wednesday: two ISO weeks, but one NumPy week
+    week_activities = [
+        activity(1, 'Run', 1000.0, days=-1),
+        activity(2, 'Run', 2000.0),
+        activity(3, 'Run', 4000.0, days=2),
+    ]
+    weeks, totals = ActivityFrame(week_activities).totals_by_period('distance', 'W')
+
+    assert weeks.tolist() == [date(2024, 12, 30), date(2025, 1, 6)]
+    assert totals.tolist() == [1000.0, 6000.0]
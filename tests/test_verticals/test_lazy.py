@@ -0,0 +1,95 @@
+import datetime
+import json
+
+import pytest
+
+from pardner.services import StravaTransferService
+from pardner.verticals import LazyVertical, PhysicalActivityVertical
+from tests.test_transfer_services.conftest import mock_oauth2_session_get
+
+RAW_ACTIVITY = {
+    'id': 154504250376823,
+    'athlete': {'id': 134815},
+    'name': 'Happy Friday',
+    'distance': 24931.4,
+    'max_speed': 11.0,
+    'start_date': '2018-05-02T12:15:09Z',
+    'elapsed_time': 4500,
+    'start_latlng': [37.83, -122.26],
+}
+
+
+@pytest.fixture
+def strava_transfer_service():
+    return StravaTransferService(
+        'fake_client_id', 'fake_client_secret', 'https://redirect_uri'
+    )
+
+
+def test_lazy_vertical_reads_mapped_fields_without_parsing(
+    mocker, strava_transfer_service
+):
+    parse = mocker.spy(strava_transfer_service, 'parse_physical_activity_vertical')
+    activity = strava_transfer_service._parse_raw_item_lazily(
+        PhysicalActivityVertical, RAW_ACTIVITY
+    )
+
+    assert isinstance(activity, LazyVertical)
+    assert activity.max_speed == 11.0
+    assert activity.distance == 24931.4
+    assert activity.start_latitude == 37.83
+    assert activity.service_object_id == '154504250376823'
+    assert activity.service == 'Strava'
+    assert activity.vertical_name == 'physical_activity'
+    assert activity.start_datetime == datetime.datetime(2018, 5, 2, 12, 15, 9)
+    assert activity.end_datetime == datetime.datetime(2018, 5, 2, 13, 30, 9)
+    parse.assert_not_called()
+
+
+def test_lazy_vertical_fields_match_materialized_fields(strava_transfer_service):
+    activity = strava_transfer_service._parse_raw_item_lazily(
+        PhysicalActivityVertical, RAW_ACTIVITY
+    )
+    lazy_fields = {
+        field_name: getattr(activity, field_name)
+        for field_name in ('url', 'start_datetime', 'end_datetime', 'created_at')
+    }
+    materialized = activity.materialize()
+
+    for field_name, value in lazy_fields.items():
+        assert value == getattr(materialized, field_name)
+        assert type(value) is type(getattr(materialized, field_name))
+
+
+def test_lazy_vertical_materializes_derived_fields(mocker, strava_transfer_service):
+    parse = mocker.spy(strava_transfer_service, 'parse_physical_activity_vertical')
+    activity = strava_transfer_service._parse_raw_item_lazily(
+        PhysicalActivityVertical, RAW_ACTIVITY
+    )
+
+    assert activity.associated_media == []
+    assert activity.materialize() is activity.materialize()
+    assert activity.materialize().max_speed == activity.max_speed
+    parse.assert_called_once_with(RAW_ACTIVITY)
+
+
+def test_lazy_vertical_raises_exception(strava_transfer_service):
+    activity = strava_transfer_service._parse_raw_item_lazily(
+        PhysicalActivityVertical, RAW_ACTIVITY
+    )
+    with pytest.raises(AttributeError):
+        activity.not_a_field
+
+
+def test_iter_vertical_lazy(mocker, strava_transfer_service):
+    response_object = mocker.MagicMock()
+    response_object.content = json.dumps([RAW_ACTIVITY] * 3).encode()
+    mock_oauth2_session_get(mocker, response_object)
+
+    activities = list(
+        strava_transfer_service.iter_vertical(PhysicalActivityVertical, lazy=True)
+    )
+
+    assert len(activities) == 3
+    assert all(isinstance(activity, LazyVertical) for activity in activities)
+    assert isinstance(activities[0].materialize(), PhysicalActivityVertical)